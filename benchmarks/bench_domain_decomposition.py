@@ -0,0 +1,64 @@
+"""Strong-scaling benchmark for the domain-decomposed 2D solve.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_domain_decomposition.py --nx 1000 --ny 500 --workers 1 2 4 8 16
+
+Reports the time of a full solve (local factorizations + Schwarz-PCG) per
+worker count, the speedup over one worker, and the direct-solve baseline.
+"""
+import argparse
+import time
+
+import numpy as np
+
+from fglopt.fea.assembler import StiffnessAssembler
+from fglopt.fea.domain_decomposition import DomainDecompositionSolver
+from fglopt.fea.element import Q4Element
+from fglopt.fea.solver import FEASolver
+from fglopt.mesh.domain_mesh import DomainMesh
+
+
+def _cantilever(nx: int, ny: int):
+    mesh = DomainMesh(nx=nx, ny=ny, lx=2.0, ly=1.0)
+    ke = Q4Element(E=1.0, nu=0.3).stiffness_matrix(*mesh.element_size)
+    K = StiffnessAssembler(mesh, ke).assemble()
+    left = np.flatnonzero(np.isclose(mesh.node_coords[:, 0], 0.0))
+    fixed = np.sort(np.concatenate([2 * left, 2 * left + 1]))
+    F = np.zeros(mesh.n_dofs)
+    F[2 * (mesh.n_nodes - 1) + 1] = -1.0
+    return mesh, K, F, fixed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nx", type=int, default=800)
+    parser.add_argument("--ny", type=int, default=400)
+    parser.add_argument("--parts", type=int, nargs=2, default=(4, 4))
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--direct", action="store_true", help="also time the direct solve")
+    args = parser.parse_args()
+
+    mesh, K, F, fixed = _cantilever(args.nx, args.ny)
+    print(f"{mesh.n_dofs} DOFs, {args.parts[0]} x {args.parts[1]} subdomains")
+
+    if args.direct:
+        start = time.perf_counter()
+        FEASolver("direct").solve(K, F, fixed)
+        print(f"direct: {time.perf_counter() - start:.2f} s")
+
+    baseline = None
+    for n_workers in args.workers:
+        with DomainDecompositionSolver(mesh, tuple(args.parts), n_workers=n_workers) as solver:
+            solver.solve(K, F, fixed)  # warm-up: start workers and shared memory
+            start = time.perf_counter()
+            solver.solve(K, F, fixed)
+            elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(
+            f"workers={n_workers:3d}  {elapsed:7.2f} s  speedup {baseline / elapsed:5.2f}x  "
+            f"iterations {solver.last_info['iterations']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
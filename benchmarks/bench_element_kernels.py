@@ -0,0 +1,74 @@
+"""Benchmark of the per-iteration element kernels on a large 2D mesh.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_element_kernels.py --nx 1000 --ny 1000 --threads 1 2 4 8
+
+Times strain energy / sensitivities and the scaled assembly data of one
+SIMP iteration, comparing a plain vectorized single-threaded einsum with
+`ElementKernels` at each thread count, and reports the speedup.
+"""
+import argparse
+import time
+
+import numpy as np
+
+from fglopt.fea.assembler import element_dofs
+from fglopt.fea.element import Q4Element
+from fglopt.fea.kernels import ElementKernels
+from fglopt.mesh.domain_mesh import DomainMesh
+
+
+def _best_of(repeats, fn):
+    best = np.inf
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nx", type=int, default=1000)
+    parser.add_argument("--ny", type=int, default=1000)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    mesh = DomainMesh(nx=args.nx, ny=args.ny)
+    ke = Q4Element(E=1.0, nu=0.3).stiffness_matrix(*mesh.element_size)
+    edofs = element_dofs(mesh)
+    rng = np.random.default_rng(0)
+    u = rng.standard_normal(mesh.n_dofs)
+    scale = rng.uniform(0.01, 1.0, mesh.n_elements)
+    print(f"{mesh.n_elements} elements, {mesh.n_dofs} DOFs")
+
+    def baseline():
+        ue = u[edofs]
+        energy = np.einsum("ei,ij,ej->e", ue, ke, ue)
+        np.multiply(-scale, energy)
+        np.multiply(scale[:, None], ke.ravel()[None, :])
+
+    reference = _best_of(args.repeats, baseline)
+    print(f"  vectorized einsum:  {reference:.3f} s")
+
+    energy = np.empty(mesh.n_elements)
+    sensitivity = np.empty(mesh.n_elements)
+    data = np.empty((mesh.n_elements, ke.size))
+    for n_threads in args.threads:
+        kernels = ElementKernels(edofs, ke, n_threads=n_threads)
+
+        def iteration():
+            kernels.compliance_sensitivity(u, scale, out=sensitivity, energy=energy)
+            kernels.scaled_data(scale, out=data)
+
+        elapsed = _best_of(args.repeats, iteration)
+        kernels.close()
+        print(
+            f"  {n_threads:2d} thread(s):       {elapsed:.3f} s  "
+            f"(speedup {reference / elapsed:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Benchmark of full-field stress recovery on a large 2D mesh.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_postprocessing.py --nx 1000 --ny 1000 --threads 1 4
+
+Times `StressRecovery.evaluate` (von Mises stress at the Gauss points,
+strain energy density and displacement magnitude for every element) for a
+random displacement field at each thread count.
+"""
+import argparse
+import time
+
+import numpy as np
+
+from fglopt.fea.element import Q4Element
+from fglopt.fea.postprocessing import StressRecovery
+from fglopt.mesh.domain_mesh import DomainMesh
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nx", type=int, default=1000)
+    parser.add_argument("--ny", type=int, default=1000)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 4])
+    parser.add_argument("--block-size", type=int, default=65536)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    mesh = DomainMesh(nx=args.nx, ny=args.ny)
+    element = Q4Element(E=1.0, nu=0.3)
+    u = np.random.default_rng(0).standard_normal(mesh.n_dofs)
+    scale = np.random.default_rng(1).uniform(1e-3, 1.0, mesh.n_elements)
+    print(f"{mesh.n_elements} elements, block size {args.block_size}")
+
+    for n_threads in args.threads:
+        recovery = StressRecovery(mesh, element, n_threads=n_threads, block_size=args.block_size)
+        try:
+            best = np.inf
+            for _ in range(args.repeats):
+                start = time.perf_counter()
+                recovery.evaluate(u, scale)
+                best = min(best, time.perf_counter() - start)
+        finally:
+            recovery.close()
+        print(f"  threads {n_threads:2d}: {best:.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Peak memory and time of a cantilever solve per precision mode.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bench_precision.py --nx 800 --ny 400 --solver direct
+
+Each precision runs in a fresh subprocess so peak RSS (ru_maxrss) is
+measured independently. Reports solve time, peak RSS and the relative
+compliance difference to the double-precision run.
+"""
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import time
+
+import numpy as np
+
+from fglopt.fea.assembler import MatrixFreeStiffness, StiffnessAssembler
+from fglopt.fea.element import Q4Element
+from fglopt.fea.precision import PRECISIONS, get_precision
+from fglopt.fea.solver import FEASolver, compute_compliance
+from fglopt.mesh.domain_mesh import DomainMesh
+
+
+def run_one(nx: int, ny: int, solver: str, name: str) -> dict:
+    precision = get_precision(name)
+    mesh = DomainMesh(nx=nx, ny=ny, lx=2.0, ly=1.0, dtype=precision.storage)
+    ke = Q4Element(E=1.0, nu=0.3).stiffness_matrix(*mesh.element_size)
+    # A graded, SIMP-like stiffness field.
+    density = np.random.default_rng(0).uniform(0.2, 1.0, mesh.n_elements).astype(precision.storage)
+    scale = 1e-9 + density.astype(np.float64) ** 3
+
+    left = np.flatnonzero(np.isclose(mesh.node_coords[:, 0], 0.0))
+    fixed = np.sort(np.concatenate([2 * left, 2 * left + 1]))
+    F = np.zeros(mesh.n_dofs, dtype=precision.solve)
+    F[2 * (mesh.n_nodes - 1) + 1] = -1.0
+
+    start = time.perf_counter()
+    if solver == "matrix-free":
+        K = MatrixFreeStiffness(mesh, ke, scale, dtype=precision.solve)
+        fea = FEASolver("cg", precision=precision)
+    else:
+        K = StiffnessAssembler(mesh, ke, dtype=precision.solve).assemble(scale)
+        fea = FEASolver(solver, precision=precision)
+    u = fea.solve(K, F, fixed)
+    seconds = time.perf_counter() - start
+
+    return {
+        "precision": name,
+        "seconds": seconds,
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0,
+        "compliance": compute_compliance(F, u),
+        "info": fea.last_info,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nx", type=int, default=800)
+    parser.add_argument("--ny", type=int, default=400)
+    parser.add_argument("--solver", choices=["direct", "cg", "matrix-free"], default="direct")
+    parser.add_argument("--precisions", nargs="+", default=list(PRECISIONS))
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_one(args.nx, args.ny, args.solver, args.child)))
+        return
+
+    print(f"{args.nx} x {args.ny} cantilever, {args.solver} solver")
+    results = {}
+    for name in args.precisions:
+        out = subprocess.run(
+            [sys.executable, __file__, "--nx", str(args.nx), "--ny", str(args.ny),
+             "--solver", args.solver, "--child", name],
+            check=True, capture_output=True, text=True,
+        ).stdout
+        results[name] = json.loads(out.strip().splitlines()[-1])
+
+    reference = results.get("double", {}).get("compliance")
+    for name, r in results.items():
+        error = "" if reference is None else f"  rel. compliance diff {abs(r['compliance'] - reference) / abs(reference):.1e}"
+        print(
+            f"  {name:6s}: {r['seconds']:7.2f} s  peak RSS {r['peak_rss_mb']:8.1f} MB{error}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+"""Fit the resource planner's cost model on this machine.
+
+Usage:
+    PYTHONPATH=src python benchmarks/calibrate_planner.py artifacts/planner.json
+
+Point the `planner_calibration` config key at the written JSON file so
+`plan` and the memory-budget check use the local coefficients.
+"""
+import argparse
+
+from fglopt.fea.planner import calibrate
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("output", help="JSON file to write")
+    parser.add_argument("--quick", action="store_true", help="use smaller (less accurate) sizes")
+    args = parser.parse_args()
+
+    kwargs = {}
+    if args.quick:
+        kwargs = {
+            "sizes_2d": ((50, 25), (100, 50), (200, 100)),
+            "sizes_3d": ((8, 8, 8), (12, 12, 12), (16, 16, 16)),
+        }
+    calibration = calibrate(progress=lambda shape: print(f"  timing {shape}"), **kwargs)
+    path = calibration.save(args.output)
+    print(f"Saved planner calibration to {path.as_posix()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import copy
+
+import numpy as np
+import scipy.sparse as sp
+
+
+def element_dofs(mesh) -> np.ndarray:
+    """Return the (n_elems, nodes_per_elem * dofs_per_node) global DOF table.
+
+    Uses the interleaved convention `dof = dofs_per_node * node_id + axis`,
+    so row e lists the DOFs of element e in the element's local DOF order.
+    Indices are int32, which covers well over 100^3 hexahedral elements.
+    """
+    if mesh.element_nodes is None:
+        raise RuntimeError("Mesh elements not generated.")
+
+    dpn = mesh.dofs_per_node
+    nodes = mesh.element_nodes.astype(np.int32, copy=False)
+    dofs = dpn * nodes[:, :, None] + np.arange(dpn, dtype=np.int32)
+    return dofs.reshape(nodes.shape[0], -1)
+
+
+def local_to_global_dofs(mesh, elem_id: int) -> np.ndarray:
+    """Return the global DOF indices of a single element."""
+    dpn = mesh.dofs_per_node
+    nodes = np.asarray(mesh.get_element_nodes(elem_id), dtype=np.int32)
+    return (dpn * nodes[:, None] + np.arange(dpn, dtype=np.int32)).ravel()
+
+
+class StiffnessAssembler:
+    """Assemble K = sum_e s_e * K_e for a structured mesh with a shared K_e.
+
+    The CSR sparsity pattern and the map from element entries to CSR slots
+    are computed once at construction. Every later `assemble` call is a
+    single weighted `np.bincount` into the cached pattern, which is what a
+    SIMP loop needs since only the per-element scale changes.
+
+    Indices are stored as int32; `dtype` controls the stored matrix values.
+    Memory of the cached map is 4 * n_elems * n_dofs_per_elem**2 bytes, so
+    large 3D meshes should use `MatrixFreeStiffness` instead.
+    """
+
+    def __init__(self, mesh, ke: np.ndarray, dtype=np.float64):
+        """
+        Args:
+            mesh: `DomainMesh` or `DomainMesh3D`.
+            ke: element stiffness matrix matching the mesh element type.
+            dtype: value dtype of assembled matrices (float64 or float32).
+        """
+        self.dtype = np.dtype(dtype)
+        self.n_dofs = mesh.n_dofs
+        self.edofs = element_dofs(mesh)
+        self.ke = np.asarray(ke, dtype=self.dtype)
+
+        n_elems, ndpe = self.edofs.shape
+        if self.ke.shape != (ndpe, ndpe):
+            raise ValueError(
+                f"Element matrix shape {self.ke.shape} does not match "
+                f"{ndpe} DOFs per element."
+            )
+
+        rows = np.repeat(self.edofs, ndpe, axis=1).astype(np.int64)
+        cols = np.tile(self.edofs, (1, ndpe))
+        keys = rows * self.n_dofs + cols
+        del rows, cols
+
+        unique_keys, entry_map = np.unique(keys.ravel(), return_inverse=True)
+        del keys
+        if unique_keys.shape[0] > np.iinfo(np.int32).max:
+            raise ValueError(
+                "Stiffness pattern exceeds int32 indexing; use MatrixFreeStiffness."
+            )
+
+        self._entry_map = entry_map.astype(np.int32).reshape(n_elems, ndpe * ndpe)
+        self.indices = (unique_keys % self.n_dofs).astype(np.int32)
+        row_counts = np.bincount(unique_keys // self.n_dofs, minlength=self.n_dofs)
+        self.indptr = np.zeros(self.n_dofs + 1, dtype=np.int32)
+        np.cumsum(row_counts, out=self.indptr[1:])
+        self._weights: np.ndarray | None = None
+
+    @property
+    def nnz(self) -> int:
+        return int(self.indices.shape[0])
+
+    def assemble(self, scale: np.ndarray | None = None, kernels=None) -> sp.csr_matrix:
+        """Return the global stiffness matrix for per-element scale factors.
+
+        Args:
+            scale: optional (n_elems,) multipliers, e.g. SIMP-interpolated
+                moduli relative to the solid. Defaults to all ones.
+            kernels: optional `ElementKernels`; when given, the scaled element
+                entries are computed by its thread pool into a buffer that is
+                reused across calls.
+        """
+        ke_flat = self.ke.ravel()
+        if scale is None:
+            weights = np.broadcast_to(ke_flat, self._entry_map.shape)
+        else:
+            scale = np.asarray(scale)
+            if scale.shape != (self._entry_map.shape[0],):
+                raise ValueError(
+                    f"Expected {self._entry_map.shape[0]} element scales, "
+                    f"got shape {scale.shape}."
+                )
+            if kernels is not None:
+                if self._weights is None:
+                    self._weights = np.empty(self._entry_map.shape)
+                weights = kernels.scaled_data(scale, out=self._weights)
+            else:
+                weights = scale[:, None] * ke_flat[None, :]
+
+        data = np.bincount(
+            self._entry_map.ravel(), weights=weights.ravel(), minlength=self.nnz
+        ).astype(self.dtype, copy=False)
+
+        return sp.csr_matrix(
+            (data, self.indices, self.indptr), shape=(self.n_dofs, self.n_dofs)
+        )
+
+
+def assemble_global_stiffness(mesh, element, scale=None, dtype=np.float64):
+    """Assemble the global stiffness matrix for a mesh and element type.
+
+    Convenience wrapper for one-off assembly; reuse a `StiffnessAssembler`
+    when assembling repeatedly on the same mesh.
+    """
+    ke = element.stiffness_matrix(*mesh.element_size)
+    return StiffnessAssembler(mesh, ke, dtype=dtype).assemble(scale)
+
+
+def _scatter_add(out: np.ndarray, dofs: np.ndarray, values: np.ndarray) -> None:
+    """Accumulate `values` into `out[dofs]`, summing repeated indices.
+
+    Structured element numbering keeps a chunk's DOFs within a narrow band,
+    so the bincount only spans [min, max] of the chunk instead of all DOFs.
+    """
+    lo = int(dofs.min())
+    hi = int(dofs.max()) + 1
+    out[lo:hi] += np.bincount(
+        (dofs - lo).ravel(), weights=values.ravel(), minlength=hi - lo
+    )
+
+
+class MatrixFreeStiffness:
+    """Apply K = sum_e s_e * K_e without assembling a global matrix.
+
+    Products are evaluated element-by-element over chunks of
+    `chunk_size` elements: gather u_e, multiply by the shared K_e, scale,
+    and scatter-add with `np.bincount`. Working memory is bounded by the
+    chunk size, so only the int32 DOF table and a few DOF-sized vectors
+    scale with the mesh.
+    """
+
+    def __init__(
+        self,
+        mesh,
+        ke: np.ndarray,
+        scale: np.ndarray | None = None,
+        dtype=np.float64,
+        chunk_size: int = 65536,
+    ):
+        """
+        Args:
+            mesh: `DomainMesh` or `DomainMesh3D`.
+            ke: element stiffness matrix matching the mesh element type.
+            scale: optional (n_elems,) element multipliers.
+            dtype: dtype used for element-level products.
+            chunk_size: number of elements processed per block.
+        """
+        self.dtype = np.dtype(dtype)
+        self.n_dofs = mesh.n_dofs
+        self.edofs = element_dofs(mesh)
+        self.ke = np.asarray(ke, dtype=self.dtype)
+        self.chunk_size = int(chunk_size)
+        self.shape = (self.n_dofs, self.n_dofs)
+        self.scale = None
+        self.set_scale(scale)
+
+    def set_scale(self, scale: np.ndarray | None) -> None:
+        """Replace the per-element multipliers (None means all ones)."""
+        if scale is not None:
+            scale = np.asarray(scale, dtype=self.dtype)
+            if scale.shape != (self.edofs.shape[0],):
+                raise ValueError(
+                    f"Expected {self.edofs.shape[0]} element scales, "
+                    f"got shape {scale.shape}."
+                )
+        self.scale = scale
+
+    def astype(self, dtype) -> "MatrixFreeStiffness":
+        """Return an operator with products in `dtype` sharing the DOF table."""
+        dtype = np.dtype(dtype)
+        if dtype == self.dtype:
+            return self
+        other = copy.copy(self)
+        other.dtype = dtype
+        other.ke = self.ke.astype(dtype)
+        other.scale = None if self.scale is None else self.scale.astype(dtype)
+        return other
+
+    def _chunks(self):
+        n_elems = self.edofs.shape[0]
+        for start in range(0, n_elems, self.chunk_size):
+            yield slice(start, min(start + self.chunk_size, n_elems))
+
+    def matvec(self, u: np.ndarray) -> np.ndarray:
+        """Return K @ u as a float64 vector."""
+        u = np.asarray(u, dtype=self.dtype)
+        out = np.zeros(self.n_dofs)
+        for block in self._chunks():
+            dofs = self.edofs[block]
+            fe = u[dofs] @ self.ke
+            if self.scale is not None:
+                fe *= self.scale[block, None]
+            _scatter_add(out, dofs, fe)
+        return out
+
+    def __matmul__(self, u: np.ndarray) -> np.ndarray:
+        return self.matvec(u)
+
+    def diagonal(self) -> np.ndarray:
+        """Return diag(K), e.g. for a Jacobi preconditioner."""
+        ke_diag = np.diag(self.ke).astype(np.float64)
+        out = np.zeros(self.n_dofs)
+        for block in self._chunks():
+            dofs = self.edofs[block]
+            de = np.broadcast_to(ke_diag, dofs.shape)
+            if self.scale is not None:
+                de = de * self.scale[block, None]
+            _scatter_add(out, dofs, de)
+        return out
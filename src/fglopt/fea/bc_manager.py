@@ -17,10 +17,22 @@ class BCManager:
     Global DOF convention used throughout the project plan:
     - dof_x(node_id) = 2 * node_id
     - dof_y(node_id) = 2 * node_id + 1
+
+    3D meshes (`DomainMesh3D`) use 3 DOFs per node with the same interleaved
+    layout (dof_z(node_id) = 3 * node_id + 2) and face selectors instead of
+    edge selectors.
     """
 
     _EDGE_SELECTORS = {"left_edge", "right_edge", "top_edge", "bottom_edge"}
-    _DOF_INDEX = {"x": 0, "y": 1}
+    _FACE_SELECTORS = {
+        "left_face",
+        "right_face",
+        "bottom_face",
+        "top_face",
+        "front_face",
+        "back_face",
+    }
+    _DOF_INDEX = {"x": 0, "y": 1, "z": 2}
 
     def __init__(self, config: ConfigLoader):
         """Cache BC data from config for repeated mesh-based evaluation.
@@ -39,25 +51,28 @@ class BCManager:
         Each fixed entry can target nodes via:
         - explicit `nodes: [...]`, or
         - geometric `selector: left_edge|right_edge|top_edge|bottom_edge`
+          (2D) or `left_face|right_face|bottom_face|top_face|front_face|back_face`
+          (3D)
 
-        Then each requested dof (`x`, `y`) is converted to global DOF IDs using
-        the 2-DOF-per-node mapping.
+        Then each requested dof (`x`, `y`, and `z` in 3D) is converted to global
+        DOF IDs using the mesh's DOFs-per-node mapping.
         """
         constrained: list[int] = []
+        dpn = self._dofs_per_node(mesh)
 
         for entry in self._fixed:
             nodes = self._resolve_nodes(mesh, entry)
             dofs = entry.get("dofs", [])
             for dof in dofs:
-                axis = self._normalize_dof(dof)
+                axis = self._normalize_dof(dof, mesh)
                 base = self._DOF_INDEX[axis]
-                constrained.extend([(2 * int(node)) + base for node in nodes])
+                constrained.extend([(dpn * int(node)) + base for node in nodes])
 
         if not constrained:
             return np.array([], dtype=int)
         return np.array(sorted(set(constrained)), dtype=int)
 
-    def build_force_vector(self, mesh) -> np.ndarray:
+    def build_force_vector(self, mesh, dtype=np.float64) -> np.ndarray:
         """Build the global force vector F using configured nodal and edge loads.
 
         Load behavior:
@@ -68,12 +83,19 @@ class BCManager:
         Sign convention:
         - positive x: right
         - positive y: upward
+        - positive z: toward the back face (z = lz)
+
+        In 3D, `edge` loads accept face selectors and distribute the total
+        uniformly over the face nodes in the same way.
+
+        `dtype` sets the vector precision (float32 for single-precision runs).
         """
-        force = np.zeros(mesh.n_nodes * 2, dtype=float)
+        dpn = self._dofs_per_node(mesh)
+        force = np.zeros(mesh.n_nodes * dpn, dtype=dtype)
 
         for load in self._loads:
             load_type = load.get("type", "point")
-            direction = self._normalize_dof(load.get("direction"))
+            direction = self._normalize_dof(load.get("direction"), mesh)
             dof_offset = self._DOF_INDEX[direction]
             magnitude = float(load.get("magnitude", 0.0))
             nodes = self._resolve_nodes(mesh, load)
@@ -85,7 +107,7 @@ class BCManager:
                 # If multiple nodes are selected for a point load definition,
                 # each node receives the full specified magnitude.
                 for node in nodes:
-                    force[(2 * int(node)) + dof_offset] += magnitude
+                    force[(dpn * int(node)) + dof_offset] += magnitude
             elif load_type == "edge":
                 # Edge load convention for Phase 1:
                 # - `magnitude` is interpreted as the TOTAL force on the selected edge.
@@ -93,7 +115,7 @@ class BCManager:
                 #   sum exactly equals the requested edge load magnitude.
                 nodal_force = magnitude / len(nodes)
                 for node in nodes:
-                    force[(2 * int(node)) + dof_offset] += nodal_force
+                    force[(dpn * int(node)) + dof_offset] += nodal_force
             else:
                 raise ValueError(f"Unsupported load type: {load_type}")
 
@@ -103,14 +125,16 @@ class BCManager:
         """Resolve a BC/load entry into node IDs.
 
         Priority is explicit node list (`nodes`) when provided; otherwise,
-        edge selector lookup is used.
+        edge (2D) or face (3D) selector lookup is used.
         """
         if "nodes" in entry:
             return self._normalize_node_list(entry["nodes"], mesh.n_nodes)
 
         selector = entry.get("selector")
-        if selector in self._EDGE_SELECTORS:
+        if selector in self._EDGE_SELECTORS and self._dofs_per_node(mesh) == 2:
             return self._select_edge_nodes(mesh, selector)
+        if selector in self._FACE_SELECTORS and self._dofs_per_node(mesh) == 3:
+            return self._select_face_nodes(mesh, selector)
 
         raise ValueError(f"Unsupported selector: {selector}")
 
@@ -149,11 +173,49 @@ class BCManager:
 
         return np.flatnonzero(mask).astype(int).tolist()
 
-    def _normalize_dof(self, dof: str) -> str:
-        """Validate and normalize direction/dof tokens to lowercase x/y."""
+    def _select_face_nodes(self, mesh, selector: str) -> list[int]:
+        """Select nodes lying on the requested face of a 3D domain.
+
+        left/right are x = 0 / lx, bottom/top are y = 0 / ly and
+        front/back are z = 0 / lz.
+        """
+        coords = mesh.node_coords
+        if coords is None:
+            raise RuntimeError("Mesh nodes not generated.")
+
+        if selector == "left_face":
+            mask = np.isclose(coords[:, 0], 0.0)
+        elif selector == "right_face":
+            mask = np.isclose(coords[:, 0], mesh.lx)
+        elif selector == "bottom_face":
+            mask = np.isclose(coords[:, 1], 0.0)
+        elif selector == "top_face":
+            mask = np.isclose(coords[:, 1], mesh.ly)
+        elif selector == "front_face":
+            mask = np.isclose(coords[:, 2], 0.0)
+        elif selector == "back_face":
+            mask = np.isclose(coords[:, 2], mesh.lz)
+        else:
+            raise ValueError(f"Unsupported selector: {selector}")
+
+        return np.flatnonzero(mask).astype(int).tolist()
+
+    @staticmethod
+    def _dofs_per_node(mesh) -> int:
+        """Return 2 for 2D meshes and 3 for `DomainMesh3D`."""
+        return getattr(mesh, "dofs_per_node", 2)
+
+    def _normalize_dof(self, dof: str, mesh=None) -> str:
+        """Validate and normalize direction/dof tokens to lowercase x/y/z.
+
+        `z` is only accepted when a 3D mesh is given.
+        """
         if not isinstance(dof, str):
             raise ValueError(f"Invalid dof/direction value: {dof}")
         normalized = dof.lower()
         if normalized not in self._DOF_INDEX:
             raise ValueError(f"Unsupported dof/direction: {dof}")
+        dpn = 2 if mesh is None else self._dofs_per_node(mesh)
+        if self._DOF_INDEX[normalized] >= dpn:
+            raise ValueError(f"Unsupported dof/direction for a {dpn}D mesh: {dof}")
         return normalized
@@ -0,0 +1,349 @@
+from __future__ import annotations
+
+import multiprocessing as mp
+import os
+from multiprocessing import shared_memory
+
+import numpy as np
+import scipy.sparse as sp
+import scipy.sparse.linalg as spla
+
+
+# Workers are spawned, not forked: solves run on console job threads, and
+# forking a multi-threaded process can deadlock in the child.
+_MP = mp.get_context("spawn")
+
+
+def partition_structured_mesh(mesh, parts: tuple[int, int], overlap: int = 1) -> list[np.ndarray]:
+    """Split a 2D `DomainMesh` into overlapping rectangular node blocks.
+
+    Element columns and rows are split into `parts = (px, py)` nearly equal
+    ranges, each grown by `overlap` element layers on every interior side.
+
+    Returns:
+        One sorted node-index array per subdomain, ordered row-major.
+    """
+    px, py = parts
+    if px < 1 or py < 1 or px > mesh.nx or py > mesh.ny:
+        raise ValueError(f"Invalid subdomain split {parts} for a {mesh.nx} x {mesh.ny} mesh.")
+
+    x_cuts = np.linspace(0, mesh.nx, px + 1).round().astype(int)
+    y_cuts = np.linspace(0, mesh.ny, py + 1).round().astype(int)
+    npx = mesh.nx + 1
+
+    blocks = []
+    for j in range(py):
+        y0 = max(y_cuts[j] - overlap, 0)
+        y1 = min(y_cuts[j + 1] + overlap, mesh.ny)
+        for i in range(px):
+            x0 = max(x_cuts[i] - overlap, 0)
+            x1 = min(x_cuts[i + 1] + overlap, mesh.nx)
+            iy, ix = np.meshgrid(np.arange(y0, y1 + 1), np.arange(x0, x1 + 1), indexing="ij")
+            blocks.append((iy * npx + ix).ravel())
+    return blocks
+
+
+def coarse_prolongation(mesh, coarse_shape: tuple[int, int]) -> sp.csr_matrix:
+    """Bilinear prolongation from a coarse (cx, cy) Q4 grid to mesh DOFs."""
+    cx, cy = coarse_shape
+    x = mesh.node_coords[:, 0] / mesh.lx * cx
+    y = mesh.node_coords[:, 1] / mesh.ly * cy
+    i = np.minimum(np.floor(x).astype(int), cx - 1)
+    j = np.minimum(np.floor(y).astype(int), cy - 1)
+    fx = x - i
+    fy = y - j
+
+    rows, cols, vals = [], [], []
+    for di, dj, w in (
+        (0, 0, (1 - fx) * (1 - fy)),
+        (1, 0, fx * (1 - fy)),
+        (1, 1, fx * fy),
+        (0, 1, (1 - fx) * fy),
+    ):
+        coarse_node = (j + dj) * (cx + 1) + (i + di)
+        for axis in range(2):
+            rows.append(2 * np.arange(mesh.n_nodes) + axis)
+            cols.append(2 * coarse_node + axis)
+            vals.append(w)
+
+    n_coarse = 2 * (cx + 1) * (cy + 1)
+    P = sp.coo_matrix(
+        (np.concatenate(vals), (np.concatenate(rows), np.concatenate(cols))),
+        shape=(mesh.n_dofs, n_coarse),
+    ).tocsr()
+    P.eliminate_zeros()
+    return P
+
+
+class _SharedArray:
+    """NumPy array backed by a named shared-memory block."""
+
+    def __init__(self, shape, dtype, name: str | None = None):
+        dtype = np.dtype(dtype)
+        nbytes = max(int(np.prod(shape)) * dtype.itemsize, 1)
+        if name is None:
+            self.shm = shared_memory.SharedMemory(create=True, size=nbytes)
+            self.owner = True
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+            self.owner = False
+        self.array = np.ndarray(shape, dtype=dtype, buffer=self.shm.buf)
+        self.spec = (self.shm.name, tuple(shape), dtype.str)
+
+    @classmethod
+    def attach(cls, spec) -> "_SharedArray":
+        name, shape, dtype = spec
+        return cls(shape, dtype, name=name)
+
+    @classmethod
+    def from_array(cls, values: np.ndarray) -> "_SharedArray":
+        shared = cls(values.shape, values.dtype)
+        shared.array[...] = values
+        return shared
+
+    def close(self) -> None:
+        self.array = None
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+def _worker_main(conn, specs: dict, subdomains: list[int]) -> None:
+    """Own a set of subdomains: slice, factorize and solve on request.
+
+    The global K_ff, the residual and the per-subdomain output slots all
+    live in shared memory; only short commands cross the pipe. A failing
+    command replies ("error", repr(exc)) and stops the worker.
+    """
+    shared = {key: _SharedArray.attach(spec) for key, spec in specs.items()}
+    sub_dofs = shared["sub_dofs"].array
+    offsets = shared["offsets"].array
+    residual = shared["residual"].array
+    output = shared["output"].array
+    factors = {}
+
+    try:
+        while True:
+            command = conn.recv()
+            try:
+                if command == "factor":
+                    n = residual.shape[0]
+                    K = sp.csr_matrix(
+                        (shared["data"].array, shared["indices"].array, shared["indptr"].array),
+                        shape=(n, n),
+                    )
+                    for s in subdomains:
+                        idx = sub_dofs[offsets[s] : offsets[s + 1]]
+                        factors[s] = spla.splu(
+                            K[idx][:, idx].tocsc(),
+                            permc_spec="MMD_AT_PLUS_A",
+                            diag_pivot_thresh=0.0,
+                            options={"SymmetricMode": True},
+                        )
+                    conn.send("ok")
+                elif command == "apply":
+                    for s in subdomains:
+                        lo, hi = offsets[s], offsets[s + 1]
+                        output[lo:hi] = factors[s].solve(residual[sub_dofs[lo:hi]])
+                    conn.send("ok")
+                elif command == "stop":
+                    break
+            except Exception as exc:
+                conn.send(("error", repr(exc)))
+                break
+    finally:
+        for array in shared.values():
+            array.close()
+        conn.close()
+
+
+class DomainDecompositionSolver:
+    """Two-level overlapping additive-Schwarz PCG across worker processes.
+
+    The 2D `DomainMesh` is split into `parts = (px, py)` overlapping
+    rectangles. Worker processes own subsets of subdomains: they slice
+    their local blocks out of the reduced K_ff held in shared memory,
+    factorize them once per solve, and apply the local solves in parallel
+    on every CG iteration. The main process runs the CG recurrence and a
+    small direct coarse-grid correction (bilinear coarse space), which
+    keeps iteration counts nearly independent of the number of subdomains.
+
+    Use as a context manager (or call `close`) to stop the workers.
+    """
+
+    def __init__(
+        self,
+        mesh,
+        parts: tuple[int, int] = (2, 2),
+        overlap: int = 2,
+        n_workers: int | None = None,
+        coarse_shape: tuple[int, int] | None = None,
+        tol: float = 1e-8,
+        maxiter: int | None = None,
+    ):
+        """
+        Args:
+            mesh: 2D `DomainMesh`.
+            parts: number of subdomains in x and y.
+            overlap: element layers added on interior subdomain sides.
+            n_workers: worker processes (default: min(subdomains, CPUs)).
+            coarse_shape: coarse grid cells (default: 2 * parts; None-able).
+            tol: relative residual tolerance.
+            maxiter: CG iteration cap (default: n_free).
+        """
+        if mesh.dim != 2:
+            raise ValueError("Domain decomposition supports 2D meshes only.")
+        self.mesh = mesh
+        self.parts = tuple(parts)
+        self.overlap = int(overlap)
+        n_sub = self.parts[0] * self.parts[1]
+        self.n_workers = min(n_workers or os.cpu_count() or 1, n_sub)
+        self.coarse_shape = coarse_shape or (2 * self.parts[0], 2 * self.parts[1])
+        self.tol = float(tol)
+        self.maxiter = maxiter
+        self.last_info: dict = {}
+
+        self._node_blocks = partition_structured_mesh(mesh, self.parts, self.overlap)
+        self._prolongation = coarse_prolongation(mesh, self.coarse_shape)
+        self._free_key = None
+        self._shared: dict[str, _SharedArray] = {}
+        self._workers: list = []
+        self._pipes: list = []
+
+    def __enter__(self) -> "DomainDecompositionSolver":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop worker processes and release shared memory."""
+        for conn in self._pipes:
+            try:
+                conn.send("stop")
+            except (BrokenPipeError, OSError):
+                pass
+        for proc in self._workers:
+            proc.join(timeout=5)
+            if proc.is_alive():
+                proc.terminate()
+        for conn in self._pipes:
+            conn.close()
+        for array in self._shared.values():
+            array.close()
+        self._workers, self._pipes, self._shared = [], [], {}
+        self._free_key = None
+
+    def _setup(self, K_ff: sp.csr_matrix, free_dofs: np.ndarray) -> None:
+        """(Re)create shared buffers and workers for a new free-DOF set."""
+        self.close()
+
+        free_index = np.full(self.mesh.n_dofs, -1, dtype=np.int64)
+        free_index[free_dofs] = np.arange(free_dofs.shape[0])
+
+        sub_dofs = []
+        for nodes in self._node_blocks:
+            dofs = free_index[(2 * nodes[:, None] + np.arange(2)).ravel()]
+            sub_dofs.append(np.sort(dofs[dofs >= 0]).astype(np.int32))
+        offsets = np.zeros(len(sub_dofs) + 1, dtype=np.int64)
+        np.cumsum([d.shape[0] for d in sub_dofs], out=offsets[1:])
+
+        n_free = free_dofs.shape[0]
+        self._shared = {
+            "data": _SharedArray((K_ff.nnz,), np.float64),
+            "indices": _SharedArray.from_array(K_ff.indices.astype(np.int32)),
+            "indptr": _SharedArray.from_array(K_ff.indptr.astype(np.int64)),
+            "sub_dofs": _SharedArray.from_array(np.concatenate(sub_dofs)),
+            "offsets": _SharedArray.from_array(offsets),
+            "residual": _SharedArray((n_free,), np.float64),
+            "output": _SharedArray((int(offsets[-1]),), np.float64),
+        }
+        specs = {key: array.spec for key, array in self._shared.items()}
+
+        for w in range(self.n_workers):
+            parent, child = _MP.Pipe()
+            subdomains = list(range(w, len(sub_dofs), self.n_workers))
+            proc = _MP.Process(target=_worker_main, args=(child, specs, subdomains), daemon=True)
+            proc.start()
+            child.close()
+            self._workers.append(proc)
+            self._pipes.append(parent)
+
+        P = self._prolongation[free_dofs]
+        self._coarse_P = P[:, np.flatnonzero(P.getnnz(axis=0))].tocsr()
+        self._free_key = (n_free, K_ff.nnz, hash(free_dofs.tobytes()))
+
+    def _broadcast(self, command: str) -> None:
+        for conn in self._pipes:
+            conn.send(command)
+        self._collect()
+
+    def _collect(self) -> None:
+        """Wait for every worker's reply; raise with the first worker error."""
+        errors = []
+        for conn in self._pipes:
+            try:
+                reply = conn.recv()
+            except EOFError:
+                reply = ("error", "worker exited unexpectedly")
+            if reply != "ok":
+                errors.append(reply[1])
+        if errors:
+            raise RuntimeError(f"Domain decomposition worker failed: {errors[0]}")
+
+    def solve(self, K, F: np.ndarray, constrained_dofs: np.ndarray) -> np.ndarray:
+        """Return the full displacement vector u (zeros at constrained DOFs)."""
+        from fglopt.fea.solver import apply_dirichlet_bcs
+
+        K_ff, F_f, free_dofs = apply_dirichlet_bcs(K, np.asarray(F, dtype=float), constrained_dofs)
+        K_ff.sort_indices()
+
+        key = (free_dofs.shape[0], K_ff.nnz, hash(free_dofs.tobytes()))
+        if key != self._free_key:
+            self._setup(K_ff, free_dofs)
+
+        self._shared["data"].array[:] = K_ff.data
+        self._broadcast("factor")
+
+        P = self._coarse_P
+        coarse_lu = spla.splu((P.T @ K_ff @ P).tocsc())
+
+        residual = self._shared["residual"].array
+        output = self._shared["output"].array
+        sub_dofs = self._shared["sub_dofs"].array
+        n_free = F_f.shape[0]
+
+        def apply_preconditioner(r):
+            residual[:] = r
+            for conn in self._pipes:
+                conn.send("apply")
+            # The coarse solve overlaps with the workers' local solves.
+            z = P @ coarse_lu.solve(P.T @ r)
+            self._collect()
+            z += np.bincount(sub_dofs, weights=output, minlength=n_free)
+            return z
+
+        M = spla.LinearOperator((n_free, n_free), matvec=apply_preconditioner, dtype=float)
+
+        iterations = 0
+
+        def count(_xk):
+            nonlocal iterations
+            iterations += 1
+
+        maxiter = self.maxiter if self.maxiter is not None else n_free
+        x, info = spla.cg(K_ff, F_f, rtol=self.tol, atol=0.0, maxiter=maxiter, M=M, callback=count)
+        if info > 0:
+            raise RuntimeError(
+                f"Schwarz-PCG did not converge to tol={self.tol:g} in {iterations} iterations."
+            )
+
+        self.last_info = {
+            "method": "domain-decomposition",
+            "iterations": iterations,
+            "subdomains": len(self._node_blocks),
+            "workers": self.n_workers,
+        }
+        u = np.zeros_like(np.asarray(F, dtype=float))
+        u[free_dofs] = x
+        return u
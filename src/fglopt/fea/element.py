@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import numpy as np
+
+
+_GAUSS_2 = np.array([-1.0, 1.0]) / np.sqrt(3.0)
+
+
+class Q4Element:
+    """Bilinear 4-node quadrilateral element under plane stress.
+
+    Local node order matches `DomainMesh.element_nodes`:
+    [bottom-left, bottom-right, top-right, top-left].
+    Local DOF order is interleaved per node: [u0x, u0y, u1x, u1y, ...].
+    """
+
+    n_nodes = 4
+    n_dofs_per_node = 2
+
+    # Natural coordinates (xi, eta) of the local nodes.
+    _CORNERS = np.array(
+        [[-1.0, -1.0], [1.0, -1.0], [1.0, 1.0], [-1.0, 1.0]]
+    )
+
+    def __init__(self, E: float, nu: float):
+        """
+        Args:
+            E: Young's modulus of the solid material.
+            nu: Poisson's ratio.
+        """
+        if E <= 0.0:
+            raise ValueError(f"Young's modulus must be positive: {E}")
+        if not -1.0 < nu < 0.5:
+            raise ValueError(f"Poisson's ratio out of range: {nu}")
+        self.E = float(E)
+        self.nu = float(nu)
+
+    @property
+    def n_dofs(self) -> int:
+        return self.n_nodes * self.n_dofs_per_node
+
+    def constitutive_matrix(self) -> np.ndarray:
+        """Return the 3x3 plane-stress matrix D for [exx, eyy, gxy]."""
+        E, nu = self.E, self.nu
+        return (E / (1.0 - nu**2)) * np.array(
+            [
+                [1.0, nu, 0.0],
+                [nu, 1.0, 0.0],
+                [0.0, 0.0, (1.0 - nu) / 2.0],
+            ]
+        )
+
+    def shape_functions(self, xi: float, eta: float) -> np.ndarray:
+        """Return the 4 bilinear shape function values at (xi, eta)."""
+        c = self._CORNERS
+        return 0.25 * (1.0 + c[:, 0] * xi) * (1.0 + c[:, 1] * eta)
+
+    def strain_displacement_matrix(
+        self, xi: float, eta: float, lx: float = 1.0, ly: float = 1.0
+    ) -> np.ndarray:
+        """Return the 3x8 B matrix at (xi, eta) for an lx-by-ly rectangle."""
+        c = self._CORNERS
+        dn_dx = 0.25 * c[:, 0] * (1.0 + c[:, 1] * eta) * (2.0 / lx)
+        dn_dy = 0.25 * c[:, 1] * (1.0 + c[:, 0] * xi) * (2.0 / ly)
+
+        B = np.zeros((3, self.n_dofs))
+        B[0, 0::2] = dn_dx
+        B[1, 1::2] = dn_dy
+        B[2, 0::2] = dn_dy
+        B[2, 1::2] = dn_dx
+        return B
+
+    def stiffness_matrix(
+        self, lx: float = 1.0, ly: float = 1.0, dtype=np.float64
+    ) -> np.ndarray:
+        """Return the 8x8 element stiffness matrix using 2x2 Gauss quadrature.
+
+        Args:
+            lx: element width.
+            ly: element height.
+            dtype: output dtype; integration is always done in float64.
+        """
+        D = self.constitutive_matrix()
+        det_j = lx * ly / 4.0
+
+        ke = np.zeros((self.n_dofs, self.n_dofs))
+        for xi in _GAUSS_2:
+            for eta in _GAUSS_2:
+                B = self.strain_displacement_matrix(xi, eta, lx, ly)
+                ke += B.T @ D @ B * det_j
+
+        return ke.astype(dtype, copy=False)
+
+
+class HexElement(Q4Element):
+    """Trilinear 8-node hexahedral (H8) element for 3D linear elasticity.
+
+    Local node order matches `DomainMesh3D.element_nodes`: the Q4 order on
+    the z-min face followed by the same order on the z-max face.
+    Strains use Voigt order [exx, eyy, ezz, gyz, gxz, gxy].
+    """
+
+    n_nodes = 8
+    n_dofs_per_node = 3
+
+    _CORNERS = np.array(
+        [
+            [-1.0, -1.0, -1.0],
+            [1.0, -1.0, -1.0],
+            [1.0, 1.0, -1.0],
+            [-1.0, 1.0, -1.0],
+            [-1.0, -1.0, 1.0],
+            [1.0, -1.0, 1.0],
+            [1.0, 1.0, 1.0],
+            [-1.0, 1.0, 1.0],
+        ]
+    )
+
+    def constitutive_matrix(self) -> np.ndarray:
+        """Return the 6x6 isotropic elasticity matrix D."""
+        E, nu = self.E, self.nu
+        lam = E * nu / ((1.0 + nu) * (1.0 - 2.0 * nu))
+        mu = E / (2.0 * (1.0 + nu))
+
+        D = np.zeros((6, 6))
+        D[:3, :3] = lam
+        D[np.arange(3), np.arange(3)] += 2.0 * mu
+        D[np.arange(3, 6), np.arange(3, 6)] = mu
+        return D
+
+    def shape_functions(self, xi: float, eta: float, zeta: float) -> np.ndarray:
+        """Return the 8 trilinear shape function values at (xi, eta, zeta)."""
+        c = self._CORNERS
+        return (
+            0.125
+            * (1.0 + c[:, 0] * xi)
+            * (1.0 + c[:, 1] * eta)
+            * (1.0 + c[:, 2] * zeta)
+        )
+
+    def strain_displacement_matrix(
+        self,
+        xi: float,
+        eta: float,
+        zeta: float,
+        lx: float = 1.0,
+        ly: float = 1.0,
+        lz: float = 1.0,
+    ) -> np.ndarray:
+        """Return the 6x24 B matrix at (xi, eta, zeta) for an lx*ly*lz brick."""
+        c = self._CORNERS
+        fx = 1.0 + c[:, 0] * xi
+        fy = 1.0 + c[:, 1] * eta
+        fz = 1.0 + c[:, 2] * zeta
+        dn_dx = 0.125 * c[:, 0] * fy * fz * (2.0 / lx)
+        dn_dy = 0.125 * c[:, 1] * fx * fz * (2.0 / ly)
+        dn_dz = 0.125 * c[:, 2] * fx * fy * (2.0 / lz)
+
+        B = np.zeros((6, self.n_dofs))
+        B[0, 0::3] = dn_dx
+        B[1, 1::3] = dn_dy
+        B[2, 2::3] = dn_dz
+        B[3, 1::3] = dn_dz
+        B[3, 2::3] = dn_dy
+        B[4, 0::3] = dn_dz
+        B[4, 2::3] = dn_dx
+        B[5, 0::3] = dn_dy
+        B[5, 1::3] = dn_dx
+        return B
+
+    def stiffness_matrix(
+        self,
+        lx: float = 1.0,
+        ly: float = 1.0,
+        lz: float = 1.0,
+        dtype=np.float64,
+    ) -> np.ndarray:
+        """Return the 24x24 element stiffness matrix using 2x2x2 Gauss quadrature.
+
+        Args:
+            lx, ly, lz: element edge lengths.
+            dtype: output dtype; integration is always done in float64.
+        """
+        D = self.constitutive_matrix()
+        det_j = lx * ly * lz / 8.0
+
+        ke = np.zeros((self.n_dofs, self.n_dofs))
+        for xi in _GAUSS_2:
+            for eta in _GAUSS_2:
+                for zeta in _GAUSS_2:
+                    B = self.strain_displacement_matrix(xi, eta, zeta, lx, ly, lz)
+                    ke += B.T @ D @ B * det_j
+
+        return ke.astype(dtype, copy=False)
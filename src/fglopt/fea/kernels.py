@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+
+class ElementKernels:
+    """Multithreaded, chunked element-level kernels for a shared K_e.
+
+    Work is split into cache-sized chunks of `chunk_size` elements, and each
+    of `n_threads` threads walks a fixed, strided subset of the chunks with
+    its own preallocated gather/product buffers. The inner operations
+    (`np.take`, `np.matmul`, in-place ufuncs and reductions) release the GIL,
+    so threads run in parallel without copying the mesh data, and repeated
+    calls allocate no per-element temporaries.
+
+    Output arrays can be passed via `out=` to keep the SIMP loop allocation
+    free; otherwise a new array is returned. `dtype` sets the dtype of
+    allocated per-element results (float32 in mixed precision); element
+    products are always evaluated in float64, since u_e^T K_e u_e cancels
+    the rigid-body part of u_e and loses digits in float32.
+    """
+
+    def __init__(
+        self,
+        edofs: np.ndarray,
+        ke: np.ndarray,
+        n_threads: int | None = None,
+        chunk_size: int = 4096,
+        dtype=np.float64,
+    ):
+        """
+        Args:
+            edofs: (n_elems, n_dofs_per_elem) DOF table, e.g. `element_dofs(mesh)`.
+            ke: shared element stiffness matrix.
+            n_threads: worker threads (default: CPU count; 1 disables the pool).
+            chunk_size: elements per chunk.
+            dtype: floating dtype of allocated result arrays.
+        """
+        self.dtype = np.dtype(dtype)
+        self.edofs = edofs
+        self.ke = np.ascontiguousarray(ke, dtype=np.float64)
+        self.n_elems, self.ndpe = edofs.shape
+        self.n_threads = max(1, int(n_threads or os.cpu_count() or 1))
+        self.chunk_size = int(chunk_size)
+
+        self._chunks = [
+            slice(start, min(start + self.chunk_size, self.n_elems))
+            for start in range(0, self.n_elems, self.chunk_size)
+        ]
+        self._gather = [
+            np.empty((self.chunk_size, self.ndpe)) for _ in range(self.n_threads)
+        ]
+        self._product = [
+            np.empty((self.chunk_size, self.ndpe)) for _ in range(self.n_threads)
+        ]
+        self._pool = (
+            ThreadPoolExecutor(max_workers=self.n_threads) if self.n_threads > 1 else None
+        )
+
+    def close(self) -> None:
+        """Shut down the thread pool."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def _run(self, task, elements: slice | None = None) -> None:
+        """Call task(thread_id, block) for every chunk, strided over threads.
+
+        `elements` restricts the work to a contiguous element range.
+        """
+        chunks = self._chunks
+        if elements is not None:
+            start, stop, _ = elements.indices(self.n_elems)
+            chunks = [
+                slice(begin, min(begin + self.chunk_size, stop))
+                for begin in range(start, stop, self.chunk_size)
+            ]
+
+        if self._pool is None:
+            for block in chunks:
+                task(0, block)
+            return
+
+        def worker(tid):
+            for block in chunks[tid :: self.n_threads]:
+                task(tid, block)
+
+        for future in [self._pool.submit(worker, tid) for tid in range(self.n_threads)]:
+            future.result()
+
+    def _output(self, out, shape, dtype=None):
+        if out is None:
+            return np.empty(shape, dtype=dtype or self.dtype)
+        if out.shape != shape:
+            raise ValueError(f"Expected output shape {shape}, got {out.shape}.")
+        return out
+
+    def strain_energy(self, u: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+        """Return u_e^T K_e u_e for every element (unscaled by density)."""
+        u = np.asarray(u, dtype=np.float64)
+        out = self._output(out, (self.n_elems,))
+
+        def task(tid, block):
+            n = block.stop - block.start
+            ue = self._gather[tid][:n]
+            ke_ue = self._product[tid][:n]
+            np.take(u, self.edofs[block], out=ue)
+            np.matmul(ue, self.ke, out=ke_ue)
+            np.multiply(ke_ue, ue, out=ke_ue)
+            np.sum(ke_ue, axis=1, out=out[block])
+
+        self._run(task)
+        return out
+
+    def compliance_sensitivity(
+        self,
+        u: np.ndarray,
+        d_scale: np.ndarray,
+        out: np.ndarray | None = None,
+        energy: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """Return dC/drho_e = -ds_e/drho_e * u_e^T K_e u_e.
+
+        Args:
+            u: global displacement vector.
+            d_scale: derivative of the stiffness interpolation per element.
+            out: optional output buffer.
+            energy: optional buffer that receives the unscaled strain energies.
+        """
+        energy = self.strain_energy(u, out=energy)
+        out = self._output(out, (self.n_elems,))
+
+        def task(tid, block):
+            np.multiply(d_scale[block], energy[block], out=out[block])
+            np.negative(out[block], out=out[block])
+
+        self._run(task)
+        return out
+
+    def scaled_data(self, scale: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+        """Return the (n_elems, ndpe^2) element matrix entries s_e * K_e.
+
+        These are assembly data, so the default output is float64.
+        """
+        out = self._output(out, (self.n_elems, self.ndpe * self.ndpe), np.float64)
+        ke_flat = self.ke.ravel()
+
+        def task(tid, block):
+            np.multiply(scale[block, None], ke_flat[None, :], out=out[block])
+
+        self._run(task)
+        return out
+
+    def apply(
+        self,
+        operator: np.ndarray,
+        u: np.ndarray,
+        scale: np.ndarray | None = None,
+        out: np.ndarray | None = None,
+        elements: slice | None = None,
+    ) -> np.ndarray:
+        """Return s_e * (operator @ u_e) for every element.
+
+        `operator` is any (m, ndpe) element matrix, e.g. D @ B at a point
+        for stresses, or B for strains. With `elements` (a contiguous
+        slice) only that range is evaluated and `out` has one row per
+        element of the range, so callers can stream large meshes in blocks.
+        """
+        operator = np.ascontiguousarray(operator, dtype=np.float64)
+        u = np.asarray(u, dtype=np.float64)
+        m = operator.shape[0]
+        start, stop, _ = (elements or slice(None)).indices(self.n_elems)
+        out = self._output(out, (stop - start, m))
+        op_t = operator.T.copy()
+
+        def task(tid, block):
+            n = block.stop - block.start
+            ue = self._gather[tid][:n]
+            rows = slice(block.start - start, block.stop - start)
+            np.take(u, self.edofs[block], out=ue)
+            np.matmul(ue, op_t, out=out[rows])
+            if scale is not None:
+                np.multiply(out[rows], scale[block, None], out=out[rows])
+
+        self._run(task, elements)
+        return out
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from functools import lru_cache
+
+import numpy as np
+
+
+ORDERINGS = ("nested-dissection", "rcm", "colamd")
+
+
+def _box_nodes(lo, hi, node_shape) -> np.ndarray:
+    """Flat node ids of the inclusive grid box [lo, hi] (x fastest)."""
+    axes = [np.arange(l, h + 1) for l, h in zip(lo, hi)]
+    grids = np.meshgrid(*axes[::-1], indexing="ij")
+    return np.ravel_multi_index([g.ravel() for g in grids], node_shape[::-1])
+
+
+@lru_cache(maxsize=8)
+def _nested_dissection_nodes(node_shape: tuple[int, ...], leaf_size: int) -> np.ndarray:
+    blocks = []
+
+    def dissect(lo, hi):
+        extent = [h - l + 1 for l, h in zip(lo, hi)]
+        if min(extent) <= 0:
+            return
+        if np.prod(extent) <= leaf_size or max(extent) < 3:
+            blocks.append(_box_nodes(lo, hi, node_shape))
+            return
+        axis = int(np.argmax(extent))
+        mid = (lo[axis] + hi[axis]) // 2
+        left_hi, right_lo = list(hi), list(lo)
+        left_hi[axis], right_lo[axis] = mid - 1, mid + 1
+        dissect(lo, tuple(left_hi))
+        dissect(tuple(right_lo), hi)
+        # The separator plane is eliminated after both halves.
+        sep_lo, sep_hi = list(lo), list(hi)
+        sep_lo[axis] = sep_hi[axis] = mid
+        blocks.append(_box_nodes(sep_lo, sep_hi, node_shape))
+
+    dissect(tuple(0 for _ in node_shape), tuple(n - 1 for n in node_shape))
+    nodes = np.concatenate(blocks)
+    nodes.flags.writeable = False
+    return nodes
+
+
+def nested_dissection(mesh, leaf_size: int = 16) -> np.ndarray:
+    """Return a nested-dissection DOF ordering of a structured mesh.
+
+    The node grid is bisected recursively across its longest axis; each
+    half is ordered first and the one-node-thick separator plane last, down
+    to boxes of `leaf_size` nodes. On a 2D grid this gives O(n log n) LU
+    fill, against O(n^1.5) for banded orderings. The result is a
+    permutation of all DOFs (interleaved per node) and is cached per grid
+    shape, so repeated solves on the same mesh reuse it.
+    """
+    shape = (mesh.nx, mesh.ny) if mesh.dim == 2 else (mesh.nx, mesh.ny, mesh.nz)
+    nodes = _nested_dissection_nodes(tuple(n + 1 for n in shape), int(leaf_size))
+    dpn = mesh.dofs_per_node
+    return (dpn * nodes[:, None] + np.arange(dpn)).ravel()
+
+
+def ordering_from_config(config, mesh):
+    """Return the direct-solver `ordering` for the `ordering` config key.
+
+    `nested-dissection` (default) precomputes the grid ordering, `rcm`
+    orders by reverse Cuthill-McKee on the matrix graph and `colamd` keeps
+    SuperLU's own per-factorization ordering.
+    """
+    name = str(config.get("ordering", "nested-dissection")).lower()
+    if name not in ORDERINGS:
+        raise ValueError(f"Unsupported ordering: {name}")
+    if name == "nested-dissection":
+        return nested_dissection(mesh)
+    return name
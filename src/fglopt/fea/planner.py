@@ -0,0 +1,513 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+import numpy as np
+
+from fglopt.fea.precision import PRECISIONS, get_precision
+
+
+SOLVERS = ("direct", "cg", "matrix-free", "domain-decomposition")
+
+_UNITS = {"": 1, "b": 1, "kb": 1 << 10, "mb": 1 << 20, "gb": 1 << 30, "tb": 1 << 40}
+
+
+def parse_memory(value) -> int | None:
+    """Return a byte count from a number of GiB or a string like "512MB"/"8 GB".
+
+    Units are binary (1 GB = 2^30 bytes). None passes through.
+    """
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return int(value * _UNITS["gb"])
+    text = str(value).strip().lower().replace(" ", "").replace("ib", "b")
+    digits = text.rstrip("kmgtb")
+    unit = text[len(digits):]
+    if unit not in _UNITS or not digits:
+        raise ValueError(f"Invalid memory size: {value!r}")
+    return int(float(digits) * _UNITS[unit])
+
+
+def format_bytes(n: float) -> str:
+    """Return a short human-readable size (binary units)."""
+    for unit in ("B", "KB", "MB", "GB"):
+        if abs(n) < 1024.0:
+            return f"{n:.1f} {unit}"
+        n /= 1024.0
+    return f"{n:.1f} TB"
+
+
+def physical_memory() -> int | None:
+    """Return the total physical memory in bytes, or None if unknown."""
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+def filter_stencil(radius: float, dim: int) -> int:
+    """Neighbours per element of `DensityFilter` (offsets closer than radius)."""
+    reach = max(int(np.ceil(radius)) - 1, 0)
+    offsets = np.arange(-reach, reach + 1)
+    grids = np.meshgrid(*[offsets] * dim, indexing="ij")
+    return max(int((sum(g * g for g in grids) < radius * radius).sum()), 1)
+
+
+def structured_nnz(shape: tuple[int, ...], dofs_per_node: int) -> int:
+    """Exact nnz of the assembled stiffness of a structured Q4/H8 grid.
+
+    Each node couples to the nodes of its neighbouring elements: 3 per axis
+    in the interior and 2 on the boundary, so the count factorizes over axes.
+    """
+    return dofs_per_node**2 * int(np.prod([3 * (n + 1) - 2 for n in shape]))
+
+
+@dataclass
+class PlannerCalibration:
+    """Per-stage cost coefficients of the resource model.
+
+    Power laws are (a, b) with cost = a * n_dofs**b, keyed by dimension.
+    Defaults were fitted with `calibrate()` on a single-core workstation;
+    re-run `benchmarks/calibrate_planner.py` and point the
+    `planner_calibration` config key at its JSON output on other machines.
+    """
+
+    # Direct solves factorize with the cached nested-dissection ordering.
+    lu_fill: dict = field(default_factory=lambda: {2: (26.1, 1.15), 3: (10.9, 1.45)})
+    lu_seconds: dict = field(
+        default_factory=lambda: {2: (1.39e-7, 1.35), 3: (1.04e-8, 1.94)}
+    )
+    spmv_ns_per_nnz: float = 1.5
+    vector_ns_per_dof: float = 9.0
+    element_ns_per_entry: dict = field(default_factory=lambda: {2: 1.8, 3: 0.55})
+    assembly_ns_per_entry: float = 9.0
+    pattern_ns_per_entry: float = 83.0
+    cg_iterations_per_edge: float = 12.0
+    schwarz_iterations: float = 40.0
+    # Bytes per LU nonzero beyond the value: row index plus SuperLU
+    # supernode bookkeeping (from peak RSS of benchmarks/bench_precision.py).
+    lu_overhead_bytes: float = 5.0
+    # Resident size of the interpreter with NumPy/SciPy loaded.
+    process_bytes: float = 90.0 * 2**20
+    # Transient bytes per element-matrix entry while building the CSR pattern
+    # (tracemalloc peak of StiffnessAssembler construction).
+    pattern_bytes_per_entry: float = 54.0
+
+    def save(self, path: str | Path) -> Path:
+        """Write the coefficients as JSON."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(asdict(self), indent=2))
+        return path
+
+    @classmethod
+    def load(cls, path: str | Path) -> "PlannerCalibration":
+        """Read coefficients written by `save`."""
+        data = json.loads(Path(path).read_text())
+        for key in ("lu_fill", "lu_seconds", "element_ns_per_entry"):
+            if key in data:
+                data[key] = {int(dim): tuple(v) if isinstance(v, list) else v
+                             for dim, v in data[key].items()}
+        return cls(**data)
+
+
+@dataclass
+class BackendEstimate:
+    """Predicted peak memory and cost of one solver/precision combination."""
+
+    solver: str
+    precision: str
+    peak_bytes: int
+    setup_seconds: float
+    iteration_seconds: float
+    fill_nnz: int = 0
+    iterations: int = 0
+
+    def fits(self, budget_bytes: int | None) -> bool:
+        return budget_bytes is None or self.peak_bytes <= budget_bytes
+
+
+@dataclass
+class ResourcePlan:
+    """Problem size and per-backend estimates for a structured mesh."""
+
+    shape: tuple[int, ...]
+    n_nodes: int
+    n_elements: int
+    n_dofs: int
+    nnz: int
+    matrix_bytes: int
+    budget_bytes: int | None
+    estimates: list[BackendEstimate]
+
+    @property
+    def dim(self) -> int:
+        return len(self.shape)
+
+    def estimate(self, solver: str, precision: str = "double") -> BackendEstimate:
+        for est in self.estimates:
+            if est.solver == solver and est.precision == precision:
+                return est
+        raise ValueError(f"No estimate for solver {solver!r} in {precision} precision.")
+
+    @property
+    def recommended(self) -> BackendEstimate | None:
+        """Fastest backend within budget, preferring double over mixed.
+
+        Single precision is never recommended: its compliance error grows
+        with the condition number of graded designs.
+        """
+        for precision in ("double", "mixed"):
+            fitting = [
+                est for est in self.estimates
+                if est.precision == precision and est.fits(self.budget_bytes)
+            ]
+            if fitting:
+                return min(fitting, key=lambda est: est.setup_seconds + est.iteration_seconds)
+        return None
+
+    def check(self, solver: str, precision: str = "double") -> BackendEstimate:
+        """Return the estimate, or raise ValueError if it exceeds the budget."""
+        est = self.estimate(solver, precision)
+        if est.fits(self.budget_bytes):
+            return est
+        best = self.recommended
+        hint = (
+            f"use solver: {best.solver}, precision: {best.precision} "
+            f"(~{format_bytes(best.peak_bytes)})"
+            if best is not None
+            else "no backend fits; reduce the mesh resolution"
+        )
+        raise ValueError(
+            f"Estimated peak memory {format_bytes(est.peak_bytes)} for {solver} "
+            f"({precision}) exceeds the memory budget of "
+            f"{format_bytes(self.budget_bytes)}; {hint}."
+        )
+
+
+class ResourcePlanner:
+    """Estimate memory and runtime of FE solves from structured mesh dimensions.
+
+    Models are per stage: mesh and DOF tables, CSR pattern construction,
+    assembled matrix, LU fill (power law in DOFs), CG iterations (linear in
+    the longest element edge count) and per-iteration kernel costs, all
+    scaled by `PlannerCalibration` coefficients. Nothing is allocated, so
+    meshes far beyond the machine can be planned.
+
+    With `optimization` the peak memory also covers the buffers the SIMP
+    loop keeps alongside the solve: scaled element matrices for assembly,
+    per-thread kernel chunks, the density filter, the design-grid
+    projection and the OC update vectors.
+    """
+
+    def __init__(self, calibration: PlannerCalibration | None = None):
+        self.calibration = calibration or PlannerCalibration()
+
+    def plan(
+        self,
+        shape: tuple[int, ...],
+        budget_bytes: int | None = None,
+        parts: tuple[int, int] = (2, 2),
+        n_workers: int | None = None,
+        optimization: bool = False,
+        design_block: int = 1,
+        filter_radius: float = 1.5,
+        n_threads: int | None = None,
+    ) -> ResourcePlan:
+        """
+        Args:
+            shape: element counts (nx, ny) or (nx, ny, nz).
+            budget_bytes: memory budget used for `recommended` and `check`.
+            parts: subdomain split for the domain-decomposition estimate.
+            n_workers: worker processes for domain decomposition.
+            optimization: plan a SIMP loop instead of a single solve.
+            design_block: analysis elements per design variable per axis.
+            filter_radius: density filter radius in analysis elements.
+            n_threads: element kernel threads (default: CPU count).
+        """
+        shape = tuple(int(n) for n in shape)
+        dim = len(shape)
+        dpn = dim
+        n_nodes = int(np.prod([n + 1 for n in shape]))
+        n_elements = int(np.prod(shape))
+        n_dofs = dpn * n_nodes
+        nnz = structured_nnz(shape, dpn)
+
+        estimates = [
+            self._estimate(solver, get_precision(precision), shape, parts, n_workers)
+            for solver in SOLVERS
+            for precision in PRECISIONS
+            # Domain decomposition is 2D and double precision only.
+            if solver != "domain-decomposition" or (dim == 2 and precision == "double")
+        ]
+        if optimization:
+            for est in estimates:
+                est.peak_bytes += self._optimization_bytes(
+                    shape,
+                    get_precision(est.precision),
+                    assembled=est.solver != "matrix-free",
+                    design_block=design_block,
+                    filter_radius=filter_radius,
+                    n_threads=n_threads,
+                )
+        return ResourcePlan(
+            shape=shape,
+            n_nodes=n_nodes,
+            n_elements=n_elements,
+            n_dofs=n_dofs,
+            nnz=nnz,
+            matrix_bytes=_csr_bytes(nnz, n_dofs, 8),
+            budget_bytes=budget_bytes,
+            estimates=estimates,
+        )
+
+    def _lu(self, dim: int, n_dofs: int) -> tuple[int, float]:
+        """Return (LU nonzeros, factorization seconds) for n_dofs unknowns."""
+        a, b = self.calibration.lu_fill[dim]
+        c, d = self.calibration.lu_seconds[dim]
+        return int(a * n_dofs**b), c * n_dofs**d
+
+    def _optimization_bytes(
+        self, shape, precision, assembled, design_block, filter_radius, n_threads
+    ) -> int:
+        """Return the SIMP loop's memory on top of the solve's peak."""
+        dim = len(shape)
+        ndpe = dim * 2**dim
+        n_elements = int(np.prod(shape))
+        low = precision.storage.itemsize
+        threads = max(1, int(n_threads or os.cpu_count() or 1))
+
+        # Gather and product chunks of 4096 elements per kernel thread.
+        extra = 2 * threads * 4096 * ndpe * 8
+        if assembled:
+            # Scaled element matrices fed to the assembly bincount.
+            extra += n_elements * ndpe * ndpe * 8
+
+        block = max(int(design_block), 1)
+        if block > 1:
+            n_design = int(np.prod([-(-n // block) for n in shape]))
+            # Projection P (one entry per element) and per-cell counts.
+            extra += _csr_bytes(n_elements, n_elements, low) + n_design * low
+            # TopologyOptimizer keeps at least 1.5 design cells.
+            radius = max(filter_radius / block, 1.5)
+        else:
+            n_design, radius = n_elements, filter_radius
+        extra += _csr_bytes(n_design * filter_stencil(radius, dim), n_design, low)
+        # Design, OC output, ratio, move bounds, volume sensitivity and Hs.
+        extra += 7 * n_design * low
+        return int(extra)
+
+    def _estimate(self, solver, precision, shape, parts, n_workers) -> BackendEstimate:
+        cal = self.calibration
+        dim = len(shape)
+        ndpe = dim * 2**dim
+        n_elements = int(np.prod(shape))
+        n_nodes = int(np.prod([n + 1 for n in shape]))
+        n_dofs = dim * n_nodes
+        nnz = structured_nnz(shape, dim)
+        entries = n_elements * ndpe * ndpe
+
+        value = precision.solve.itemsize
+        low = precision.storage.itemsize
+        # Mesh coordinates, connectivity, DOF table and per-element fields.
+        base = cal.process_bytes
+        base += n_nodes * dim * low + n_elements * 2**dim * 4 + n_elements * ndpe * 4
+        base += 4 * n_elements * low
+        vectors = 8 * n_dofs * value
+        kernels = entries * cal.element_ns_per_entry[dim] * 1e-9
+
+        iterations = 0
+        fill_nnz = 0
+        if solver == "matrix-free":
+            iterations = int(cal.cg_iterations_per_edge * max(shape))
+            peak = base + vectors
+            setup = 0.0
+            per_solve = iterations * (
+                entries * cal.element_ns_per_entry[dim] + n_dofs * cal.vector_ns_per_dof
+            ) * 1e-9
+        else:
+            matrix = _csr_bytes(nnz, n_dofs, value)
+            pattern = n_elements * ndpe * ndpe * 4
+            # Pattern construction is transient, but K and its reduced copy
+            # coexist with the cached element-to-slot map during a solve.
+            peak = base + vectors + max(
+                entries * cal.pattern_bytes_per_entry, pattern + 2 * matrix
+            )
+            setup = entries * cal.pattern_ns_per_entry * 1e-9
+            assemble = entries * cal.assembly_ns_per_entry * 1e-9
+
+            if solver == "direct":
+                fill_nnz, factor = self._lu(dim, n_dofs)
+                lu_bytes = fill_nnz * (low + cal.lu_overhead_bytes)
+                peak = base + vectors + pattern + 3 * matrix + lu_bytes
+                refine = 4 * 2 * fill_nnz * 1e-9 if precision.refine else 0.0
+                per_solve = assemble + factor + refine
+            elif solver == "cg":
+                iterations = int(cal.cg_iterations_per_edge * max(shape))
+                per_solve = assemble + iterations * (
+                    nnz * cal.spmv_ns_per_nnz + n_dofs * cal.vector_ns_per_dof
+                ) * 1e-9
+            else:
+                px, py = parts
+                n_sub = px * py
+                workers = min(n_workers or os.cpu_count() or 1, n_sub)
+                sub_dofs = dim * (shape[0] // px + 5) * (shape[1] // py + 5)
+                sub_fill, sub_factor = self._lu(dim, sub_dofs)
+                fill_nnz = n_sub * sub_fill
+                iterations = int(cal.schwarz_iterations)
+                peak += fill_nnz * (8 + cal.lu_overhead_bytes)
+                per_solve = assemble + n_sub * sub_factor / workers + iterations * (
+                    nnz * cal.spmv_ns_per_nnz
+                    + 4 * fill_nnz / workers
+                    + n_dofs * cal.vector_ns_per_dof
+                ) * 1e-9
+
+        return BackendEstimate(
+            solver=solver,
+            precision=precision.name,
+            peak_bytes=int(peak),
+            setup_seconds=setup,
+            iteration_seconds=per_solve + kernels,
+            fill_nnz=fill_nnz,
+            iterations=iterations,
+        )
+
+
+def plan_from_config(config, optimization: bool = False) -> ResourcePlan:
+    """Plan the configured mesh against its memory budget.
+
+    Reads `memory_budget` (GiB number or string like "512MB"; default: total
+    physical memory), `planner_calibration` (JSON from `calibrate`) and the
+    `domain_decomposition` section. With `optimization` the SIMP loop is
+    planned, using `design_block`, `filter_radius` and `threads`. A declared `symmetry` (e.g. `x`, `xy`)
+    plans the reduced mesh; `auto` is planned on the full mesh, since the
+    detected planes are only known once the loads are built.
+    """
+    calibration_path = config.get("planner_calibration")
+    calibration = PlannerCalibration.load(calibration_path) if calibration_path else None
+
+    budget = parse_memory(config.get("memory_budget"))
+    if budget is None:
+        budget = physical_memory()
+
+    from fglopt.mesh.domain_mesh import mesh_shape_from_config
+
+    shape = list(mesh_shape_from_config(config))
+    symmetry = str(config.get("symmetry", "none") or "none").lower()
+    if symmetry not in ("none", "auto"):
+        for axis, name in enumerate("xyz"[: len(shape)]):
+            if name in symmetry:
+                shape[axis] = max(shape[axis] // 2, 1)
+
+    dd_cfg = config.get("domain_decomposition", {}) or {}
+    return ResourcePlanner(calibration).plan(
+        tuple(shape),
+        budget_bytes=budget,
+        parts=tuple(dd_cfg.get("parts", (2, 2))),
+        n_workers=dd_cfg.get("workers"),
+        optimization=optimization,
+        design_block=config.get("design_block", 1),
+        filter_radius=config.get("filter_radius", 1.5),
+        n_threads=config.get("threads"),
+    )
+
+
+def _csr_bytes(nnz: int, n_dofs: int, value_bytes: int) -> int:
+    return nnz * (value_bytes + 4) + (n_dofs + 1) * 4
+
+
+def calibrate(
+    sizes_2d=((100, 50), (200, 100), (400, 200)),
+    sizes_3d=((10, 10, 10), (16, 16, 16), (24, 24, 24)),
+    progress=None,
+) -> PlannerCalibration:
+    """Fit `PlannerCalibration` coefficients by timing small cantilever solves.
+
+    Runs the pattern build, assembly, LU factorization, SpMV, matrix-free
+    products and one graded-density CG solve per size, then fits the power
+    laws on a log-log scale. Takes one to two minutes with the default
+    sizes; smaller sizes are faster but extrapolate the fill less reliably.
+    """
+    from fglopt.fea.assembler import MatrixFreeStiffness, StiffnessAssembler
+    from fglopt.fea.element import HexElement, Q4Element
+    from fglopt.fea.ordering import nested_dissection
+    from fglopt.fea.solver import FEASolver, apply_dirichlet_bcs
+    from fglopt.mesh.domain_mesh import DomainMesh, DomainMesh3D
+
+    def timed(fn, repeats=1):
+        start = time.perf_counter()
+        for _ in range(repeats):
+            result = fn()
+        return result, (time.perf_counter() - start) / repeats
+
+    cal = PlannerCalibration()
+    samples = {"spmv": [], "vector": [], "pattern": [], "assembly": [], "cg": []}
+    lu_fill, lu_seconds, element_ns = {}, {}, {}
+
+    for dim, sizes in ((2, sizes_2d), (3, sizes_3d)):
+        dofs, fills, seconds, per_entry = [], [], [], []
+        for shape in sizes:
+            if progress is not None:
+                progress(shape)
+            mesh = DomainMesh(*shape) if dim == 2 else DomainMesh3D(*shape)
+            element = Q4Element(1.0, 0.3) if dim == 2 else HexElement(1.0, 0.3)
+            ke = element.stiffness_matrix(*mesh.element_size)
+            entries = mesh.n_elements * ke.size
+            scale = np.random.default_rng(0).uniform(0.1, 1.0, mesh.n_elements) ** 3
+
+            assembler, t = timed(lambda: StiffnessAssembler(mesh, ke))
+            samples["pattern"].append(t * 1e9 / entries)
+            K, t = timed(lambda: assembler.assemble(scale), 3)
+            samples["assembly"].append(t * 1e9 / entries)
+
+            left = np.flatnonzero(np.isclose(mesh.node_coords[:, 0], 0.0))
+            fixed = (dim * left[:, None] + np.arange(dim)).ravel()
+            F = np.zeros(mesh.n_dofs)
+            F[dim * (mesh.n_nodes - 1) + 1] = -1.0
+            K_ff, _, _ = apply_dirichlet_bcs(K, F, fixed)
+
+            solver = FEASolver("direct", ordering=nested_dissection(mesh))
+            solver.solve(K, F, fixed)
+            dofs.append(K_ff.shape[0])
+            fills.append(solver.last_info["fill_in"] * K_ff.nnz + K_ff.shape[0])
+            seconds.append(solver.last_info["factor_seconds"])
+
+            x = np.ones(mesh.n_dofs)
+            _, t = timed(lambda: K @ x, 5)
+            samples["spmv"].append(t * 1e9 / K.nnz)
+            _, t = timed(lambda: x * 2.0 + x, 20)
+            samples["vector"].append(t * 1e9 / mesh.n_dofs)
+            op = MatrixFreeStiffness(mesh, ke, scale)
+            _, t = timed(lambda: op.matvec(x), 3)
+            per_entry.append(t * 1e9 / entries)
+
+            if dim == 2:
+                solver = FEASolver("cg")
+                solver.solve(K, F, fixed)
+                samples["cg"].append(solver.last_info["iterations"] / max(shape))
+
+        lu_fill[dim] = _power_fit(dofs, fills)
+        lu_seconds[dim] = _power_fit(dofs, seconds)
+        element_ns[dim] = float(np.median(per_entry))
+
+    cal.lu_fill = lu_fill
+    cal.lu_seconds = lu_seconds
+    cal.element_ns_per_entry = element_ns
+    cal.spmv_ns_per_nnz = float(np.median(samples["spmv"]))
+    # A CG iteration makes ~6 vector passes (axpys, dots, preconditioner).
+    cal.vector_ns_per_dof = 6.0 * float(np.median(samples["vector"]))
+    cal.pattern_ns_per_entry = float(np.median(samples["pattern"]))
+    cal.assembly_ns_per_entry = float(np.median(samples["assembly"]))
+    cal.cg_iterations_per_edge = float(np.max(samples["cg"]))
+    return cal
+
+
+def _power_fit(x, y) -> tuple[float, float]:
+    """Least-squares fit of y = a * x**b on a log-log scale."""
+    b, log_a = np.polyfit(np.log(np.asarray(x, float)), np.log(np.asarray(y, float)), 1)
+    return float(np.exp(log_a)), float(b)
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+
+PRECISIONS = ("double", "mixed", "single")
+
+
+@dataclass(frozen=True)
+class Precision:
+    """Floating-point policy of a run.
+
+    - double: everything in float64.
+    - mixed: density and per-element result fields, the preconditioner and
+      the LU factors in float32; the stiffness operator, Krylov vectors,
+      residuals and displacements in float64, with iterative refinement
+      on top of float32 factorizations.
+    - single: everything in float32, with a looser attainable tolerance.
+
+    The stiffness operator stays float64 in mixed mode on purpose: rounding
+    K or K_e entries breaks their rigid-body null space, and the resulting
+    compliance error grows with the condition number (percent level for
+    graded SIMP designs), while rounding densities only perturbs each
+    element modulus by ~1e-7.
+    """
+
+    name: str
+
+    def __post_init__(self):
+        if self.name not in PRECISIONS:
+            raise ValueError(
+                f"Unsupported precision: {self.name} (expected one of {', '.join(PRECISIONS)})"
+            )
+
+    @property
+    def storage(self) -> np.dtype:
+        """Dtype of factorizations, preconditioners and density/result fields."""
+        return np.dtype(np.float64 if self.name == "double" else np.float32)
+
+    @property
+    def solve(self) -> np.dtype:
+        """Dtype of stiffness operators, forces, residuals and displacements."""
+        return np.dtype(np.float32 if self.name == "single" else np.float64)
+
+    @property
+    def refine(self) -> bool:
+        """True when low-precision solves are corrected by float64 residuals."""
+        return self.name == "mixed"
+
+
+def get_precision(precision: str | Precision = "double") -> Precision:
+    """Return a `Precision` from its name (instances pass through)."""
+    if isinstance(precision, Precision):
+        return precision
+    return Precision(str(precision).lower())
+
+
+def precision_from_config(config) -> Precision:
+    """Return the `precision` config key (default `double`) as a `Precision`."""
+    return get_precision(config.get("precision", "double"))
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import numpy as np
+
+from fglopt.mesh.domain_mesh import DomainMesh, DomainMesh3D
+
+
+AXES = "xyz"
+
+
+def _grid_shape(mesh) -> tuple[int, ...]:
+    """Element counts per axis of a structured mesh."""
+    return (mesh.nx, mesh.ny) if mesh.dim == 2 else (mesh.nx, mesh.ny, mesh.nz)
+
+
+def _grid_index(shape: tuple[int, ...]) -> np.ndarray:
+    """Return (prod(shape), dim) grid indices in x-fastest flat order."""
+    flat = np.arange(int(np.prod(shape)))
+    return np.column_stack(np.unravel_index(flat, shape[::-1])[::-1])
+
+
+def _flat_index(index: np.ndarray, shape: tuple[int, ...]) -> np.ndarray:
+    return np.ravel_multi_index(index.T[::-1], shape[::-1])
+
+
+def _mirror_nodes(mesh, axis: int) -> np.ndarray:
+    """Return the node permutation of the mirror x_axis -> L_axis - x_axis."""
+    node_shape = tuple(n + 1 for n in _grid_shape(mesh))
+    index = _grid_index(node_shape)
+    index[:, axis] = node_shape[axis] - 1 - index[:, axis]
+    return _flat_index(index, node_shape)
+
+
+def is_mirror_symmetric(mesh, force: np.ndarray, fixed_dofs: np.ndarray, axis: int) -> bool:
+    """Return True if supports and loads are symmetric about the `axis` midplane.
+
+    The mirror maps node n to m(n) and flips the `axis` component, so the
+    check is F[m(n)] = S F[n] with S = diag(..., -1, ...) and a mirrored
+    fixed-DOF set. Loads on the plane itself must have no normal component.
+    """
+    dim = mesh.dofs_per_node
+    mirror = _mirror_nodes(mesh, axis)
+    sign = np.ones(dim)
+    sign[axis] = -1.0
+
+    F = np.asarray(force, dtype=np.float64).reshape(-1, dim)
+    scale = max(float(np.abs(F).max(initial=0.0)), 1e-300)
+    if not np.allclose(F[mirror] * sign, F, rtol=0.0, atol=1e-12 * scale):
+        return False
+
+    fixed = np.zeros(mesh.n_dofs, dtype=bool)
+    fixed[np.asarray(fixed_dofs, dtype=np.int64)] = True
+    fixed = fixed.reshape(-1, dim)
+    return bool(np.array_equal(fixed[mirror], fixed))
+
+
+def detect_symmetry(mesh, force: np.ndarray, fixed_dofs: np.ndarray) -> tuple[int, ...]:
+    """Return the axes whose midplane is a symmetry plane of the load case.
+
+    Only axes with an even element count qualify, so the midplane lies on
+    element boundaries and the reduced mesh stays structured.
+    """
+    shape = _grid_shape(mesh)
+    return tuple(
+        axis
+        for axis in range(mesh.dim)
+        if shape[axis] % 2 == 0 and is_mirror_symmetric(mesh, force, fixed_dofs, axis)
+    )
+
+
+class SymmetryReduction:
+    """Solve a mirror-symmetric problem on the half (one axis) or quarter mesh.
+
+    The reduced mesh is the low half of the domain along each mirrored axis,
+    so its node coordinates coincide with the full mesh. On each symmetry
+    plane the normal displacement is fixed and loads applied on the plane
+    are halved (the mirror half carries the other half). Fields are mapped
+    back with the mirror: densities are copied and displacements copied
+    with the normal component negated. Full-domain compliance is
+    F_full^T u_full = 2^k * F_red^T u_red for k mirrored axes.
+    """
+
+    def __init__(self, mesh, axes):
+        """
+        Args:
+            mesh: `DomainMesh` or `DomainMesh3D`.
+            axes: mirrored axes as indices (0 = x) or letters ("xy").
+        """
+        axes = tuple(sorted({AXES.index(a) if isinstance(a, str) else int(a) for a in axes}))
+        shape = _grid_shape(mesh)
+        for axis in axes:
+            if axis >= mesh.dim:
+                raise ValueError(f"Invalid symmetry axis for a {mesh.dim}D mesh: {AXES[axis]}")
+            if shape[axis] % 2:
+                raise ValueError(
+                    f"{AXES[axis]}-symmetry needs an even element count along {AXES[axis]} "
+                    f"(got {shape[axis]})."
+                )
+
+        self.mesh = mesh
+        self.axes = axes
+        self.dim = mesh.dim
+
+        lengths = (mesh.lx, mesh.ly, getattr(mesh, "lz", 1.0))[: mesh.dim]
+        red_shape = tuple(n // 2 if a in axes else n for a, n in enumerate(shape))
+        red_lengths = tuple(l / 2 if a in axes else l for a, l in enumerate(lengths))
+        if mesh.dim == 2:
+            self.reduced_mesh = DomainMesh(*red_shape, *red_lengths, dtype=mesh.dtype)
+        else:
+            self.reduced_mesh = DomainMesh3D(*red_shape, *red_lengths, dtype=mesh.dtype)
+
+        node_shape = tuple(n + 1 for n in shape)
+        red_node_shape = tuple(n + 1 for n in red_shape)
+
+        # Full node -> reduced node, and the displacement sign per component.
+        index = _grid_index(node_shape)
+        self.sign = np.ones((index.shape[0], self.dim))
+        for axis in axes:
+            upper = index[:, axis] > red_shape[axis]
+            index[upper, axis] = shape[axis] - index[upper, axis]
+            self.sign[upper, axis] = -1.0
+        self.node_map = _flat_index(index, red_node_shape)
+
+        # Reduced node -> full node (same grid index) and symmetry-plane masks.
+        red_index = _grid_index(red_node_shape)
+        self.kept_nodes = _flat_index(red_index, node_shape)
+        self.plane_nodes = {axis: red_index[:, axis] == red_shape[axis] for axis in axes}
+
+        # Full element -> reduced element.
+        elem_index = _grid_index(shape)
+        for axis in axes:
+            upper = elem_index[:, axis] >= red_shape[axis]
+            elem_index[upper, axis] = shape[axis] - 1 - elem_index[upper, axis]
+        self.element_map = _flat_index(elem_index, red_shape)
+
+    @property
+    def fraction(self) -> float:
+        """Reduced / full domain size (1/2 or 1/4; 1/8 in 3D)."""
+        return 0.5 ** len(self.axes)
+
+    @property
+    def label(self) -> str:
+        return "".join(AXES[a] for a in self.axes)
+
+    def reduce_force(self, force: np.ndarray) -> np.ndarray:
+        """Restrict a full force vector, halving loads on symmetry planes."""
+        F = np.asarray(force).reshape(-1, self.dim)[self.kept_nodes].copy()
+        for axis, on_plane in self.plane_nodes.items():
+            F[on_plane] *= 0.5
+        return F.ravel()
+
+    def reduce_constraints(self, fixed_dofs: np.ndarray) -> np.ndarray:
+        """Restrict fixed DOFs and add the normal constraint on each plane."""
+        fixed = np.zeros(self.mesh.n_dofs, dtype=bool)
+        fixed[np.asarray(fixed_dofs, dtype=np.int64)] = True
+        fixed = fixed.reshape(-1, self.dim)[self.kept_nodes]
+        for axis, on_plane in self.plane_nodes.items():
+            fixed[on_plane, axis] = True
+        return np.flatnonzero(fixed.ravel())
+
+    def expand_displacement(self, u: np.ndarray) -> np.ndarray:
+        """Mirror a reduced displacement vector onto the full mesh."""
+        u = np.asarray(u).reshape(-1, self.dim)
+        return (u[self.node_map] * self.sign.astype(u.dtype)).ravel()
+
+    def expand_density(self, density: np.ndarray) -> np.ndarray:
+        """Mirror a reduced element field onto the full mesh."""
+        return np.asarray(density)[self.element_map]
+
+
+def symmetry_from_config(config, mesh, force: np.ndarray, fixed_dofs: np.ndarray):
+    """Return a `SymmetryReduction` for the `symmetry` key, or None.
+
+    `symmetry: none` (default) solves the full domain; `auto` uses every
+    detected symmetry plane; `x`, `y` or `xy` (`z` in 3D) declare planes,
+    which are validated against the supports and loads.
+    """
+    setting = str(config.get("symmetry", "none") or "none").lower()
+    if setting == "none":
+        return None
+    if setting == "auto":
+        axes = detect_symmetry(mesh, force, fixed_dofs)
+    else:
+        if any(c not in AXES[: mesh.dim] for c in setting):
+            raise ValueError(f"Unsupported symmetry setting: {setting}")
+        axes = tuple(AXES.index(c) for c in setting)
+        for axis in axes:
+            if not is_mirror_symmetric(mesh, force, fixed_dofs, axis):
+                raise ValueError(
+                    f"Declared {AXES[axis]}-symmetry does not hold for the configured "
+                    "supports and loads."
+                )
+    return SymmetryReduction(mesh, axes) if axes else None
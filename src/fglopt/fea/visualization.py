@@ -23,11 +23,19 @@ def visualize_boundary_conditions(
 ) -> str | Path | None:
     """Overlay fixed supports and loads on top of the mesh visualization.
 
+    3D meshes are drawn on a 3D axis with 3D load arrows.
+
     Returns the artifact path when saved in headless mode, otherwise None.
     """
+    is_3d = getattr(mesh, "dim", 2) == 3
+
     created_fig = False
     if ax is None:
-        fig, ax = plt.subplots()
+        if is_3d:
+            fig = plt.figure()
+            ax = fig.add_subplot(projection="3d")
+        else:
+            fig, ax = plt.subplots()
         created_fig = True
     else:
         fig = ax.figure
@@ -43,8 +51,7 @@ def visualize_boundary_conditions(
         node_ids = sorted(constrained_nodes)
         coords = mesh.node_coords[node_ids]
         ax.scatter(
-            coords[:, 0],
-            coords[:, 1],
+            *coords.T,
             marker="s",
             c="tab:blue",
             s=36,
@@ -53,13 +60,11 @@ def visualize_boundary_conditions(
         )
 
     # Plot loads as quiver arrows.
-    load_xs: list[float] = []
-    load_ys: list[float] = []
-    load_us: list[float] = []
-    load_vs: list[float] = []
+    load_points: list[tuple[float, ...]] = []
+    load_vectors: list[list[float]] = []
 
     for load in bc_manager._loads:
-        direction = bc_manager._normalize_dof(load.get("direction"))
+        direction = bc_manager._normalize_dof(load.get("direction"), mesh)
         magnitude = float(load.get("magnitude", 0.0))
         nodes = bc_manager._resolve_nodes(mesh, load)
         if not nodes:
@@ -69,23 +74,26 @@ def visualize_boundary_conditions(
         if load.get("type", "point") == "edge":
             nodal_magnitude = magnitude / len(nodes)
 
+        axis = bc_manager._DOF_INDEX[direction]
         for node in nodes:
-            x, y = mesh.get_node_position(int(node))
-            load_xs.append(x)
-            load_ys.append(y)
-            if direction == "x":
-                load_us.append(nodal_magnitude)
-                load_vs.append(0.0)
-            else:
-                load_us.append(0.0)
-                load_vs.append(nodal_magnitude)
-
-    if load_xs:
+            vector = [0.0] * len(mesh.node_coords[0])
+            vector[axis] = nodal_magnitude
+            load_points.append(mesh.get_node_position(int(node)))
+            load_vectors.append(vector)
+
+    if load_points and is_3d:
+        ax.quiver(
+            *zip(*load_points),
+            *zip(*load_vectors),
+            length=0.15 * max(mesh.lx, mesh.ly, mesh.lz),
+            normalize=True,
+            color="tab:red",
+            label="loads",
+        )
+    elif load_points:
         ax.quiver(
-            load_xs,
-            load_ys,
-            load_us,
-            load_vs,
+            *zip(*load_points),
+            *zip(*load_vectors),
             angles="xy",
             scale_units="xy",
             scale=1,
@@ -94,7 +102,7 @@ def visualize_boundary_conditions(
             zorder=4,
         )
 
-    if constrained_nodes or load_xs:
+    if constrained_nodes or load_points:
         ax.legend(loc="best")
 
     if show and _has_gui_backend() and created_fig:
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+
+from fglopt.lattice.stl_export import STLWriteStats, StreamingSTLWriter
+from fglopt.lattice.unit_cells import (
+    CELL_TYPES,
+    solid_cell_triangles,
+    unit_cell_triangles,
+)
+
+
+class LatticeGenerator:
+    """Map a per-element density field to a graded unit-cell lattice.
+
+    Each mesh element becomes one unit cell scaled to the element size.
+    Densities are quantized to `n_levels` levels; the geometry of each
+    level is generated once (and cached across runs), and the part is
+    assembled by broadcasting each level's cell triangles over the
+    origins of all elements at that level. No per-cell Python code runs.
+
+    Level 0 is void (no geometry). Levels at or above `solid_threshold`
+    are emitted as solid boxes. 2D meshes are extruded one cell deep.
+    """
+
+    def __init__(
+        self,
+        cell_type: str = "bcc",
+        n_levels: int = 8,
+        solid_threshold: float = 0.9,
+        resolution: int = 8,
+        n_sides: int = 6,
+        cell_depth: float | None = None,
+    ):
+        """
+        Args:
+            cell_type: unit cell family (`bcc`, `octet` or `gyroid`).
+            n_levels: number of non-void density levels.
+            solid_threshold: level density from which cells are fully solid.
+            resolution: marching grid resolution for sheet cells.
+            n_sides: polygon sides of strut prisms.
+            cell_depth: z size of cells for 2D meshes (default: min(dx, dy)).
+        """
+        if cell_type not in CELL_TYPES:
+            raise ValueError(f"Unsupported lattice cell type: {cell_type}")
+        if n_levels < 1:
+            raise ValueError(f"n_levels must be at least 1: {n_levels}")
+        self.cell_type = cell_type
+        self.n_levels = int(n_levels)
+        self.solid_threshold = float(solid_threshold)
+        self.resolution = int(resolution)
+        self.n_sides = int(n_sides)
+        self.cell_depth = cell_depth
+
+        self.triangles: np.ndarray | None = None
+        self._source = None
+
+    @property
+    def level_densities(self) -> np.ndarray:
+        """Relative density represented by each level (index 0 is void)."""
+        return np.arange(self.n_levels + 1) / self.n_levels
+
+    def quantize(self, density: np.ndarray) -> np.ndarray:
+        """Return the nearest level index (0..n_levels) for each element."""
+        density = np.clip(np.asarray(density, dtype=float), 0.0, 1.0)
+        return np.rint(density * self.n_levels).astype(np.int16)
+
+    def cell_triangles(self, level: int) -> np.ndarray:
+        """Return the unit-cube triangles of one level (empty for void)."""
+        rho = self.level_densities[level]
+        if level == 0:
+            return np.empty((0, 3, 3), dtype=np.float32)
+        if rho >= self.solid_threshold:
+            return solid_cell_triangles()
+        return unit_cell_triangles(
+            self.cell_type, float(rho), self.resolution, self.n_sides
+        )
+
+    def _cell_frames(self, mesh) -> tuple[np.ndarray, np.ndarray]:
+        """Return (n_elems, 3) cell origins and the (3,) cell size."""
+        origins = mesh.node_coords[mesh.element_nodes[:, 0]]
+        size = list(mesh.element_size)
+        if origins.shape[1] == 2:
+            origins = np.column_stack((origins, np.zeros(origins.shape[0])))
+            size.append(self.cell_depth or min(size))
+        return origins.astype(np.float32), np.array(size, dtype=np.float32)
+
+    def iter_triangles(self, mesh, density: np.ndarray, max_triangles: int = 1 << 20):
+        """Yield (n, 3, 3) float32 triangle chunks of the graded lattice.
+
+        Each chunk holds at most `max_triangles` triangles (or one cell when
+        a single cell is larger), so callers can stream huge parts.
+        """
+        density = np.asarray(density).ravel()
+        if density.shape[0] != mesh.n_elements:
+            raise ValueError(
+                f"Expected {mesh.n_elements} element densities, got {density.shape[0]}."
+            )
+
+        levels = self.quantize(density)
+        origins, size = self._cell_frames(mesh)
+
+        for level in np.unique(levels):
+            cell = self.cell_triangles(int(level))
+            if cell.shape[0] == 0:
+                continue
+            scaled = cell * size
+            level_origins = origins[levels == level]
+            per_chunk = max(1, max_triangles // cell.shape[0])
+            for start in range(0, level_origins.shape[0], per_chunk):
+                block = level_origins[start : start + per_chunk]
+                tri = scaled[None, :, :, :] + block[:, None, None, :]
+                yield tri.reshape(-1, 3, 3)
+
+    def generate(self, mesh, density: np.ndarray) -> np.ndarray:
+        """Build the full lattice and return its (n, 3, 3) float32 triangles.
+
+        This holds the whole part in memory; use `export_stl` with a mesh and
+        density to stream large parts straight to disk instead.
+        """
+        self._source = (mesh, density)
+        chunks = list(self.iter_triangles(mesh, density))
+        if chunks:
+            self.triangles = np.concatenate(chunks)
+        else:
+            self.triangles = np.empty((0, 3, 3), dtype=np.float32)
+        return self.triangles
+
+    def export_stl(
+        self,
+        path: str | Path,
+        mesh=None,
+        density: np.ndarray | None = None,
+        weld_tolerance: float | None = None,
+        max_triangles: int = 1 << 20,
+        should_stop=None,
+    ) -> STLWriteStats | None:
+        """Stream the lattice to a binary STL file and return write stats.
+
+        Triangles are generated chunk by chunk and written as they are
+        produced, so peak memory is bounded by `max_triangles` regardless of
+        the part size. Without `mesh`/`density` the inputs of the last
+        `generate` call are used. `should_stop()` is polled between chunks;
+        when it returns True the partial file is removed and None returned.
+        """
+        if mesh is None or density is None:
+            if self._source is None:
+                raise RuntimeError("Generate the lattice or pass mesh and density.")
+            mesh, density = self._source
+
+        with StreamingSTLWriter(path, weld_tolerance=weld_tolerance) as writer:
+            for chunk in self.iter_triangles(mesh, density, max_triangles):
+                if should_stop is not None and should_stop():
+                    writer.abort()
+                    return None
+                writer.write(chunk)
+        return writer.stats
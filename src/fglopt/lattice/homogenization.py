@@ -0,0 +1,299 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import scipy.sparse.linalg as spla
+from scipy.interpolate import PchipInterpolator
+
+from fglopt.fea.assembler import StiffnessAssembler
+from fglopt.fea.element import HexElement
+from fglopt.lattice.unit_cells import CELL_TYPES, cell_field
+
+
+def voxelize_cell(cell_type: str, density: float, resolution: int) -> np.ndarray:
+    """Return a (resolution^3,) boolean solid mask of a unit cell.
+
+    Voxels are ordered like `DomainMesh3D` elements (x fastest, then y, z).
+    The threshold is the quantile of the voxel field itself, so the voxel
+    solid fraction matches `density` as closely as the resolution allows;
+    ties at the threshold are all kept so the cell symmetry is preserved.
+    """
+    if density <= 0.0:
+        return np.zeros(resolution**3, dtype=bool)
+    if density >= 1.0:
+        return np.ones(resolution**3, dtype=bool)
+
+    c = (np.arange(resolution) + 0.5) / resolution
+    zz, yy, xx = np.meshgrid(c, c, c, indexing="ij")
+    points = np.column_stack((xx.ravel(), yy.ravel(), zz.ravel()))
+    phi = cell_field(cell_type, points)
+    n_solid = max(1, int(round(density * phi.shape[0])))
+    return phi <= np.partition(phi, n_solid - 1)[n_solid - 1]
+
+
+class _PeriodicCellMesh:
+    """Voxel mesh of the unit cell with periodic node numbering.
+
+    Node (i, j, k) and node (i + r, j, k) are the same DOFs, so the
+    assembled stiffness is periodic by construction. Duck-types the mesh
+    attributes used by `StiffnessAssembler`.
+    """
+
+    dofs_per_node = 3
+
+    def __init__(self, resolution: int):
+        r = resolution
+        self.n_nodes = r**3
+        self.n_dofs = 3 * self.n_nodes
+
+        ez, ey, ex = np.meshgrid(np.arange(r), np.arange(r), np.arange(r), indexing="ij")
+        corners = [(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0),
+                   (0, 0, 1), (1, 0, 1), (1, 1, 1), (0, 1, 1)]
+        nodes = [
+            (((ez + dz) % r) * r * r + ((ey + dy) % r) * r + (ex + dx) % r).ravel()
+            for dx, dy, dz in corners
+        ]
+        self.element_nodes = np.column_stack(nodes).astype(np.int32)
+        self.element_size = (1.0 / r,) * 3
+
+
+def _unit_strain_displacements(h: float) -> np.ndarray:
+    """Return (24, 6) local nodal displacements of the six unit macro strains.
+
+    Strain order matches `HexElement`: [exx, eyy, ezz, gyz, gxz, gxy], with
+    engineering shear strains split symmetrically between both components.
+    """
+    corners = h * np.array(
+        [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0],
+         [0, 0, 1], [1, 0, 1], [1, 1, 1], [0, 1, 1]], dtype=float
+    )
+    u0 = np.zeros((8, 3, 6))
+    pairs = {3: (1, 2), 4: (0, 2), 5: (0, 1)}
+    for case in range(6):
+        eps = np.zeros((3, 3))
+        if case < 3:
+            eps[case, case] = 1.0
+        else:
+            i, j = pairs[case]
+            eps[i, j] = eps[j, i] = 0.5
+        u0[:, :, case] = corners @ eps.T
+    return u0.reshape(24, 6)
+
+
+def homogenize_voxels(
+    solid: np.ndarray, E: float = 1.0, nu: float = 0.3, void_ratio: float = 1e-6
+) -> np.ndarray:
+    """Return the 6x6 effective elasticity tensor of a periodic voxel cell.
+
+    Solves the six periodic cell problems K chi = -sum_e K_e u0_e for the unit
+    macro strains and averages the element energies of (u0 + chi) over the
+    unit volume. Void voxels get `void_ratio` times the solid stiffness.
+
+    Nodes touched only by void voxels keep zero fluctuation and are dropped
+    from the solve; their energy contribution is O(void_ratio) and the
+    reduced system factorizes an order of magnitude faster.
+    """
+    resolution = round(solid.shape[0] ** (1.0 / 3.0))
+    mesh = _PeriodicCellMesh(resolution)
+    h = mesh.element_size[0]
+
+    ke = HexElement(E, nu).stiffness_matrix(h, h, h)
+    scale = np.where(solid, 1.0, void_ratio)
+    assembler = StiffnessAssembler(mesh, ke)
+    K = assembler.assemble(scale)
+
+    u0 = _unit_strain_displacements(h)
+    fe = -(ke @ u0)  # (24, 6), identical for every element up to its scale
+    edofs = assembler.edofs
+    rhs = np.zeros((mesh.n_dofs, 6))
+    for case in range(6):
+        rhs[:, case] = np.bincount(
+            edofs.ravel(),
+            weights=(scale[:, None] * fe[None, :, case]).ravel(),
+            minlength=mesh.n_dofs,
+        )
+
+    touched = np.zeros(mesh.n_nodes, dtype=bool)
+    touched[mesh.element_nodes[solid].ravel()] = True
+    if touched.all():
+        # Fully solid: remove rigid translations by pinning node 0.
+        touched[0] = False
+    free = np.flatnonzero(np.repeat(touched, 3))
+
+    chi = np.zeros_like(rhs)
+    if free.size:
+        lu = spla.splu(
+            K[free][:, free].tocsc(),
+            permc_spec="MMD_AT_PLUS_A",
+            diag_pivot_thresh=0.0,
+            options={"SymmetricMode": True},
+        )
+        chi[free] = lu.solve(rhs[free])
+
+    ue = chi[edofs] + u0[None]  # (n_elems, 24, 6)
+    energy = np.einsum("eai,ab,ebj->eij", ue, ke, ue, optimize=True)
+    return np.einsum("e,eij->ij", scale, energy)
+
+
+def effective_modulus(tensors: np.ndarray) -> np.ndarray:
+    """Return the mean axial Young's modulus 1/S_ii (i = x, y, z) of tensors."""
+    compliance = np.linalg.inv(tensors)
+    diag = np.diagonal(compliance, axis1=-2, axis2=-1)[..., :3]
+    return (1.0 / diag).mean(axis=-1)
+
+
+class HomogenizationTable:
+    """Effective elasticity tensors per unit cell over a density grid.
+
+    Each cell type has its own density axis: the measured solid fraction
+    of the voxelized cells, which can differ slightly from the requested
+    grid at coarse resolutions. Tensors are stored for E = 1, so they scale
+    linearly with the solid modulus; they do depend on the Poisson's ratio
+    they were built with.
+    """
+
+    def __init__(
+        self,
+        densities: dict[str, np.ndarray],
+        tensors: dict[str, np.ndarray],
+        nu: float,
+    ):
+        """
+        Args:
+            densities: cell type -> (n,) strictly increasing densities.
+            tensors: cell type -> (n, 6, 6) effective tensors for E = 1.
+            nu: solid Poisson's ratio used for the table.
+        """
+        self.densities = {k: np.asarray(v, dtype=float) for k, v in densities.items()}
+        self.tensors = {k: np.asarray(v, dtype=float) for k, v in tensors.items()}
+        self.nu = float(nu)
+        self._interpolators: dict[str, tuple[PchipInterpolator, PchipInterpolator]] = {}
+
+    @property
+    def cell_types(self) -> list[str]:
+        return sorted(self.tensors)
+
+    def save(self, path: str | Path) -> Path:
+        """Write the table as a compressed float32 .npz file."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        arrays = {}
+        for cell_type in self.cell_types:
+            arrays[f"densities_{cell_type}"] = self.densities[cell_type].astype(np.float32)
+            arrays[f"tensors_{cell_type}"] = self.tensors[cell_type].astype(np.float32)
+        with open(path, "wb") as f:
+            np.savez_compressed(f, nu=self.nu, **arrays)
+        return path
+
+    @classmethod
+    def load(cls, path: str | Path) -> "HomogenizationTable":
+        """Read a table written by `save`."""
+        densities, tensors = {}, {}
+        with np.load(path) as data:
+            for key in data.files:
+                kind, _, cell_type = key.partition("_")
+                if kind == "densities":
+                    densities[cell_type] = data[key]
+                elif kind == "tensors":
+                    tensors[cell_type] = data[key]
+            nu = float(data["nu"])
+        return cls(densities, tensors, nu)
+
+    def _interpolator(self, cell_type: str) -> tuple[PchipInterpolator, PchipInterpolator]:
+        if cell_type not in self.tensors:
+            raise ValueError(f"Cell type not in homogenization table: {cell_type}")
+        if cell_type not in self._interpolators:
+            interp = PchipInterpolator(
+                self.densities[cell_type], self.tensors[cell_type], axis=0
+            )
+            self._interpolators[cell_type] = (interp, interp.derivative())
+        return self._interpolators[cell_type]
+
+    def interpolate(self, cell_type: str, density: np.ndarray):
+        """Return (tensors, d tensors / d density) for all densities at once.
+
+        Shape-preserving cubic (PCHIP) interpolation keeps the stiffness
+        monotone in density and gives continuous derivatives for the
+        optimizer. Outputs have shape density.shape + (6, 6), for E = 1.
+        Densities outside the tabulated range take the end value, with a
+        zero derivative.
+        """
+        interp, deriv = self._interpolator(cell_type)
+        rho, inside = _clip_to_grid(density, self.densities[cell_type])
+        return interp(rho), deriv(rho) * inside[..., None, None]
+
+    def modulus(self, cell_type: str, density: np.ndarray):
+        """Return (E_eff, dE_eff / d density) relative to the solid modulus.
+
+        E_eff is the mean axial modulus 1/S_ii of the interpolated tensor,
+        normalized so the fully solid cell has E_eff = 1. Densities outside
+        the tabulated range take the end value, with a zero derivative.
+        """
+        if cell_type not in self.tensors:
+            raise ValueError(f"Cell type not in homogenization table: {cell_type}")
+        grid = self.densities[cell_type]
+        key = f"modulus:{cell_type}"
+        if key not in self._interpolators:
+            values = effective_modulus(self.tensors[cell_type])
+            values = values / effective_modulus(_solid_tensor(self.nu))
+            interp = PchipInterpolator(grid, values)
+            self._interpolators[key] = (interp, interp.derivative())
+        interp, deriv = self._interpolators[key]
+        rho, inside = _clip_to_grid(density, grid)
+        return interp(rho), deriv(rho) * inside
+
+
+def _clip_to_grid(density, grid: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Clip densities to the table range; also return the in-range mask."""
+    density = np.asarray(density, dtype=float)
+    rho = np.clip(density, grid[0], grid[-1])
+    return rho, rho == density
+
+
+def _solid_tensor(nu: float) -> np.ndarray:
+    return HexElement(1.0, nu).constitutive_matrix()
+
+
+def build_homogenization_table(
+    cell_types=None,
+    densities=None,
+    resolution: int = 16,
+    nu: float = 0.3,
+    void_ratio: float = 1e-6,
+    progress=None,
+) -> HomogenizationTable:
+    """Compute effective tensors of each unit cell over a density grid.
+
+    This is an offline tool: one periodic FE problem with six load cases is
+    solved per (cell type, density). The result is meant to be saved once
+    and interpolated at run time. Grid points whose voxelization collapses
+    onto an already computed solid fraction are skipped.
+
+    Args:
+        cell_types: cell types to include (default: all supported).
+        densities: requested density grid (default: 0.0, 0.05, ..., 1.0).
+        resolution: voxels per cell edge.
+        nu: solid Poisson's ratio.
+        void_ratio: stiffness ratio assigned to void voxels.
+        progress: optional callable(cell_type, density) called per entry.
+    """
+    cell_types = sorted(CELL_TYPES) if cell_types is None else list(cell_types)
+    densities = np.linspace(0.0, 1.0, 21) if densities is None else np.asarray(densities)
+
+    table_densities, tensors = {}, {}
+    for cell_type in cell_types:
+        entries: dict[float, np.ndarray] = {}
+        for rho in densities:
+            if progress is not None:
+                progress(cell_type, float(rho))
+            solid = voxelize_cell(cell_type, float(rho), resolution)
+            fraction = float(solid.mean())
+            if fraction not in entries:
+                entries[fraction] = homogenize_voxels(solid, 1.0, nu, void_ratio)
+
+        fractions = sorted(entries)
+        table_densities[cell_type] = np.array(fractions)
+        tensors[cell_type] = np.array([entries[f] for f in fractions])
+
+    return HomogenizationTable(table_densities, tensors, nu)
@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+
+STL_RECORD = np.dtype(
+    [
+        ("normal", "<f4", (3,)),
+        ("vertices", "<f4", (3, 3)),
+        ("attribute", "<u2"),
+    ]
+)
+
+_HEADER_BYTES = 80
+
+
+@dataclass
+class STLWriteStats:
+    """Size and timing of a finished STL export."""
+
+    n_triangles: int
+    n_bytes: int
+    seconds: float
+
+    @property
+    def mb_per_s(self) -> float:
+        return self.n_bytes / 1e6 / max(self.seconds, 1e-9)
+
+    @property
+    def triangles_per_s(self) -> float:
+        return self.n_triangles / max(self.seconds, 1e-9)
+
+
+def _fill_records(records: np.ndarray, triangles: np.ndarray) -> None:
+    """Write vertices and unit normals of float32 triangles into records."""
+    records["vertices"] = triangles
+    normals = np.cross(triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0])
+    lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+    np.divide(normals, lengths, out=normals, where=lengths > 0.0)
+    records["normal"] = normals
+
+
+def triangle_records(triangles: np.ndarray) -> np.ndarray:
+    """Pack (n, 3, 3) triangles into binary STL records with unit normals."""
+    triangles = np.asarray(triangles, dtype=np.float32)
+    records = np.zeros(triangles.shape[0], dtype=STL_RECORD)
+    _fill_records(records, triangles)
+    return records
+
+
+def weld_vertices(triangles: np.ndarray, tolerance: float) -> np.ndarray:
+    """Snap vertices closer than `tolerance` together and drop degenerate faces.
+
+    Welding is local to the given chunk: vertices are keyed on a grid of
+    `tolerance` spacing, every vertex is replaced by the first vertex with
+    the same key, and triangles that collapse onto fewer than three distinct
+    vertices are removed.
+    """
+    triangles = np.asarray(triangles, dtype=np.float32)
+    if triangles.shape[0] == 0:
+        return triangles
+
+    vertices = triangles.reshape(-1, 3)
+    keys = np.ascontiguousarray(np.rint(vertices / tolerance).astype(np.int64))
+    _, first, inverse = np.unique(
+        keys.view([("", np.int64)] * 3).ravel(), return_index=True, return_inverse=True
+    )
+    welded = vertices[first][inverse].reshape(-1, 3, 3)
+
+    ids = inverse.reshape(-1, 3)
+    keep = (ids[:, 0] != ids[:, 1]) & (ids[:, 1] != ids[:, 2]) & (ids[:, 0] != ids[:, 2])
+    return welded[keep]
+
+
+class StreamingSTLWriter:
+    """Write a binary STL incrementally from triangle chunks.
+
+    Triangles are packed into a preallocated record buffer and written with
+    one large `write` per `buffer_triangles` records, so memory stays bounded
+    regardless of the part size. The triangle count in the header is written
+    as 0 up front and patched on `close`. If the `with` block raises, the
+    partial file is removed instead, so a failed export never leaves a
+    truncated STL that looks valid.
+
+    Usage:
+        with StreamingSTLWriter(path) as writer:
+            for chunk in chunks:
+                writer.write(chunk)
+        print(writer.stats.mb_per_s)
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        buffer_triangles: int = 1 << 18,
+        weld_tolerance: float | None = None,
+        header: bytes = b"fglopt",
+    ):
+        """
+        Args:
+            path: output file path.
+            buffer_triangles: records held before each write (50 bytes each).
+            weld_tolerance: if set, weld vertices within each chunk.
+            header: up to 80 bytes of STL header text.
+        """
+        self.path = Path(path)
+        self.weld_tolerance = weld_tolerance
+        self.n_triangles = 0
+        self.stats: STLWriteStats | None = None
+
+        self._buffer = np.zeros(int(buffer_triangles), dtype=STL_RECORD)
+        self._fill = 0
+        self._start = time.perf_counter()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "wb")
+        self._file.write(header[:_HEADER_BYTES].ljust(_HEADER_BYTES, b"\0"))
+        self._file.write(np.uint32(0).tobytes())
+
+    def write(self, triangles: np.ndarray) -> None:
+        """Append an (n, 3, 3) chunk of triangles."""
+        if self._file is None:
+            raise RuntimeError("STL writer is closed.")
+
+        triangles = np.asarray(triangles, dtype=np.float32).reshape(-1, 3, 3)
+        if self.weld_tolerance is not None:
+            triangles = weld_vertices(triangles, self.weld_tolerance)
+
+        capacity = self._buffer.shape[0]
+        start = 0
+        while start < triangles.shape[0]:
+            take = min(triangles.shape[0] - start, capacity - self._fill)
+            _fill_records(
+                self._buffer[self._fill : self._fill + take], triangles[start : start + take]
+            )
+            self._fill += take
+            start += take
+            if self._fill == capacity:
+                self._flush()
+
+        self.n_triangles += triangles.shape[0]
+
+    def _flush(self) -> None:
+        if self._fill:
+            self._file.write(self._buffer[: self._fill].tobytes())
+            self._fill = 0
+
+    def close(self) -> STLWriteStats:
+        """Flush, patch the header triangle count and return write stats."""
+        if self._file is None:
+            return self.stats
+
+        if self.n_triangles > np.iinfo(np.uint32).max:
+            self._file.close()
+            self._file = None
+            raise ValueError(f"Binary STL cannot hold {self.n_triangles} triangles.")
+
+        self._flush()
+        self._file.seek(_HEADER_BYTES)
+        self._file.write(np.uint32(self.n_triangles).tobytes())
+        self._file.close()
+        self._file = None
+
+        self.stats = STLWriteStats(
+            n_triangles=self.n_triangles,
+            n_bytes=_HEADER_BYTES + 4 + STL_RECORD.itemsize * self.n_triangles,
+            seconds=time.perf_counter() - self._start,
+        )
+        return self.stats
+
+    def __enter__(self) -> "StreamingSTLWriter":
+        return self
+
+    def abort(self) -> None:
+        """Close without writing the triangle count and delete the file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self.path.unlink(missing_ok=True)
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None:
+            self.abort()
+        else:
+            self.close()
+
+
+def write_binary_stl(path: str | Path, triangles, header: bytes = b"fglopt", **kwargs) -> Path:
+    """Write a triangle array, or an iterable of triangle chunks, to binary STL.
+
+    Extra keyword arguments are passed to `StreamingSTLWriter`.
+    """
+    if isinstance(triangles, np.ndarray):
+        triangles = [triangles]
+    with StreamingSTLWriter(path, header=header, **kwargs) as writer:
+        for chunk in triangles:
+            writer.write(chunk)
+    return writer.path
+
+
+def read_binary_stl(path: str | Path) -> np.ndarray:
+    """Read a binary STL file and return its (n, 3, 3) float32 triangles."""
+    with open(path, "rb") as f:
+        f.seek(_HEADER_BYTES)
+        count = int(np.frombuffer(f.read(4), dtype="<u4")[0])
+        records = np.fromfile(f, dtype=STL_RECORD, count=count)
+    return records["vertices"].copy()
@@ -0,0 +1,289 @@
+from __future__ import annotations
+
+from functools import lru_cache
+
+import numpy as np
+
+
+# Strut end points in the unit cube [0, 1]^3.
+_CORNERS = np.array(
+    [[x, y, z] for z in (0.0, 1.0) for y in (0.0, 1.0) for x in (0.0, 1.0)]
+)
+_FACE_CENTERS = np.array(
+    [
+        [0.0, 0.5, 0.5],
+        [1.0, 0.5, 0.5],
+        [0.5, 0.0, 0.5],
+        [0.5, 1.0, 0.5],
+        [0.5, 0.5, 0.0],
+        [0.5, 0.5, 1.0],
+    ]
+)
+
+
+def _bcc_struts() -> np.ndarray:
+    """Four body diagonals through the cell center."""
+    return np.array([[_CORNERS[i], _CORNERS[7 - i]] for i in range(4)])
+
+
+def _octet_struts() -> np.ndarray:
+    """Face diagonals (12) plus the inner octahedron edges (12)."""
+    struts = []
+    for axis in range(3):
+        for level in (0.0, 1.0):
+            face = _CORNERS[np.isclose(_CORNERS[:, axis], level)]
+            struts.append([face[0], face[3]])
+            struts.append([face[1], face[2]])
+
+    for i in range(6):
+        for j in range(i + 1, 6):
+            # Opposite face centers (same axis) are not connected.
+            if i // 2 != j // 2:
+                struts.append([_FACE_CENTERS[i], _FACE_CENTERS[j]])
+    return np.array(struts)
+
+
+STRUT_CELLS = {"bcc": _bcc_struts, "octet": _octet_struts}
+SHEET_CELLS = {"gyroid"}
+CELL_TYPES = set(STRUT_CELLS) | SHEET_CELLS
+
+
+def _check_cell_type(cell_type: str) -> None:
+    if cell_type not in CELL_TYPES:
+        raise ValueError(f"Unsupported lattice cell type: {cell_type}")
+
+
+def _gyroid(points: np.ndarray) -> np.ndarray:
+    """Gyroid TPMS value with one period per unit cell."""
+    x, y, z = (2.0 * np.pi * points).T
+    return np.sin(x) * np.cos(y) + np.sin(y) * np.cos(z) + np.sin(z) * np.cos(x)
+
+
+def _strut_distance(points: np.ndarray, struts: np.ndarray) -> np.ndarray:
+    """Distance from each point to the nearest strut axis segment."""
+    a = struts[:, 0]
+    ab = struts[:, 1] - a
+    ap = points[:, None, :] - a[None, :, :]
+    t = np.clip((ap * ab).sum(-1) / (ab * ab).sum(-1), 0.0, 1.0)
+    closest = a[None] + t[..., None] * ab[None]
+    return np.linalg.norm(points[:, None, :] - closest, axis=-1).min(axis=1)
+
+
+def _strut_frame(a: np.ndarray, b: np.ndarray):
+    """Return (unit axis, e1, e2), the orthonormal frame of strut a -> b."""
+    axis = (b - a) / np.linalg.norm(b - a)
+    helper = np.array([1.0, 0.0, 0.0]) if abs(axis[0]) < 0.9 else np.array([0.0, 1.0, 0.0])
+    e1 = np.cross(axis, helper)
+    e1 /= np.linalg.norm(e1)
+    return axis, e1, np.cross(axis, e1)
+
+
+def _prism_field(points: np.ndarray, struts: np.ndarray, n_sides: int) -> np.ndarray:
+    """Field of the emitted strut geometry; inside prism radius r where phi < r.
+
+    Matches `_strut_prisms`: flat-capped regular n-gon prisms with
+    circumradius r. Per strut, phi is the polygon gauge max_k(q . n_k)
+    divided by cos(pi / n) between the end caps and infinite beyond them.
+    """
+    angles = (2.0 * np.arange(n_sides) + 1.0) * np.pi / n_sides
+    phi = np.full(points.shape[0], np.inf)
+    for a, b in struts:
+        axis, e1, e2 = _strut_frame(a, b)
+        q = points - a
+        s = q @ axis
+        normals = np.cos(angles)[:, None] * e1 + np.sin(angles)[:, None] * e2
+        gauge = (q @ normals.T).max(axis=1) / np.cos(np.pi / n_sides)
+        gauge[(s < 0.0) | (s > np.linalg.norm(b - a))] = np.inf
+        np.minimum(phi, gauge, out=phi)
+    return phi
+
+
+def cell_field(cell_type: str, points: np.ndarray) -> np.ndarray:
+    """Return the implicit field phi of a unit cell; solid where phi < t.
+
+    Strut cells use the distance to the strut axes (t is the strut radius);
+    the gyroid uses |f| of the TPMS function (t is the sheet half-thickness).
+    """
+    _check_cell_type(cell_type)
+    if cell_type in STRUT_CELLS:
+        return _strut_distance(points, STRUT_CELLS[cell_type]())
+    return np.abs(_gyroid(points))
+
+
+def _sample_points(log2_count: int) -> np.ndarray:
+    """Scrambled Sobol points in the unit cube.
+
+    A regular grid aliases with struts that run along its diagonals (the
+    BCC diagonals pass through grid points), biasing the density quantile.
+    """
+    from scipy.stats import qmc
+
+    return qmc.Sobol(3, scramble=True, seed=0).random_base2(log2_count)
+
+
+@lru_cache(maxsize=None)
+def _sorted_field_samples(cell_type: str, n_sides: int, log2_count: int = 17) -> np.ndarray:
+    points = _sample_points(log2_count)
+    if cell_type in STRUT_CELLS:
+        return np.sort(_prism_field(points, STRUT_CELLS[cell_type](), n_sides))
+    return np.sort(cell_field(cell_type, points))
+
+
+def thickness_for_density(cell_type: str, density: float, n_sides: int = 6) -> float:
+    """Return the threshold t whose solid region {phi < t} fills `density`.
+
+    Uses the empirical quantile of phi over a dense sample of the unit
+    cell, so strut overlaps at nodes are accounted for exactly. Strut cells
+    are calibrated on the emitted geometry (n-gon prisms, see
+    `_prism_field`), so t is the prism circumradius.
+    """
+    _check_cell_type(cell_type)
+    samples = _sorted_field_samples(cell_type, int(n_sides))
+    return float(np.quantile(samples, float(np.clip(density, 0.0, 1.0))))
+
+
+def _strut_prisms(struts: np.ndarray, radius: float, n_sides: int) -> np.ndarray:
+    """Triangulate each strut as a capped n-sided prism (outward normals)."""
+    angles = 2.0 * np.pi * np.arange(n_sides) / n_sides
+    triangles = []
+    for a, b in struts:
+        _, e1, e2 = _strut_frame(a, b)
+        ring = radius * (np.cos(angles)[:, None] * e1 + np.sin(angles)[:, None] * e2)
+
+        lower = a + ring
+        upper = b + ring
+        nxt = np.roll(np.arange(n_sides), -1)
+        triangles.append(np.stack((lower, lower[nxt], upper[nxt]), axis=1))
+        triangles.append(np.stack((lower, upper[nxt], upper), axis=1))
+        # Caps as fans around the strut end points.
+        triangles.append(np.stack((np.broadcast_to(a, ring.shape), lower[nxt], lower), axis=1))
+        triangles.append(np.stack((np.broadcast_to(b, ring.shape), upper, upper[nxt]), axis=1))
+    return np.concatenate(triangles)
+
+
+# Field value outside the gyroid cell; much larger than ||f| - t| <= 1.5.
+_CAP_VALUE = 1e3
+
+
+# Six tetrahedra sharing the (0, 7) cube diagonal; corner index = x + 2y + 4z.
+_CUBE_TETS = np.array(
+    [[0, 1, 3, 7], [0, 3, 2, 7], [0, 2, 6, 7], [0, 6, 4, 7], [0, 4, 5, 7], [0, 5, 1, 7]]
+)
+
+
+def marching_tetrahedra(values: np.ndarray, spacing: float) -> np.ndarray:
+    """Extract the zero level set of a sampled scalar field as triangles.
+
+    Args:
+        values: (n+1, n+1, n+1) field samples indexed [z, y, x] on the grid
+            with `spacing` between points; the inside is where values < 0.
+        spacing: grid spacing.
+
+    Returns:
+        (n_tri, 3, 3) triangle vertices, oriented with normals pointing
+        toward increasing values.
+    """
+    nz, ny, nx = (s - 1 for s in values.shape)
+    vals = values.ravel()
+    zz, yy, xx = np.meshgrid(
+        np.arange(nz + 1), np.arange(ny + 1), np.arange(nx + 1), indexing="ij"
+    )
+    coords = spacing * np.column_stack((xx.ravel(), yy.ravel(), zz.ravel()))
+
+    cz, cy, cx = np.meshgrid(np.arange(nz), np.arange(ny), np.arange(nx), indexing="ij")
+    base = (cz * (ny + 1) * (nx + 1) + cy * (nx + 1) + cx).ravel()
+    corner_offsets = np.array(
+        [dx + dy * (nx + 1) + dz * (ny + 1) * (nx + 1)
+         for dz in (0, 1) for dy in (0, 1) for dx in (0, 1)]
+    )
+    tets = (base[:, None, None] + corner_offsets[_CUBE_TETS][None]).reshape(-1, 4)
+
+    inside = vals[tets] < 0.0
+    count = inside.sum(axis=1)
+    order = np.argsort(~inside, axis=1, kind="stable")
+    ordered = np.take_along_axis(tets, order, axis=1)
+
+    def edge_point(i, j):
+        gi, gj = vals[i], vals[j]
+        t = (gi / (gi - gj))[:, None]
+        return coords[i] + t * (coords[j] - coords[i])
+
+    triangles = []
+    outward = []
+
+    for n_in in (1, 3):
+        sel = ordered[count == n_in]
+        lone = sel[:, 0] if n_in == 1 else sel[:, 3]
+        others = sel[:, 1:4] if n_in == 1 else sel[:, 0:3]
+        tri = np.stack([edge_point(lone, others[:, k]) for k in range(3)], axis=1)
+        direction = coords[others].mean(axis=1) - coords[lone]
+        triangles.append(tri)
+        outward.append(direction if n_in == 1 else -direction)
+
+    sel = ordered[count == 2]
+    i0, i1, o0, o1 = sel.T
+    quad = np.stack(
+        (edge_point(i0, o0), edge_point(i0, o1), edge_point(i1, o1), edge_point(i1, o0)),
+        axis=1,
+    )
+    direction = coords[sel[:, 2:]].mean(axis=1) - coords[sel[:, :2]].mean(axis=1)
+    triangles += [quad[:, [0, 1, 2]], quad[:, [0, 2, 3]]]
+    outward += [direction, direction]
+
+    tri = np.concatenate(triangles)
+    out = np.concatenate(outward)
+    normals = np.cross(tri[:, 1] - tri[:, 0], tri[:, 2] - tri[:, 0])
+    flip = (normals * out).sum(axis=1) < 0.0
+    tri[flip] = tri[flip][:, [0, 2, 1]]
+    return tri
+
+
+@lru_cache(maxsize=None)
+def unit_cell_triangles(
+    cell_type: str, density: float, resolution: int = 8, n_sides: int = 6
+) -> np.ndarray:
+    """Return the cached float32 triangle soup of one unit cell in [0, 1]^3.
+
+    Args:
+        cell_type: one of `CELL_TYPES`.
+        density: target relative density of the cell.
+        resolution: marching grid points per edge (sheet cells).
+        n_sides: polygon sides of each strut prism (strut cells).
+    """
+    _check_cell_type(cell_type)
+    t = thickness_for_density(cell_type, density, n_sides)
+
+    if cell_type in STRUT_CELLS:
+        tri = _strut_prisms(STRUT_CELLS[cell_type](), t, n_sides)
+    else:
+        c = np.linspace(0.0, 1.0, resolution + 1)
+        zz, yy, xx = np.meshgrid(c, c, c, indexing="ij")
+        points = np.column_stack((xx.ravel(), yy.ravel(), zz.ravel()))
+        f = _gyroid(points).reshape(zz.shape)
+        # Pad with one layer of strongly "outside" samples so the sheet is
+        # capped at the cell faces and every cell is a closed shell; the
+        # caps sit a negligible fraction of a grid step outside the face.
+        h = 1.0 / resolution
+        values = np.pad(np.abs(f) - t, 1, constant_values=_CAP_VALUE)
+        tri = marching_tetrahedra(values, h) - h
+
+    tri = tri.astype(np.float32)
+    tri.flags.writeable = False
+    return tri
+
+
+def solid_cell_triangles() -> np.ndarray:
+    """Return the 12 outward-facing triangles of the unit cube."""
+    c = _CORNERS.astype(np.float32)
+    faces = [
+        (0, 2, 3, 1),  # z = 0
+        (4, 5, 7, 6),  # z = 1
+        (0, 1, 5, 4),  # y = 0
+        (2, 6, 7, 3),  # y = 1
+        (0, 4, 6, 2),  # x = 0
+        (1, 3, 7, 5),  # x = 1
+    ]
+    tri = []
+    for a, b, d, e in faces:
+        tri += [(c[a], c[b], c[d]), (c[a], c[d], c[e])]
+    return np.array(tri, dtype=np.float32)
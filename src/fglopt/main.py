@@ -12,16 +12,32 @@ def _has_gui_backend() -> bool:
     return backend in interactive_backends
 
 
-def plot_mesh_from_config(config: ConfigLoader, output_path: str = "artifacts/mesh.png") -> None:
-    """Plot mesh to screen when GUI backend exists, otherwise save to disk."""
-    from fglopt.mesh.domain_mesh import DomainMesh
+def build_mesh_from_config(config: ConfigLoader):
+    """Build a `DomainMesh`, or a `DomainMesh3D` when `dimension: 3`.
+
+    Node coordinates use the storage dtype of the `precision` key.
+    """
+    from fglopt.fea.precision import precision_from_config
+    from fglopt.mesh.domain_mesh import DomainMesh, DomainMesh3D, mesh_shape_from_config
 
-    nx = config.get("mesh_resolution")
-    ny = config.get("mesh_height", nx)
+    dtype = precision_from_config(config).storage
+
+    shape = mesh_shape_from_config(config)
+    nx, ny = shape[:2]
     lx = config.get("length_x", 1.0)
     ly = config.get("length_y", 1.0)
 
-    mesh = DomainMesh(nx=nx, ny=ny, lx=lx, ly=ly)
+    if len(shape) == 3:
+        nz = shape[2]
+        lz = config.get("length_z", 1.0)
+        return DomainMesh3D(nx=nx, ny=ny, nz=nz, lx=lx, ly=ly, lz=lz, dtype=dtype)
+
+    return DomainMesh(nx=nx, ny=ny, lx=lx, ly=ly, dtype=dtype)
+
+
+def plot_mesh_from_config(config: ConfigLoader, output_path: str = "artifacts/mesh.png") -> None:
+    """Plot mesh to screen when GUI backend exists, otherwise save to disk."""
+    mesh = build_mesh_from_config(config)
 
     if _has_gui_backend():
         mesh.plot(show=True)
@@ -29,91 +45,511 @@ def plot_mesh_from_config(config: ConfigLoader, output_path: str = "artifacts/me
 
     output = Path(output_path)
     output.parent.mkdir(parents=True, exist_ok=True)
-    fig, ax = plt.subplots()
-    mesh.plot(show=False, ax=ax)
+    ax = mesh.plot(show=False)
+    fig = ax.figure
     fig.savefig(output)
     plt.close(fig)
     print(f"Saved mesh plot to {output.as_posix()}.")
 
+def _job_line(job) -> str:
+    """One-line job summary for `jobs` and finish notices."""
+    line = f"[{job.id}] {job.name:<20} {job.status:<10} {job.elapsed:8.1f} s"
+    progress = job.progress
+    if progress and "iteration" in progress:
+        line += f"  it {progress['iteration']}  C = {progress['compliance']:.6e}"
+    if job.error is not None:
+        line += f"  error: {job.error}"
+    return line
+
+
 def launch_console():
+    """Interactive console.
+
+    Long-running commands (`run fea`, `run topo-opt`, `export`,
+    `homogenize`) run as background jobs, one at a time in submission
+    order; `jobs`, `status`, `cancel` and `wait` manage them while the
+    console stays usable. Job output is captured and shown by `status` and
+    `wait`.
+    """
+    from fglopt.utils.jobs import JobManager
+
     print("Welcome to the FGL Optimizer console.")
     print("Type 'help' for commands.")
 
     config = None
-    while True:
-        cmd = input("> ").strip()
-        
-        if cmd == "exit":
-            break
-        
-        # Load the configuration files
-        elif cmd.startswith("load"):
-            parts = cmd.split(maxsplit=1)
-            if len(parts) != 2:
-                print('Usage: load <config_file>')
-                continue
-
-            fname = parts[1]
-            try:
-                config = ConfigLoader(fname)
-                print(f'Config loaded from {fname}.')
-                print(f'Loaded keys:')
-                for k, v in config.to_dict().items():
-                    print(f'    {k}: {v}')
-            except Exception as e:
-                print(f'Error loaded config file: {e}')
-                config = None
-
-        elif cmd == "plot mesh":
-            
-            if config is None:
-                print("Load config first.")
-            else:
-                plot_mesh_from_config(config)
+    density = None
+    jobs = JobManager()
+    topo_jobs = {}  # job id -> config the optimization was started with
+
+    def submit(name, fn):
+        job = jobs.submit(name, fn)
+        print(f"Started job {job.id}: {name}")
+        return job
+
+    def collect_finished():
+        nonlocal density
+        for job in jobs.finished():
+            print(_job_line(job))
+            # A cancelled optimization still returns its last completed design.
+            if topo_jobs.pop(job.id, None) is config and job.result is not None:
+                density = job.result
+
+    try:
+        while True:
+            collect_finished()
+            cmd = input("> ").strip()
+
+            if cmd == "exit":
+                break
+
+            # Load the configuration files
+            elif cmd.startswith("load"):
+                parts = cmd.split(maxsplit=1)
+                if len(parts) != 2:
+                    print('Usage: load <config_file>')
+                    continue
+
+                fname = parts[1]
+                try:
+                    config = ConfigLoader(fname)
+                    density = None
+                    print(f'Config loaded from {fname}.')
+                    print(f'Loaded keys:')
+                    for k, v in config.to_dict().items():
+                        print(f'    {k}: {v}')
+                except Exception as e:
+                    print(f'Error loaded config file: {e}')
+                    config = None
+
+            elif cmd == "plot mesh":
+
+                if config is None:
+                    print("Load config first.")
+                else:
+                    plot_mesh_from_config(config)
+
+            elif cmd == "plot bc":
+                if config is None:
+                    print("Load config first.")
+                else:
+                    from fglopt.fea.bc_manager import BCManager
+                    from fglopt.fea.visualization import visualize_boundary_conditions
+
+                    mesh = build_mesh_from_config(config)
+                    bc_manager = BCManager(config)
+                    artifact = visualize_boundary_conditions(bc_manager, mesh, show=True)
+                    if artifact is not None:
+                        print(f"Saved BC plot to {Path(artifact).as_posix()}.")
+
+
+            # Estimate memory and runtime before running
+            elif cmd == "plan":
+                if config is None:
+                    print("Load config first.")
+                else:
+                    try:
+                        plan_job(config)
+                    except Exception as e:
+                        print(f"Planning failed: {e}")
+
+            # Run a single linear static analysis
+            elif cmd == "run fea":
+                if not config:
+                    print("Load config first.")
+                else:
+                    submit(
+                        "run fea",
+                        lambda job, config=config: run_fea(
+                            config, should_stop=job.cancel_requested
+                        ),
+                    )
+
+            # Export the graded lattice
+            elif cmd.split(maxsplit=1)[:1] == ["export"]:
+                parts = cmd.split(maxsplit=1)
+                if len(parts) != 2:
+                    print("Usage: export <file>")
+                elif config is None:
+                    print("Load config first.")
+                else:
+                    def export(job, config=config, path=parts[1], density=density):
+                        return export_lattice(
+                            config, path, density, should_stop=job.cancel_requested
+                        )
+
+                    submit(f"export {parts[1]}", export)
+
+            # Build the lattice homogenization table (offline, slow)
+            elif cmd.split(maxsplit=1)[:1] == ["homogenize"]:
+                parts = cmd.split(maxsplit=1)
+                if len(parts) != 2:
+                    print("Usage: homogenize <file>")
+                elif config is None:
+                    print("Load config first.")
+                else:
+                    submit(
+                        f"homogenize {parts[1]}",
+                        lambda job, config=config, path=parts[1]: homogenize_lattice(
+                            config, path, should_stop=job.cancel_requested
+                        ),
+                    )
+
+            # Run the optimization loop
+            elif cmd == "run topo-opt":
+                if not config:
+                    print("Load config first.")
+                else:
+                    job = submit(
+                        "run topo-opt",
+                        lambda job, config=config: run_toplogy_optimization(
+                            config, callback=job.report, should_stop=job.cancel_requested
+                        ),
+                    )
+                    topo_jobs[job.id] = config
+
+            # Manage background jobs
+            elif cmd == "jobs":
+                if not jobs.jobs:
+                    print("No jobs.")
+                for job in jobs.jobs:
+                    print(_job_line(job))
+
+            elif cmd.split(maxsplit=1)[:1] in (["status"], ["cancel"], ["wait"]):
+                parts = cmd.split()
+                if len(parts) != 2:
+                    print(f"Usage: {parts[0]} <job id>")
+                    continue
+                try:
+                    if parts[0] == "status":
+                        job = jobs.get(parts[1])
+                        print(_job_line(job))
+                        for line in job.output()[-10:]:
+                            print(f"    {line}")
+                    elif parts[0] == "cancel":
+                        job = jobs.cancel(parts[1])
+                        if not job.done:
+                            print(f"Cancelling job {job.id} at its next checkpoint.")
+                    else:
+                        try:
+                            job = jobs.wait(parts[1])
+                        except KeyboardInterrupt:
+                            print("Stopped waiting; the job keeps running.")
+                            continue
+                        for line in job.output():
+                            print(line)
+                except ValueError as e:
+                    print(e)
+
+            # Show the help information
+            elif cmd == "help":
+                print("Commands:")
+                print("  load <file>       Load a YAML config file")
+                print("  plan              Estimate memory/runtime and recommend a solver")
+                print("  run fea           Solve K u = F and report compliance (background)")
+                print("  run topo-opt      Run SIMP topology optimization (background)")
+                print("  plot mesh         Plot the mesh")
+                print("  plot bc           Plot supports and loads")
+                print("  export <file>     Export graded lattice (optimized density if any)")
+                print("  homogenize <file> Build lattice stiffness lookup table (offline)")
+                print("  jobs              List background jobs")
+                print("  status <id>       Show job progress and recent output")
+                print("  cancel <id>       Cancel a job at its next checkpoint")
+                print("  wait <id>         Wait for a job and print its output")
+                print("  exit              Quit (cancels running jobs)")
+
 
-        elif cmd == "plot bc":
-            if config is None:
-                print("Load config first.")
-            else:
-                from fglopt.fea.bc_manager import BCManager
-                from fglopt.fea.visualization import visualize_boundary_conditions
-                from fglopt.mesh.domain_mesh import DomainMesh
-
-                nx = config.get("mesh_resolution")
-                ny = config.get("mesh_height", nx)
-                lx = config.get("length_x", 1.0)
-                ly = config.get("length_y", 1.0)
-
-                mesh = DomainMesh(nx=nx, ny=ny, lx=lx, ly=ly)
-                bc_manager = BCManager(config)
-                artifact = visualize_boundary_conditions(bc_manager, mesh, show=True)
-                if artifact is not None:
-                    print(f"Saved BC plot to {Path(artifact).as_posix()}.")
-
-
-        # Run the optimization loop
-        elif cmd == "run topo-opt":
-            if not config:
-                print("Load config first.")
             else:
-                run_toplogy_optimization(config)
-        
-        # Show the help information
-        elif cmd == "help":
-            print("Commands:")
-            print("  load <file>       Load a YAML config file")
-            print("  run topo-opt      Run topology optimization (stub)")
-            print("  plot mesh         Plot the mesh")
-            print("  plot bc           Plot supports and loads")
-            print("  export <file>     Export lattice to STL (stub)")
-            print("  exit              Quit")
+                print("Unknown command.")
+    finally:
+        running = sum(not job.done for job in jobs.jobs)
+        if running:
+            print(f"Cancelling {running} unfinished job(s); waiting for their next checkpoint.")
+        jobs.shutdown(cancel=True)
+        collect_finished()
+
+
+def _checkpoint(should_stop) -> None:
+    """Raise `JobCancelled` when a console job was cancelled."""
+    if should_stop is not None and should_stop():
+        from fglopt.utils.jobs import JobCancelled
+
+        raise JobCancelled()
+
+
+def _solver_method(config: ConfigLoader) -> str:
+    """Return the configured solver backend (matrix-free for 3D, else direct)."""
+    return config.get("solver", "matrix-free" if config.get("dimension", 2) == 3 else "direct")
+
+
+def plan_job(config: ConfigLoader):
+    """Print problem size and per-backend memory/runtime estimates.
+
+    The recommendation is the fastest solver and precision whose planned
+    peak memory fits `memory_budget` (default: physical memory).
+    """
+    from fglopt.fea.planner import format_bytes, plan_from_config
+
+    plan = plan_from_config(config)
+    budget = "unknown" if plan.budget_bytes is None else format_bytes(plan.budget_bytes)
 
+    print(f"Mesh {' x '.join(map(str, plan.shape))} elements")
+    print(f"  Nodes: {plan.n_nodes}  Elements: {plan.n_elements}  DOFs: {plan.n_dofs}")
+    print(f"  Stiffness nnz: {plan.nnz} ({format_bytes(plan.matrix_bytes)} assembled)")
+    print(f"  Memory budget: {budget}")
+    print(
+        f"  {'solver':<21}{'precision':<10}{'peak memory':>12}{'LU fill':>9}"
+        f"{'setup':>10}{'per iter':>11}  fits"
+    )
+    for est in plan.estimates:
+        fill = f"{est.fill_nnz / plan.nnz:.1f}x" if est.fill_nnz else "-"
+        print(
+            f"  {est.solver:<21}{est.precision:<10}{format_bytes(est.peak_bytes):>12}"
+            f"{fill:>9}{est.setup_seconds:>9.2f}s{est.iteration_seconds:>10.2f}s"
+            f"  {'yes' if est.fits(plan.budget_bytes) else 'no'}"
+        )
 
-        else:
-            print("Unknown command.")
+    best = plan.recommended
+    if best is None:
+        print("No backend fits the memory budget; reduce the mesh resolution.")
+    else:
+        print(f"Recommended: solver: {best.solver}, precision: {best.precision}")
+    return plan
 
 
-def run_toplogy_optimization(config: ConfigLoader):
+def run_fea(config: ConfigLoader, should_stop=None):
+    """Solve the configured linear static problem on the full-density domain.
+
+    The `solver` config key selects the backend: `direct` (2D default),
+    `cg`, `matrix-free` (3D default; CG without an assembled matrix) or
+    `domain-decomposition` (2D; parallel Schwarz-PCG configured by the
+    `domain_decomposition` section: `parts`, `workers`, `overlap`).
+
+    Direct solves use the fill-reducing `ordering` (`nested-dissection`
+    default, `rcm` or `colamd`); see `fglopt.fea.ordering`.
+
+    `precision` (`double` default, `mixed` or `single`) selects the
+    floating-point policy; see `fglopt.fea.precision`. Jobs whose planned
+    peak memory exceeds `memory_budget` are rejected before any allocation.
+
+    `symmetry` (`none` default, `auto`, or declared planes such as `x` or
+    `xy`) solves on the half/quarter domain and mirrors the displacement
+    back; see `fglopt.fea.symmetry`. Stresses are recovered at the Gauss
+    points (`fglopt.fea.postprocessing`) and the peak von Mises stress and
+    strain energy density are reported.
+
+    `should_stop()` is polled after the setup, after assembly and after the
+    solve (used by console job cancellation); a factorization or CG solve
+    in progress runs to completion before the job stops.
+    """
+    import numpy as np
+
+    from fglopt.fea.assembler import MatrixFreeStiffness, StiffnessAssembler
+    from fglopt.fea.bc_manager import BCManager
+    from fglopt.fea.domain_decomposition import DomainDecompositionSolver
+    from fglopt.fea.element import HexElement, Q4Element
+    from fglopt.fea.ordering import ordering_from_config
+    from fglopt.fea.planner import plan_from_config
+    from fglopt.fea.postprocessing import StressRecovery
+    from fglopt.fea.precision import precision_from_config
+    from fglopt.fea.solver import FEASolver, compute_compliance
+    from fglopt.fea.symmetry import symmetry_from_config
+
+    precision = precision_from_config(config)
+    method = _solver_method(config)
+    if method == "domain-decomposition" and precision.name != "double":
+        raise ValueError("The domain-decomposition solver supports double precision only.")
+    plan_from_config(config).check(method, precision.name)
+
+    mesh = build_mesh_from_config(config)
+    E = config.get_nested("material", "E")
+    nu = config.get_nested("material", "nu")
+    element = HexElement(E, nu) if mesh.dim == 3 else Q4Element(E, nu)
+    ke = element.stiffness_matrix(*mesh.element_size)
+
+    bc_manager = BCManager(config)
+    force = bc_manager.build_force_vector(mesh, dtype=precision.solve)
+    fixed = bc_manager.get_constrained_dofs(mesh)
+
+    symmetry = symmetry_from_config(config, mesh, force, fixed)
+    if symmetry is None:
+        solve_mesh, solve_force, solve_fixed = mesh, force, fixed
+    else:
+        solve_mesh = symmetry.reduced_mesh
+        solve_force = symmetry.reduce_force(force)
+        solve_fixed = symmetry.reduce_constraints(fixed)
+
+    tol = config.get("solver_tol", 1e-8)
+    print(
+        f"Solving {mesh.n_dofs} DOFs ({mesh.n_elements} elements) with {method} solver "
+        f"in {precision.name} precision"
+    )
+    if symmetry is not None:
+        print(
+            f"  Symmetry: {symmetry.label} "
+            f"(solving {solve_mesh.n_dofs} DOFs, {symmetry.fraction:g} of the domain)"
+        )
+    _checkpoint(should_stop)
+
+    if method == "matrix-free":
+        K = MatrixFreeStiffness(solve_mesh, ke, dtype=precision.solve)
+        solver = FEASolver("cg", tol=tol, precision=precision)
+        u = solver.solve(K, solve_force, solve_fixed)
+    elif method == "domain-decomposition":
+        dd_cfg = config.get("domain_decomposition", {}) or {}
+        K = StiffnessAssembler(solve_mesh, ke).assemble()
+        _checkpoint(should_stop)
+        with DomainDecompositionSolver(
+            solve_mesh,
+            parts=tuple(dd_cfg.get("parts", (2, 2))),
+            overlap=dd_cfg.get("overlap", 2),
+            n_workers=dd_cfg.get("workers"),
+            tol=tol,
+        ) as solver:
+            u = solver.solve(K, solve_force, solve_fixed)
+    else:
+        K = StiffnessAssembler(solve_mesh, ke, dtype=precision.solve).assemble()
+        ordering = ordering_from_config(config, solve_mesh) if method == "direct" else "colamd"
+        solver = FEASolver(method, tol=tol, precision=precision, ordering=ordering)
+        _checkpoint(should_stop)
+        u = solver.solve(K, solve_force, solve_fixed)
+    _checkpoint(should_stop)
+
+    if symmetry is not None:
+        u = symmetry.expand_displacement(u)
+    u_mag = np.linalg.norm(u.reshape(-1, mesh.dofs_per_node), axis=1)
+
+    print(f"  Compliance: {compute_compliance(force, u):.6e}")
+    print(f"  Max displacement: {u_mag.max():.6e}")
+
+    recovery = StressRecovery(
+        mesh, element, n_threads=config.get("threads"), dtype=precision.storage
+    )
+    try:
+        fields = recovery.evaluate(u)
+    finally:
+        recovery.close()
+    print(f"  Max von Mises stress: {fields.von_mises.max():.6e}")
+    print(f"  Max strain energy density: {fields.strain_energy_density.max():.6e}")
+    if "iterations" in solver.last_info:
+        print(f"  CG iterations: {solver.last_info['iterations']}")
+    if "fill_in" in solver.last_info:
+        print(
+            f"  LU fill-in: {solver.last_info['fill_in']:.1f}x "
+            f"({solver.last_info['ordering']} ordering "
+            f"{solver.last_info['ordering_seconds']:.2f} s, "
+            f"factorization {solver.last_info['factor_seconds']:.2f} s)"
+        )
+    if "refinements" in solver.last_info:
+        print(f"  Refinement steps: {solver.last_info['refinements']}")
+    if "workers" in solver.last_info:
+        print(
+            f"  Subdomains: {solver.last_info['subdomains']} "
+            f"on {solver.last_info['workers']} worker processes"
+        )
+    return u
+
+
+def export_lattice(config: ConfigLoader, output_path: str, density=None, should_stop=None):
+    """Stream the graded lattice for a density field to a binary STL file.
+
+    Lattice options come from the optional `lattice` config section
+    (`cell_type`, `levels`, `weld_tolerance`). Without a density field the
+    domain is filled uniformly at the configured volume fraction.
+    `should_stop()` is polled between STL chunks; a cancelled export
+    removes the partial file and returns None.
+    """
+    import numpy as np
+
+    from fglopt.lattice.generator import LatticeGenerator
+
+    mesh = build_mesh_from_config(config)
+    if density is None:
+        density = np.full(mesh.n_elements, config.get("volume_fraction"))
+
+    lattice_cfg = config.get("lattice", {}) or {}
+    generator = LatticeGenerator(
+        cell_type=lattice_cfg.get("cell_type", "bcc"),
+        n_levels=lattice_cfg.get("levels", 8),
+    )
+    stats = generator.export_stl(
+        output_path,
+        mesh,
+        density,
+        weld_tolerance=lattice_cfg.get("weld_tolerance"),
+        should_stop=should_stop,
+    )
+    if stats is None:
+        print(f"Export cancelled; removed {Path(output_path).as_posix()}")
+        return None
+
+    print(
+        f"Exported {stats.n_triangles} triangles to {Path(output_path).as_posix()} "
+        f"({stats.n_bytes / 1e6:.1f} MB in {stats.seconds:.2f} s)"
+    )
+    print(f"  Throughput: {stats.mb_per_s:.1f} MB/s, {stats.triangles_per_s:.3e} triangles/s")
+    return stats
+
+
+def homogenize_lattice(config: ConfigLoader, output_path: str, should_stop=None):
+    """Compute and save the homogenized stiffness table for all cell types.
+
+    Resolution comes from `lattice.homogenization_resolution` (default 16).
+    Point `lattice.homogenization_table` at the saved file to use it in
+    place of the SIMP power law. `should_stop()` is polled after every
+    cell solve; a cancelled run saves nothing.
+    """
+    import time
+
+    from fglopt.lattice.homogenization import build_homogenization_table
+
+    lattice_cfg = config.get("lattice", {}) or {}
+    resolution = lattice_cfg.get("homogenization_resolution", 16)
+    nu = config.get_nested("material", "nu")
+
+    def progress(cell, rho):
+        print(f"  {cell}: rho = {rho:.2f}")
+        _checkpoint(should_stop)
+
+    start = time.perf_counter()
+    table = build_homogenization_table(
+        resolution=resolution,
+        nu=nu,
+        progress=progress,
+    )
+    path = table.save(output_path)
+    print(
+        f"Saved homogenization table for {', '.join(table.cell_types)} "
+        f"to {path.as_posix()} in {time.perf_counter() - start:.1f} s."
+    )
+    return table
+
+
+def run_toplogy_optimization(config: ConfigLoader, callback=None, should_stop=None):
+    """Run SIMP compliance minimization and return the physical densities.
+
+    `callback(record)` receives every iteration record, with the compliance
+    of the full domain; `should_stop()` is polled between iterations and
+    ends the run on the last completed design (used by console job
+    cancellation). A run cancelled before its first iteration returns None.
+
+    Optional keys: `filter_radius` (elements, default 1.5),
+    `max_iterations` (100), `move_limit` (0.2), `threads` (element kernel
+    threads, default CPU count) and `solver` (`direct`, `cg` or
+    `matrix-free`, as for `run fea`), `precision`, `design_block` (analysis
+    elements per design variable along each axis, default 1) and
+    `symmetry`. With symmetry the loop runs on the reduced mesh and the
+    returned density is mirrored back to the full mesh.
+    """
+    from fglopt.fea.bc_manager import BCManager
+    from fglopt.fea.element import HexElement, Q4Element
+    from fglopt.fea.ordering import ordering_from_config
+    from fglopt.fea.planner import format_bytes, plan_from_config
+    from fglopt.fea.precision import precision_from_config
+    from fglopt.fea.solver import FEASolver
+    from fglopt.fea.symmetry import symmetry_from_config
+    from fglopt.optimization.interpolation import interpolation_from_config
+    from fglopt.optimization.simp import TopologyOptimizer
+
     print("Starting topology optimization")
 
     vf = config.get('volume_fraction')
@@ -125,4 +561,86 @@ def run_toplogy_optimization(config: ConfigLoader):
     print(f"  Mesh resolution: {res}")
     print(f"  Young's modulus: {E:.2}")
     print(f"  Poisson's ratio: {nu}")
-    print("...Optimization not implemented yet (stub)")
+
+    precision = precision_from_config(config)
+    method = _solver_method(config)
+    if method == "domain-decomposition":
+        raise ValueError("Topology optimization supports direct, cg and matrix-free solvers.")
+    estimate = plan_from_config(config, optimization=True).check(method, precision.name)
+    print(f"  Estimated peak memory: {format_bytes(estimate.peak_bytes)}")
+    print(f"  Estimated time per iteration: {estimate.iteration_seconds:.2f} s")
+
+    mesh = build_mesh_from_config(config)
+    element = HexElement(E, nu) if mesh.dim == 3 else Q4Element(E, nu)
+    bc_manager = BCManager(config)
+    force = bc_manager.build_force_vector(mesh, dtype=precision.solve)
+    fixed = bc_manager.get_constrained_dofs(mesh)
+
+    symmetry = symmetry_from_config(config, mesh, force, fixed)
+    if symmetry is not None:
+        print(f"  Symmetry: {symmetry.label} ({symmetry.fraction:g} of the domain)")
+        mesh = symmetry.reduced_mesh
+        force = symmetry.reduce_force(force)
+        fixed = symmetry.reduce_constraints(fixed)
+
+    tol = config.get("solver_tol", 1e-8)
+    matrix_free = method == "matrix-free"
+    if method == "direct":
+        solver = FEASolver(
+            method, tol=tol, precision=precision, ordering=ordering_from_config(config, mesh)
+        )
+    else:
+        solver = FEASolver("cg", tol=tol, precision=precision)
+
+    optimizer = TopologyOptimizer(
+        mesh,
+        element,
+        force,
+        fixed,
+        vf,
+        interpolation=interpolation_from_config(config),
+        filter_radius=config.get("filter_radius", 1.5),
+        move=config.get("move_limit", 0.2),
+        max_iterations=config.get("max_iterations", 100),
+        solver=solver,
+        matrix_free=matrix_free,
+        n_threads=config.get("threads"),
+        precision=precision,
+        mirror_axes=() if symmetry is None else symmetry.axes,
+        design_block=config.get("design_block", 1),
+    )
+    scale = 1.0 if symmetry is None else 1.0 / symmetry.fraction
+
+    stopped = False
+
+    def stop():
+        nonlocal stopped
+        stopped = stopped or (should_stop is not None and should_stop())
+        return stopped
+
+    def report(record):
+        record = dict(record, compliance=scale * record["compliance"])
+        if callback is not None:
+            callback(record)
+        print(
+            f"  it {record['iteration']:4d}  C = {record['compliance']:.6e}  "
+            f"V = {record['volume']:.3f}  change = {record['change']:.4f}"
+        )
+
+    try:
+        density = optimizer.run(callback=report, should_stop=stop)
+    finally:
+        optimizer.close()
+
+    if optimizer.compliance is None:
+        print("Cancelled before the first iteration")
+        return None
+    if stopped:
+        print("Cancelled; keeping the last completed design")
+    print(
+        f"Finished after {len(optimizer.history)} iterations "
+        f"with compliance {scale * optimizer.compliance:.6e}"
+    )
+    if symmetry is not None:
+        density = symmetry.expand_density(density)
+    return density
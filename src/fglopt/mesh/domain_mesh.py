@@ -9,17 +9,24 @@ class DomainMesh:
 
     nx, ny are the number of elements in x and y.
     This creates (nx+1) * (ny+1) nodes on a unit-spaced grid for now.
+    Connectivity is int32; `dtype` sets the coordinate precision.
     """
 
+    dim = 2
+    dofs_per_node = 2
 
-    def __init__(self, nx: int, ny: int, lx: float = 1.0, ly: float = 1.0):
+    def __init__(
+        self, nx: int, ny: int, lx: float = 1.0, ly: float = 1.0, dtype=np.float64
+    ):
         """
         Args:
             nx: number of elements in x-direction
             ny: number of elements in y-direction
             lx: physical length in x (for now just scales coordinates)
             ly: physical length in y
+            dtype: floating dtype of the node coordinates
         """
+        self.dtype = np.dtype(dtype)
         self.nx = nx
         self.ny = ny
         self.lx = lx
@@ -42,6 +49,17 @@ class DomainMesh:
         return self.nx * self.ny
 
 
+    @property
+    def n_dofs(self) -> int:
+        return self.n_nodes * self.dofs_per_node
+
+
+    @property
+    def element_size(self) -> tuple[float, float]:
+        """Return the (dx, dy) edge lengths shared by every element."""
+        return (self.lx / self.nx, self.ly / self.ny)
+
+
     def _generate_nodes(self) -> None:
         """
         Generate node coordinates on a regular grid.
@@ -52,11 +70,10 @@ class DomainMesh:
         xs = np.linspace(0.0, self.lx, self.nx + 1)
         ys = np.linspace(0.0, self.ly, self.ny + 1)
 
-        coords = []
-        for iy in range(self.ny + 1):
-            for ix in range(self.nx + 1):
-                coords.append((xs[ix], ys[iy]))
-        self.node_coords = np.array(coords, dtype=float)
+        yy, xx = np.meshgrid(ys, xs, indexing="ij")
+        self.node_coords = np.column_stack((xx.ravel(), yy.ravel())).astype(
+            self.dtype, copy=False
+        )
 
 
     def _generate_elements(self) -> None:
@@ -67,18 +84,17 @@ class DomainMesh:
         Element local node order: [bottom-left, bottom-right, top-right, top-left]
         stored as global node indices.
         """
-        elems = []
         npx = self.nx + 1  # nodes per row
 
-        for ey in range(self.ny):
-            for ex in range(self.nx):
-                n0 = ey * npx + ex           # bottom-left
-                n1 = ey * npx + (ex + 1)     # bottom-right
-                n2 = (ey + 1) * npx + (ex + 1)  # top-right
-                n3 = (ey + 1) * npx + ex        # top-left
-                elems.append((n0, n1, n2, n3))
+        ey, ex = np.meshgrid(
+            np.arange(self.ny, dtype=np.int32),
+            np.arange(self.nx, dtype=np.int32),
+            indexing="ij",
+        )
+        n0 = (ey * npx + ex).ravel()  # bottom-left
 
-        self.element_nodes = np.array(elems, dtype=int)
+        offsets = np.array([0, 1, npx + 1, npx], dtype=np.int32)
+        self.element_nodes = n0[:, None] + offsets[None, :]
 
 
     def get_node_position(self, node_id: int) -> tuple[float, float]:
@@ -135,3 +151,168 @@ class DomainMesh:
             plt.show()
 
         return ax
+
+
+class DomainMesh3D(DomainMesh):
+    """
+    Structured 3D hexahedral mesh.
+
+    nx, ny, nz are the number of elements in x, y and z.
+    Arrays are generated with vectorized NumPy and int32 connectivity so
+    meshes around 100^3 elements stay within workstation memory.
+    """
+
+    dim = 3
+    dofs_per_node = 3
+
+
+    def __init__(
+        self,
+        nx: int,
+        ny: int,
+        nz: int,
+        lx: float = 1.0,
+        ly: float = 1.0,
+        lz: float = 1.0,
+        dtype=np.float64,
+    ):
+        """
+        Args:
+            nx, ny, nz: number of elements in each direction
+            lx, ly, lz: physical lengths in each direction
+            dtype: floating dtype of the node coordinates
+        """
+        self.nz = nz
+        self.lz = lz
+        super().__init__(nx, ny, lx=lx, ly=ly, dtype=dtype)
+
+
+    @property
+    def n_nodes(self) -> int:
+        return (self.nx + 1) * (self.ny + 1) * (self.nz + 1)
+
+
+    @property
+    def n_elements(self) -> int:
+        return self.nx * self.ny * self.nz
+
+
+    @property
+    def element_size(self) -> tuple[float, float, float]:
+        """Return the (dx, dy, dz) edge lengths shared by every element."""
+        return (self.lx / self.nx, self.ly / self.ny, self.lz / self.nz)
+
+
+    def _generate_nodes(self) -> None:
+        """
+        Generate node coordinates on a regular grid.
+
+        Node ordering: z-slabs of the 2D ordering, e.g.
+        node_id = iz * (nx + 1) * (ny + 1) + iy * (nx + 1) + ix
+        """
+        xs = np.linspace(0.0, self.lx, self.nx + 1)
+        ys = np.linspace(0.0, self.ly, self.ny + 1)
+        zs = np.linspace(0.0, self.lz, self.nz + 1)
+
+        zz, yy, xx = np.meshgrid(zs, ys, xs, indexing="ij")
+        self.node_coords = np.column_stack(
+            (xx.ravel(), yy.ravel(), zz.ravel())
+        ).astype(self.dtype, copy=False)
+
+
+    def _generate_elements(self) -> None:
+        """
+        Generate 8-node hexahedral elements.
+
+        Element ordering: z-slabs of the 2D row-major ordering.
+        Element local node order: the Q4 order [bottom-left, bottom-right,
+        top-right, top-left] on the z-min face, then the same on the z-max face.
+        """
+        npx = self.nx + 1
+        npxy = npx * (self.ny + 1)
+
+        ez, ey, ex = np.meshgrid(
+            np.arange(self.nz, dtype=np.int32),
+            np.arange(self.ny, dtype=np.int32),
+            np.arange(self.nx, dtype=np.int32),
+            indexing="ij",
+        )
+        n0 = (ez * npxy + ey * npx + ex).ravel()
+
+        offsets = np.array(
+            [0, 1, npx + 1, npx, npxy, npxy + 1, npxy + npx + 1, npxy + npx],
+            dtype=np.int32,
+        )
+        self.element_nodes = n0[:, None] + offsets[None, :]
+
+
+    def get_node_position(self, node_id: int) -> tuple[float, float, float]:
+        """Return (x, y, z) coordinates for a node index."""
+        return super().get_node_position(node_id)
+
+
+    def get_element_nodes(self, elem_id: int) -> tuple[int, ...]:
+        """Return the 8 node indices of an element."""
+        return super().get_element_nodes(elem_id)
+
+
+    def plot(self, title: str = None, show: bool = True, ax=None):
+        """
+        Visualize the grid lines on the six outer faces of the 3D mesh.
+
+        Interior lines are skipped so the plot stays readable (and cheap)
+        for large meshes.
+        """
+        from mpl_toolkits.mplot3d.art3d import Line3DCollection
+
+        if self.node_coords is None or self.element_nodes is None:
+            raise RuntimeError("Mesh is not generated.")
+
+        created_fig = False
+        if ax is None:
+            fig = plt.figure()
+            ax = fig.add_subplot(projection="3d")
+            created_fig = True
+
+        xs = np.linspace(0.0, self.lx, self.nx + 1)
+        ys = np.linspace(0.0, self.ly, self.ny + 1)
+        zs = np.linspace(0.0, self.lz, self.nz + 1)
+
+        segments = []
+        for z in (0.0, self.lz):
+            segments += [[(x, 0.0, z), (x, self.ly, z)] for x in xs]
+            segments += [[(0.0, y, z), (self.lx, y, z)] for y in ys]
+        for y in (0.0, self.ly):
+            segments += [[(x, y, 0.0), (x, y, self.lz)] for x in xs]
+            segments += [[(0.0, y, z), (self.lx, y, z)] for z in zs]
+        for x in (0.0, self.lx):
+            segments += [[(x, y, 0.0), (x, y, self.lz)] for y in ys]
+            segments += [[(x, 0.0, z), (x, self.ly, z)] for z in zs]
+
+        ax.add_collection3d(Line3DCollection(segments, colors="k", linewidths=0.5))
+        ax.set_xlim(0.0, self.lx)
+        ax.set_ylim(0.0, self.ly)
+        ax.set_zlim(0.0, self.lz)
+        ax.set_box_aspect((self.lx, self.ly, self.lz))
+        ax.set_xlabel("x")
+        ax.set_ylabel("y")
+        ax.set_zlabel("z")
+
+        if title is None:
+            ax.set_title(f"Mesh: {self.nx} × {self.ny} × {self.nz} elements")
+        else:
+            ax.set_title(title)
+
+        if show and created_fig:
+            plt.show()
+
+        return ax
+
+
+def mesh_shape_from_config(config) -> tuple[int, ...]:
+    """Return the element counts (nx, ny) or (nx, ny, nz) of the config mesh."""
+    nx = config.get("mesh_resolution")
+    ny = config.get("mesh_height", nx)
+    if config.get("dimension", 2) == 3:
+        return (nx, ny, config.get("mesh_depth", nx))
+    return (nx, ny)
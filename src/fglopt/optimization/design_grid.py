@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import numpy as np
+import scipy.sparse as sp
+
+from fglopt.mesh.domain_mesh import DomainMesh, DomainMesh3D
+from fglopt.optimization.filters import _element_grid
+
+
+class DesignGrid:
+    """Coarse design-variable grid mapped onto the analysis mesh.
+
+    One design variable covers a `block`^dim group of analysis elements
+    (edge blocks are partial when the element count is not a multiple of
+    `block`). The projection P (n_elements x n_design, one unit entry per
+    row) is built once; element fields are rho = P x and sensitivities map
+    back as P^T dc. `design_mesh` is a structured mesh with one element per
+    design variable, so filters operate at the design resolution.
+    """
+
+    def __init__(self, mesh, block: int = 2, dtype=np.float64):
+        """
+        Args:
+            mesh: analysis `DomainMesh` or `DomainMesh3D`.
+            block: analysis elements per design variable along each axis.
+            dtype: floating dtype of the projection.
+        """
+        block = int(block)
+        if block < 1:
+            raise ValueError(f"Design block must be a positive integer: {block}")
+        self.block = block
+
+        shape, index = _element_grid(mesh)
+        self.shape = tuple(-(-n // block) for n in shape)
+        cell = np.ravel_multi_index((index // block).T[::-1], self.shape[::-1])
+
+        self.n_design = int(np.prod(self.shape))
+        self.P = sp.csr_matrix(
+            (np.ones(mesh.n_elements, dtype=dtype), (np.arange(mesh.n_elements), cell)),
+            shape=(mesh.n_elements, self.n_design),
+        )
+        self.counts = np.bincount(cell, minlength=self.n_design).astype(dtype)
+
+        size = [h * block * n for h, n in zip(mesh.element_size, self.shape)]
+        if mesh.dim == 2:
+            self.design_mesh = DomainMesh(*self.shape, *size, dtype=mesh.dtype)
+        else:
+            self.design_mesh = DomainMesh3D(*self.shape, *size, dtype=mesh.dtype)
+
+    def project(self, x: np.ndarray) -> np.ndarray:
+        """Map design variables to analysis elements (rho = P x)."""
+        return self.P @ x
+
+    def backward(self, sensitivity: np.ndarray) -> np.ndarray:
+        """Map an element sensitivity to design variables (P^T dc)."""
+        return self.P.T @ sensitivity
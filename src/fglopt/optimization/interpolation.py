@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import numpy as np
+
+
+class SIMPInterpolation:
+    """Modified SIMP modulus scale s(rho) = e_min + rho^p (1 - e_min).
+
+    Calling the object returns (s, ds/drho) for all elements at once, so it
+    can be swapped with `HomogenizedInterpolation` in the optimizer.
+    """
+
+    def __init__(self, penalty: float = 3.0, e_min: float = 1e-9):
+        """
+        Args:
+            penalty: SIMP exponent p.
+            e_min: stiffness ratio of void elements (keeps K non-singular).
+        """
+        self.penalty = float(penalty)
+        self.e_min = float(e_min)
+
+    def __call__(self, density: np.ndarray):
+        rho = np.asarray(density, dtype=float)
+        p = self.penalty
+        values = self.e_min + rho**p * (1.0 - self.e_min)
+        derivatives = p * rho ** (p - 1.0) * (1.0 - self.e_min)
+        return values, derivatives
+
+
+class HomogenizedInterpolation:
+    """Modulus scale from a precomputed lattice homogenization table.
+
+    Replaces the SIMP power law with the effective modulus of the chosen
+    unit cell, interpolated from `HomogenizationTable` values and
+    derivatives. The table is computed offline, so each call only costs a
+    vectorized spline evaluation.
+    """
+
+    def __init__(self, table, cell_type: str, e_min: float = 1e-9):
+        """
+        Args:
+            table: `HomogenizationTable`.
+            cell_type: unit cell used for grading.
+            e_min: lower bound on the stiffness ratio.
+        """
+        if cell_type not in table.tensors:
+            raise ValueError(f"Cell type not in homogenization table: {cell_type}")
+        self.table = table
+        self.cell_type = cell_type
+        self.e_min = float(e_min)
+
+    @classmethod
+    def from_file(cls, path, cell_type: str, e_min: float = 1e-9) -> "HomogenizedInterpolation":
+        from fglopt.lattice.homogenization import HomogenizationTable
+
+        return cls(HomogenizationTable.load(path), cell_type, e_min)
+
+    def __call__(self, density: np.ndarray):
+        values, derivatives = self.table.modulus(self.cell_type, density)
+        return np.maximum(values, self.e_min), derivatives
+
+
+def interpolation_from_config(config):
+    """Return the material interpolation selected by the config.
+
+    Uses `lattice.homogenization_table` (with `lattice.cell_type`) when set,
+    otherwise SIMP with the top-level `penalty` (default 3.0).
+    """
+    lattice_cfg = config.get("lattice", {}) or {}
+    table_path = lattice_cfg.get("homogenization_table")
+    if table_path:
+        return HomogenizedInterpolation.from_file(
+            table_path, lattice_cfg.get("cell_type", "bcc")
+        )
+    return SIMPInterpolation(penalty=config.get("penalty", 3.0))
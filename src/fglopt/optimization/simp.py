@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+import numpy as np
+
+from fglopt.fea.assembler import MatrixFreeStiffness, StiffnessAssembler
+from fglopt.fea.kernels import ElementKernels
+from fglopt.fea.ordering import nested_dissection
+from fglopt.fea.precision import get_precision
+from fglopt.fea.solver import FEASolver, compute_compliance
+from fglopt.optimization.design_grid import DesignGrid
+from fglopt.optimization.filters import DensityFilter
+from fglopt.optimization.interpolation import SIMPInterpolation
+
+# Smallest design-grid filter radius (in design cells) that still mixes
+# neighbouring cells; radii <= 1 make `DensityFilter` the identity.
+MIN_DESIGN_FILTER_RADIUS = 1.5
+
+
+class TopologyOptimizer:
+    """Minimum-compliance SIMP optimization with a volume constraint.
+
+    Each iteration assembles K from the interpolated densities, solves
+    K u = F, evaluates compliance and sensitivities with the threaded
+    `ElementKernels`, filters them with `DensityFilter` and applies an
+    optimality-criteria (OC) update. Per-element work writes into buffers
+    allocated once at construction.
+
+    With `design_block > 1` the design variables live on a coarser
+    `DesignGrid`: filtering and the OC update run at the design resolution,
+    the filtered design is projected onto the analysis elements, and
+    element sensitivities are mapped back through the projection transpose.
+    """
+
+    def __init__(
+        self,
+        mesh,
+        element,
+        force: np.ndarray,
+        fixed_dofs: np.ndarray,
+        volume_fraction: float,
+        interpolation=None,
+        filter_radius: float = 1.5,
+        move: float = 0.2,
+        max_iterations: int = 100,
+        tol: float = 0.01,
+        solver=None,
+        matrix_free: bool = False,
+        n_threads: int | None = None,
+        precision="double",
+        mirror_axes=(),
+        design_block: int = 1,
+    ):
+        """
+        Args:
+            mesh: `DomainMesh` or `DomainMesh3D`.
+            element: `Q4Element` or `HexElement` with the solid material.
+            force: global force vector.
+            fixed_dofs: constrained DOF indices.
+            volume_fraction: allowed material fraction V*.
+            interpolation: callable rho -> (scale, d scale); default SIMP p=3.
+            filter_radius: density filter radius in elements.
+            move: OC move limit.
+            max_iterations: iteration cap.
+            tol: stop when the max density change falls below this.
+            solver: object with `solve(K, F, fixed)`; default direct with a
+                cached nested-dissection ordering, or CG when matrix-free.
+            matrix_free: use `MatrixFreeStiffness` instead of assembling K.
+            n_threads: threads for the element kernels.
+            precision: `double`, `mixed` or `single`; density and
+                sensitivity fields use its storage dtype, K its solve dtype.
+            mirror_axes: symmetry planes on the high side of a reduced mesh
+                (`SymmetryReduction.axes`); the density filter reflects
+                across them.
+            design_block: analysis elements per design variable along each
+                axis; `filter_radius` stays in analysis elements, but is
+                at least `MIN_DESIGN_FILTER_RADIUS` design cells. With
+                `mirror_axes` the mesh must be a whole number of blocks
+                along those axes.
+        """
+        shape = (mesh.nx, mesh.ny) if mesh.dim == 2 else (mesh.nx, mesh.ny, mesh.nz)
+        if any(shape[axis] % design_block for axis in mirror_axes):
+            # A partial edge block would move the mirror plane past the mesh.
+            raise ValueError(
+                "Symmetry planes need a whole number of design blocks "
+                f"along the mirrored axes (design_block={design_block})."
+            )
+        self.mesh = mesh
+        self.force = np.asarray(force, dtype=float)
+        self.fixed_dofs = np.asarray(fixed_dofs)
+        self.volume_fraction = float(volume_fraction)
+        self.interpolation = interpolation or SIMPInterpolation()
+        self.move = float(move)
+        self.max_iterations = int(max_iterations)
+        self.tol = float(tol)
+        self.matrix_free = matrix_free
+        self.precision = get_precision(precision)
+        if solver is None and matrix_free:
+            solver = FEASolver("cg", precision=self.precision)
+        elif solver is None:
+            solver = FEASolver(
+                "direct", precision=self.precision, ordering=nested_dissection(mesh)
+            )
+        self.solver = solver
+
+        dtype = self.precision.storage
+        ke = element.stiffness_matrix(*mesh.element_size)
+        if matrix_free:
+            self.operator = MatrixFreeStiffness(mesh, ke, dtype=self.precision.solve)
+            edofs = self.operator.edofs
+            self.assembler = None
+        else:
+            self.assembler = StiffnessAssembler(mesh, ke, dtype=self.precision.solve)
+            edofs = self.assembler.edofs
+        self.kernels = ElementKernels(edofs, ke, n_threads=n_threads, dtype=dtype)
+
+        n = mesh.n_elements
+        if design_block > 1:
+            self.design = DesignGrid(mesh, design_block, dtype=dtype)
+            self.filter = DensityFilter(
+                self.design.design_mesh,
+                max(filter_radius / design_block, MIN_DESIGN_FILTER_RADIUS),
+                dtype=dtype,
+                mirror_axes=mirror_axes,
+            )
+            self._design_weights = self.design.counts / n
+            n_design = self.design.n_design
+        else:
+            self.design = None
+            self.filter = DensityFilter(
+                mesh, filter_radius, dtype=dtype, mirror_axes=mirror_axes
+            )
+            n_design = n
+
+        self.density = np.full(n_design, self.volume_fraction, dtype=dtype)
+        self.physical_density = self._physical(self.density)
+        self.displacement: np.ndarray | None = None
+        self.compliance: float | None = None
+        self.history: list[dict] = []
+
+        self._energy = np.empty(n, dtype=dtype)
+        self._sensitivity = np.empty(n, dtype=dtype)
+        # The volume sensitivity does not depend on the design.
+        counts = np.ones(n, dtype=dtype) if self.design is None else self.design.counts
+        self._dv = self.filter.backward(counts)
+        self._ratio = np.empty(n_design, dtype=dtype)
+        self._lower = np.empty(n_design, dtype=dtype)
+        self._upper = np.empty(n_design, dtype=dtype)
+        self._next = np.empty(n_design, dtype=dtype)
+
+    def stiffness(self, scale: np.ndarray):
+        """Return K (or the matrix-free operator) for element scales."""
+        if self.matrix_free:
+            self.operator.set_scale(scale)
+            return self.operator
+        return self.assembler.assemble(scale, kernels=self.kernels)
+
+    def _physical(self, x: np.ndarray) -> np.ndarray:
+        """Return analysis-element densities for design variables x."""
+        filtered = self.filter.apply(x)
+        return filtered if self.design is None else self.design.project(filtered)
+
+    def _volume(self, x: np.ndarray) -> float:
+        """Return the analysis-mesh material fraction for design variables x."""
+        filtered = self.filter.apply(x)
+        if self.design is None:
+            return filtered.mean()
+        return filtered @ self._design_weights
+
+    def _oc_update(self, x: np.ndarray, dc: np.ndarray) -> np.ndarray:
+        """Optimality-criteria update with bisection on the volume multiplier.
+
+        The update is written into the preallocated `_next` buffer.
+        """
+        lo, hi = 0.0, 1e9
+        ratio, lower, upper, x_new = self._ratio, self._lower, self._upper, self._next
+        np.negative(dc, out=ratio)
+        np.maximum(ratio, 0.0, out=ratio)
+        ratio /= self._dv
+        np.sqrt(ratio, out=ratio)
+        ratio *= x
+        np.subtract(x, self.move, out=lower)
+        np.maximum(lower, 0.0, out=lower)
+        np.add(x, self.move, out=upper)
+        np.minimum(upper, 1.0, out=upper)
+        while (hi - lo) / (hi + lo + 1e-30) > 1e-4:
+            mid = 0.5 * (lo + hi)
+            np.multiply(ratio, mid**-0.5, out=x_new)
+            np.clip(x_new, lower, upper, out=x_new)
+            if self._volume(x_new) > self.volume_fraction:
+                lo = mid
+            else:
+                hi = mid
+        return x_new
+
+    def step(self) -> dict:
+        """Run one SIMP iteration and return its history record."""
+        scale, d_scale = self.interpolation(self.physical_density)
+        u = self.solver.solve(self.stiffness(scale), self.force, self.fixed_dofs)
+
+        dc = self.kernels.compliance_sensitivity(
+            u, d_scale, out=self._sensitivity, energy=self._energy
+        )
+        compliance = compute_compliance(self.force, u)
+
+        if self.design is not None:
+            dc = self.design.backward(dc)
+        dc = self.filter.backward(dc)
+        x_new = self._oc_update(self.density, dc)
+        delta = np.subtract(x_new, self.density, out=self._ratio)
+        change = float(np.abs(delta, out=delta).max())
+
+        # Swap buffers: the old design becomes the next update's output.
+        self.density, self._next = x_new, self.density
+        self.physical_density = self._physical(x_new)
+        self.displacement = u
+        self.compliance = compliance
+
+        record = {
+            "iteration": len(self.history) + 1,
+            "compliance": compliance,
+            "volume": float(self.physical_density.mean()),
+            "change": change,
+        }
+        self.history.append(record)
+        return record
+
+    def run(self, callback=None, should_stop=None) -> np.ndarray:
+        """Iterate until converged or `max_iterations`; return physical densities.
+
+        Args:
+            callback: optional callable(record) invoked after every iteration.
+            should_stop: optional callable() polled between iterations; when
+                it returns True the loop ends on the last completed step, so
+                density, displacement and history stay consistent.
+        """
+        for _ in range(self.max_iterations):
+            if should_stop is not None and should_stop():
+                break
+            record = self.step()
+            if callback is not None:
+                callback(record)
+            if record["change"] < self.tol:
+                break
+        return self.physical_density
+
+    def close(self) -> None:
+        """Release the kernel thread pool."""
+        self.kernels.close()
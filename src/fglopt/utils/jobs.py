@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+
+
+class JobCancelled(Exception):
+    """Raised by `Job.check` when cancellation was requested."""
+
+
+class Job:
+    """A background command with progress, captured output and a cancel flag.
+
+    The job function receives the `Job` and reports progress with
+    `job.report(record)` (a reference store, cheap enough to call every
+    iteration). Cancellation is cooperative: the function polls
+    `cancel_requested()` at checkpoints, e.g. between optimizer iterations,
+    and either returns early on a consistent state (possibly with a partial
+    result) or raises via `check()`. A job only finishes as `cancelled` if
+    it actually stopped at such a checkpoint; a job that ran to the end is
+    `done` even if cancellation was requested meanwhile.
+    """
+
+    def __init__(self, job_id: int, name: str, log_lines: int = 1000):
+        self.id = job_id
+        self.name = name
+        self.status = "queued"
+        self.progress: dict | None = None
+        self.result = None
+        self.error: BaseException | None = None
+        self.started: float | None = None
+        self.finished: float | None = None
+        self.log: deque[str] = deque(maxlen=log_lines)
+        self._cancel = threading.Event()
+        self._stopped = False
+        self._partial = ""
+        self._future = None
+
+    def report(self, record: dict) -> None:
+        """Publish the latest progress record."""
+        self.progress = record
+
+    def cancel_requested(self) -> bool:
+        """Checkpoint poll; a True answer marks the job as stopping early."""
+        if self._cancel.is_set():
+            self._stopped = True
+            return True
+        return False
+
+    def check(self) -> None:
+        """Checkpoint: raise `JobCancelled` if cancellation was requested."""
+        if self.cancel_requested():
+            raise JobCancelled()
+
+    @property
+    def done(self) -> bool:
+        return self.status in ("done", "failed", "cancelled")
+
+    @property
+    def elapsed(self) -> float:
+        if self.started is None:
+            return 0.0
+        return (self.finished or time.perf_counter()) - self.started
+
+    def write(self, text: str) -> None:
+        """Append printed output, split into lines."""
+        lines = (self._partial + text).split("\n")
+        self._partial = lines.pop()
+        self.log.extend(lines)
+
+    def output(self) -> list[str]:
+        """Return captured output lines, including an unterminated last line."""
+        return list(self.log) + ([self._partial] if self._partial else [])
+
+
+class _RoutedStdout:
+    """sys.stdout proxy that sends writes from job threads to their job log."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.owners: dict[int, Job] = {}
+
+    def write(self, text: str) -> int:
+        job = self.owners.get(threading.get_ident())
+        if job is None:
+            return self.stream.write(text)
+        job.write(text)
+        return len(text)
+
+    def flush(self) -> None:
+        self.stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+
+class JobManager:
+    """Run console commands on background worker threads.
+
+    Jobs run one at a time by default (`max_workers=1`), so later
+    submissions queue behind the running one and the resource plan of each
+    job holds. Worker threads leave the console responsive; the heavy
+    numpy/scipy work releases the GIL. Output printed by a job is captured
+    in its log instead of interleaving with the prompt.
+    """
+
+    def __init__(self, max_workers: int = 1):
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="fglopt-job")
+        self._jobs: dict[int, Job] = {}
+        self._unreported: list[Job] = []
+        self._lock = threading.Lock()
+        self._stdout: _RoutedStdout | None = None
+
+    def submit(self, name: str, fn) -> Job:
+        """Queue fn(job) as a background job and return the job."""
+        if self._stdout is None:
+            self._stdout = _RoutedStdout(sys.stdout)
+            sys.stdout = self._stdout
+        with self._lock:
+            job = Job(len(self._jobs) + 1, name)
+            self._jobs[job.id] = job
+        job._future = self._pool.submit(self._execute, job, fn)
+        return job
+
+    def _execute(self, job: Job, fn) -> None:
+        self._stdout.owners[threading.get_ident()] = job
+        job.started = time.perf_counter()
+        try:
+            job.check()
+            job.status = "running"
+            job.result = fn(job)
+            job.status = "cancelled" if job._stopped else "done"
+        except JobCancelled:
+            job.status = "cancelled"
+        except Exception as e:
+            job.error = e
+            job.status = "failed"
+        finally:
+            job.finished = time.perf_counter()
+            del self._stdout.owners[threading.get_ident()]
+            with self._lock:
+                self._unreported.append(job)
+
+    @property
+    def jobs(self) -> list[Job]:
+        return list(self._jobs.values())
+
+    def get(self, job_id) -> Job:
+        try:
+            return self._jobs[int(job_id)]
+        except (KeyError, ValueError):
+            raise ValueError(f"No job with id {job_id}.") from None
+
+    def cancel(self, job_id) -> Job:
+        """Request cancellation; a queued job is dropped immediately."""
+        job = self.get(job_id)
+        job._cancel.set()
+        if job._future.cancel():
+            job.status = "cancelled"
+            with self._lock:
+                self._unreported.append(job)
+        return job
+
+    def wait(self, job_id, timeout: float | None = None) -> Job:
+        """Block until the job finishes (or `timeout` seconds pass)."""
+        job = self.get(job_id)
+        try:
+            job._future.result(timeout=timeout)
+        except CancelledError:
+            pass
+        return job
+
+    def finished(self) -> list[Job]:
+        """Return jobs that finished since the last call."""
+        with self._lock:
+            jobs, self._unreported = self._unreported, []
+        return jobs
+
+    def shutdown(self, cancel: bool = True) -> None:
+        """Cancel (optionally) and wait for all jobs, then restore stdout."""
+        if cancel:
+            for job in self.jobs:
+                if not job.done:
+                    self.cancel(job.id)
+        self._pool.shutdown(wait=True)
+        if self._stdout is not None and sys.stdout is self._stdout:
+            sys.stdout = self._stdout.stream
+        self._stdout = None
@@ -0,0 +1,68 @@
+import numpy as np
+
+from fglopt.fea.assembler import (
+    MatrixFreeStiffness,
+    StiffnessAssembler,
+    element_dofs,
+    local_to_global_dofs,
+)
+from fglopt.fea.element import HexElement, Q4Element
+from fglopt.mesh.domain_mesh import DomainMesh, DomainMesh3D
+
+
+def _naive_assembly(mesh, ke, scale):
+    K = np.zeros((mesh.n_dofs, mesh.n_dofs))
+    for e in range(mesh.n_elements):
+        dofs = local_to_global_dofs(mesh, e)
+        K[np.ix_(dofs, dofs)] += scale[e] * ke
+    return K
+
+
+def test_element_dofs_follow_interleaved_convention():
+    mesh = DomainMesh(nx=2, ny=1)
+    edofs = element_dofs(mesh)
+
+    assert edofs.dtype == np.int32
+    # Element 0 nodes (0, 1, 4, 3) -> DOFs (0, 1, 2, 3, 8, 9, 6, 7).
+    assert edofs[0].tolist() == [0, 1, 2, 3, 8, 9, 6, 7]
+
+
+def test_cached_pattern_matches_naive_assembly():
+    mesh = DomainMesh(nx=3, ny=2, lx=3.0, ly=1.0)
+    ke = Q4Element(E=1.0, nu=0.3).stiffness_matrix(*mesh.element_size)
+    scale = np.linspace(0.1, 1.0, mesh.n_elements)
+
+    assembler = StiffnessAssembler(mesh, ke)
+    K = assembler.assemble(scale)
+
+    assert K.shape == (mesh.n_dofs, mesh.n_dofs)
+    assert K.indices.dtype == np.int32
+    assert np.allclose(K.toarray(), _naive_assembly(mesh, ke, scale))
+
+    # Re-assembly reuses the pattern.
+    K2 = assembler.assemble(2.0 * scale)
+    assert np.allclose(K2.toarray(), 2.0 * K.toarray())
+
+
+def test_float32_assembly():
+    mesh = DomainMesh3D(nx=2, ny=2, nz=1)
+    ke = HexElement(E=1.0, nu=0.3).stiffness_matrix(*mesh.element_size)
+
+    K64 = StiffnessAssembler(mesh, ke).assemble()
+    K32 = StiffnessAssembler(mesh, ke, dtype=np.float32).assemble()
+
+    assert K32.dtype == np.float32
+    assert np.allclose(K32.toarray(), K64.toarray(), rtol=1e-6, atol=1e-7)
+
+
+def test_matrix_free_matches_assembled():
+    mesh = DomainMesh3D(nx=3, ny=2, nz=2, lx=3.0, ly=2.0, lz=2.0)
+    ke = HexElement(E=1.0, nu=0.3).stiffness_matrix(*mesh.element_size)
+    scale = np.random.default_rng(0).uniform(0.1, 1.0, mesh.n_elements)
+    u = np.random.default_rng(1).standard_normal(mesh.n_dofs)
+
+    K = StiffnessAssembler(mesh, ke).assemble(scale)
+    op = MatrixFreeStiffness(mesh, ke, scale=scale, chunk_size=5)
+
+    assert np.allclose(op @ u, K @ u)
+    assert np.allclose(op.diagonal(), K.diagonal())
@@ -96,3 +96,63 @@ def test_build_force_vector_edge_load_distributes_total_magnitude(tmp_path):
 
     assert np.isclose(force[loaded_dofs].sum(), -9.0)
     assert np.count_nonzero(force) == len(loaded_dofs)
+
+
+def test_face_selectors_use_three_dofs_per_node(tmp_path):
+    from fglopt.mesh.domain_mesh import DomainMesh3D
+
+    config = _write_config(
+        tmp_path,
+        """
+        input_stl: "example.stl"
+        mesh_resolution: 1
+        volume_fraction: 0.4
+        material:
+          E: 210e9
+          nu: 0.3
+        boundary_conditions:
+          fixed:
+            - selector: left_face
+              dofs: ["z"]
+          loads:
+            - type: edge
+              selector: right_face
+              direction: z
+              magnitude: -4.0
+        """,
+    )
+    mesh = DomainMesh3D(nx=1, ny=1, nz=1)
+    bc_manager = BCManager(config)
+
+    # Left-face nodes are [0, 2, 4, 6]; z-DOF = 3 * node + 2.
+    constrained = bc_manager.get_constrained_dofs(mesh)
+    assert np.array_equal(constrained, np.array([2, 8, 14, 20]))
+
+    force = bc_manager.build_force_vector(mesh)
+    assert force.shape == (mesh.n_nodes * 3,)
+    # Right-face nodes are [1, 3, 5, 7].
+    assert np.allclose(force[[5, 11, 17, 23]], -1.0)
+    assert np.count_nonzero(force) == 4
+
+
+def test_z_direction_rejected_for_2d_mesh(tmp_path):
+    import pytest
+
+    config = _write_config(
+        tmp_path,
+        """
+        input_stl: "example.stl"
+        mesh_resolution: 2
+        volume_fraction: 0.4
+        material:
+          E: 210e9
+          nu: 0.3
+        boundary_conditions:
+          fixed:
+            - selector: left_edge
+              dofs: ["z"]
+        """,
+    )
+
+    with pytest.raises(ValueError):
+        BCManager(config).get_constrained_dofs(DomainMesh(nx=2, ny=1))
@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+
+from fglopt.fea.assembler import StiffnessAssembler
+from fglopt.fea.domain_decomposition import (
+    DomainDecompositionSolver,
+    partition_structured_mesh,
+)
+from fglopt.fea.element import Q4Element
+from fglopt.fea.solver import FEASolver
+from fglopt.mesh.domain_mesh import DomainMesh, DomainMesh3D
+
+
+def test_partition_covers_mesh_with_overlap():
+    mesh = DomainMesh(nx=8, ny=4)
+
+    blocks = partition_structured_mesh(mesh, (2, 2), overlap=1)
+
+    assert len(blocks) == 4
+    covered = np.unique(np.concatenate(blocks))
+    assert np.array_equal(covered, np.arange(mesh.n_nodes))
+    # Bottom-left block spans element columns 0..5 and rows 0..3 -> 6 x 4 nodes.
+    assert blocks[0].shape == (6 * 4,)
+
+
+def test_schwarz_pcg_matches_direct_solve():
+    mesh = DomainMesh(nx=24, ny=12, lx=2.0, ly=1.0)
+    ke = Q4Element(E=1.0, nu=0.3).stiffness_matrix(*mesh.element_size)
+    scale = np.random.default_rng(0).uniform(0.2, 1.0, mesh.n_elements)
+    K = StiffnessAssembler(mesh, ke).assemble(scale)
+
+    left = np.flatnonzero(np.isclose(mesh.node_coords[:, 0], 0.0))
+    fixed = np.sort(np.concatenate([2 * left, 2 * left + 1]))
+    F = np.zeros(mesh.n_dofs)
+    F[2 * (mesh.n_nodes - 1) + 1] = -1.0
+
+    u_direct = FEASolver("direct").solve(K, F, fixed)
+    with DomainDecompositionSolver(mesh, (3, 2), n_workers=2, tol=1e-10) as solver:
+        u = solver.solve(K, F, fixed)
+        # A second solve reuses the workers and shared buffers.
+        u2 = solver.solve(2.0 * K, F, fixed)
+
+    assert solver.last_info["workers"] == 2
+    assert np.allclose(u, u_direct, rtol=1e-7, atol=1e-12)
+    assert np.allclose(u2, 0.5 * u_direct, rtol=1e-7, atol=1e-12)
+
+
+def test_rejects_3d_mesh():
+    with pytest.raises(ValueError):
+        DomainDecompositionSolver(DomainMesh3D(nx=2, ny=2, nz=2))
+
+
+def test_workers_are_spawned_from_a_background_thread():
+    from fglopt.utils.jobs import JobManager
+
+    mesh = DomainMesh(nx=8, ny=4)
+    ke = Q4Element(E=1.0, nu=0.3).stiffness_matrix(*mesh.element_size)
+    K = StiffnessAssembler(mesh, ke).assemble()
+    fixed = np.array([0, 1, 2 * mesh.nx, 2 * mesh.nx + 1])
+    F = np.zeros(mesh.n_dofs)
+    F[2 * (mesh.n_nodes - 1) - 1] = -1.0
+
+    def work(job):
+        with DomainDecompositionSolver(mesh, (2, 1), n_workers=2, tol=1e-10) as solver:
+            u = solver.solve(K, F, fixed)
+            return u, [type(proc).__name__ for proc in solver._workers]
+
+    jobs = JobManager()
+    try:
+        job = jobs.wait(jobs.submit("dd", work).id, timeout=60)
+    finally:
+        jobs.shutdown()
+
+    assert job.status == "done", job.error
+    u, kinds = job.result
+    assert kinds == ["SpawnProcess", "SpawnProcess"]
+    assert np.allclose(u, FEASolver("direct").solve(K, F, fixed), rtol=1e-7, atol=1e-12)
+
+
+def test_worker_errors_are_reported():
+    mesh = DomainMesh(nx=8, ny=4)
+    ke = Q4Element(E=1.0, nu=0.3).stiffness_matrix(*mesh.element_size)
+    K = StiffnessAssembler(mesh, ke).assemble().tolil()
+    # A free DOF without stiffness makes its subdomain block singular.
+    K[2 * mesh.nx + 3, :] = 0.0
+    K[:, 2 * mesh.nx + 3] = 0.0
+    fixed = np.array([0, 1])
+    F = np.ones(mesh.n_dofs)
+
+    with DomainDecompositionSolver(mesh, (2, 1), n_workers=2) as solver:
+        with pytest.raises(RuntimeError, match="worker failed: .*singular"):
+            solver.solve(K.tocsr(), F, fixed)
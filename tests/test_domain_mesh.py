@@ -57,4 +57,32 @@ def test_element_connectivity():
     # n2 = 2*4 + 3 = 11
     # n3 = 2*4 + 2 = 10
     last_elem_id = mesh.n_elements - 1
-    assert mesh.get_element_nodes(last_elem_id) == (6, 7, 11, 10)
\ No newline at end of file
+    assert mesh.get_element_nodes(last_elem_id) == (6, 7, 11, 10)
+
+
+def test_connectivity_is_int32_and_coordinate_dtype_is_configurable():
+    mesh = DomainMesh(nx=3, ny=2, lx=3.0, ly=2.0, dtype=np.float32)
+
+    assert mesh.element_nodes.dtype == np.int32
+    assert mesh.node_coords.dtype == np.float32
+    assert np.allclose(mesh.get_node_position(mesh.n_nodes - 1), (3.0, 2.0))
+
+
+def test_3d_sizes_and_connectivity():
+    from fglopt.mesh.domain_mesh import DomainMesh3D
+
+    mesh = DomainMesh3D(nx=3, ny=2, nz=2, lx=3.0, ly=2.0, lz=1.0)
+
+    assert mesh.n_nodes == 4 * 3 * 3
+    assert mesh.n_elements == 12
+    assert mesh.node_coords.shape == (mesh.n_nodes, 3)
+    assert mesh.element_nodes.shape == (mesh.n_elements, 8)
+    assert mesh.element_nodes.dtype == np.int32
+
+    # Node 12 starts the second z-slab (12 nodes per slab).
+    assert np.allclose(mesh.get_node_position(12), (0.0, 0.0, 0.5))
+
+    # Element 0: Q4 order on z=0 then on z=0.5.
+    assert mesh.get_element_nodes(0) == (0, 1, 5, 4, 12, 13, 17, 16)
+    # First element of the second z-layer.
+    assert mesh.get_element_nodes(6) == (12, 13, 17, 16, 24, 25, 29, 28)
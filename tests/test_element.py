@@ -0,0 +1,37 @@
+import numpy as np
+
+from fglopt.fea.element import HexElement, Q4Element
+
+
+def test_q4_stiffness_symmetric_psd_with_rigid_modes():
+    ke = Q4Element(E=1.0, nu=0.3).stiffness_matrix(lx=2.0, ly=1.0)
+
+    assert ke.shape == (8, 8)
+    assert np.allclose(ke, ke.T)
+
+    eigvals = np.linalg.eigvalsh(ke)
+    assert eigvals.min() > -1e-12
+    # Two translations + one rotation have zero strain energy.
+    assert np.sum(np.abs(eigvals) < 1e-10) == 3
+
+
+def test_hex_stiffness_symmetric_psd_with_rigid_modes():
+    ke = HexElement(E=1.0, nu=0.3).stiffness_matrix(1.0, 2.0, 0.5)
+
+    assert ke.shape == (24, 24)
+    assert np.allclose(ke, ke.T)
+
+    eigvals = np.linalg.eigvalsh(ke)
+    assert eigvals.min() > -1e-12
+    # Three translations + three rotations.
+    assert np.sum(np.abs(eigvals) < 1e-10) == 6
+
+
+def test_hex_stiffness_float32_option():
+    element = HexElement(E=210e9, nu=0.3)
+
+    ke64 = element.stiffness_matrix()
+    ke32 = element.stiffness_matrix(dtype=np.float32)
+
+    assert ke32.dtype == np.float32
+    assert np.allclose(ke32, ke64, rtol=1e-6)
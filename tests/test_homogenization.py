@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+
+from fglopt.fea.element import HexElement
+from fglopt.lattice.homogenization import (
+    HomogenizationTable,
+    build_homogenization_table,
+    homogenize_voxels,
+    voxelize_cell,
+)
+from fglopt.optimization.interpolation import (
+    HomogenizedInterpolation,
+    SIMPInterpolation,
+)
+
+
+def test_solid_cell_recovers_material_tensor():
+    C = homogenize_voxels(np.ones(4**3, dtype=bool), E=2.0, nu=0.3)
+
+    assert np.allclose(C, HexElement(2.0, 0.3).constitutive_matrix())
+
+
+def test_gyroid_tensor_is_symmetric_and_cubic():
+    solid = voxelize_cell("gyroid", 0.3, resolution=8)
+    C = homogenize_voxels(solid)
+
+    assert np.allclose(C, C.T, atol=1e-10)
+    diag = np.diag(C)
+    assert np.allclose(diag[:3], diag[0], rtol=1e-6)
+    # Much softer than solid material at 30 % density.
+    assert diag[0] < 0.5 * HexElement(1.0, 0.3).constitutive_matrix()[0, 0]
+
+
+@pytest.fixture(scope="module")
+def table():
+    return build_homogenization_table(
+        cell_types=["bcc"], densities=[0.0, 0.25, 0.5, 0.75, 1.0], resolution=6
+    )
+
+
+def test_table_is_monotone_and_round_trips(table, tmp_path):
+    modulus, _ = table.modulus("bcc", table.densities["bcc"])
+    assert np.all(np.diff(modulus) > 0.0)
+    assert np.isclose(modulus[-1], 1.0)
+
+    loaded = HomogenizationTable.load(table.save(tmp_path / "table.npz"))
+
+    assert loaded.cell_types == ["bcc"]
+    assert np.isclose(loaded.nu, 0.3)
+    assert np.allclose(loaded.tensors["bcc"], table.tensors["bcc"], rtol=1e-6, atol=1e-12)
+
+
+def test_interpolation_derivatives_match_finite_differences(table):
+    rho = np.linspace(0.1, 0.9, 7)
+    h = 1e-6
+
+    tensors, d_tensors = table.interpolate("bcc", rho)
+    assert tensors.shape == d_tensors.shape == (7, 6, 6)
+    fd = (table.interpolate("bcc", rho + h)[0] - table.interpolate("bcc", rho - h)[0]) / (2 * h)
+    assert np.allclose(d_tensors, fd, rtol=1e-4, atol=1e-8)
+
+    interp = HomogenizedInterpolation(table, "bcc")
+    values, derivatives = interp(rho)
+    fd = (interp(rho + h)[0] - interp(rho - h)[0]) / (2 * h)
+    assert np.allclose(derivatives, fd, rtol=1e-4, atol=1e-8)
+
+
+def test_clipped_densities_have_zero_derivative(table):
+    grid = table.densities["bcc"]
+    coarse = HomogenizationTable(
+        {"bcc": grid[1:]}, {"bcc": table.tensors["bcc"][1:]}, table.nu
+    )
+    rho = np.array([0.5 * grid[1], 0.5])
+    h = 1e-6
+
+    values, derivatives = coarse.modulus("bcc", rho)
+    fd = (coarse.modulus("bcc", rho + h)[0] - coarse.modulus("bcc", rho - h)[0]) / (2 * h)
+    assert np.isclose(values[0], coarse.modulus("bcc", grid[1])[0])
+    assert np.allclose(derivatives, fd, rtol=1e-4, atol=1e-8)
+    assert derivatives[0] == 0.0 and derivatives[1] > 0.0
+
+    _, d_tensors = coarse.interpolate("bcc", rho)
+    assert np.all(d_tensors[0] == 0.0)
+
+
+def test_simp_interpolation_values_and_derivatives():
+    values, derivatives = SIMPInterpolation(penalty=3.0, e_min=0.0)(np.array([0.5, 1.0]))
+
+    assert np.allclose(values, [0.125, 1.0])
+    assert np.allclose(derivatives, [0.75, 3.0])
@@ -0,0 +1,98 @@
+import threading
+
+import pytest
+
+from fglopt.utils.jobs import JobManager
+
+
+def test_job_progress_output_and_result():
+    jobs = JobManager()
+    try:
+        def work(job):
+            for i in range(3):
+                job.report({"iteration": i + 1})
+                print(f"step {i + 1}")
+            return "result"
+
+        job = jobs.wait(jobs.submit("work", work).id)
+    finally:
+        jobs.shutdown()
+
+    assert job.status == "done"
+    assert job.result == "result"
+    assert job.progress == {"iteration": 3}
+    assert job.output() == ["step 1", "step 2", "step 3"]
+    assert jobs.finished() == [job]
+
+
+def test_cancel_is_cooperative_and_drops_queued_jobs():
+    jobs = JobManager()
+    started = threading.Event()
+    try:
+        def loop(job):
+            started.set()
+            n = 0
+            while not job.cancel_requested():
+                n += 1
+            return n
+
+        running = jobs.submit("loop", loop)
+        queued = jobs.submit("queued", lambda job: "never")
+        started.wait(5)
+
+        jobs.cancel(queued.id)
+        jobs.cancel(running.id)
+        jobs.wait(running.id, timeout=5)
+    finally:
+        jobs.shutdown()
+
+    assert running.status == "cancelled" and running.result > 0
+    assert queued.status == "cancelled" and queued.result is None
+
+
+def test_status_reflects_whether_the_job_stopped_early():
+    jobs = JobManager()
+    started, release = threading.Event(), threading.Event()
+    try:
+        def ignore(job):
+            started.set()
+            release.wait(5)
+            return "complete"
+
+        def checkpoint(job):
+            started.set()
+            release.wait(5)
+            job.check()
+            return "never"
+
+        outcomes = []
+        for fn in (ignore, checkpoint):
+            started.clear()
+            release.clear()
+            job = jobs.submit(fn.__name__, fn)
+            started.wait(5)
+            jobs.cancel(job.id)
+            release.set()
+            outcomes.append(jobs.wait(job.id, timeout=5))
+    finally:
+        jobs.shutdown()
+
+    ignored, checked = outcomes
+    assert ignored.status == "done" and ignored.result == "complete"
+    assert checked.status == "cancelled" and checked.result is None
+
+
+def test_failures_are_captured():
+    jobs = JobManager()
+    try:
+        def fail(job):
+            raise RuntimeError("boom")
+
+        job = jobs.wait(jobs.submit("fail", fail).id)
+    finally:
+        jobs.shutdown()
+
+    assert job.status == "failed"
+    assert str(job.error) == "boom"
+    with pytest.raises(ValueError, match="No job"):
+        jobs.get(7)
@@ -0,0 +1,61 @@
+import numpy as np
+
+from fglopt.fea.assembler import StiffnessAssembler, element_dofs
+from fglopt.fea.element import HexElement, Q4Element
+from fglopt.fea.kernels import ElementKernels
+from fglopt.mesh.domain_mesh import DomainMesh, DomainMesh3D
+
+
+def _setup(mesh, element):
+    ke = element.stiffness_matrix(*mesh.element_size)
+    edofs = element_dofs(mesh)
+    u = np.random.default_rng(0).standard_normal(mesh.n_dofs)
+    return ke, edofs, u
+
+
+def test_strain_energy_matches_einsum_and_thread_count():
+    mesh = DomainMesh(nx=13, ny=7)
+    ke, edofs, u = _setup(mesh, Q4Element(E=1.0, nu=0.3))
+    expected = np.einsum("ei,ij,ej->e", u[edofs], ke, u[edofs])
+
+    serial = ElementKernels(edofs, ke, n_threads=1, chunk_size=10)
+    threaded = ElementKernels(edofs, ke, n_threads=4, chunk_size=10)
+    try:
+        assert np.allclose(serial.strain_energy(u), expected)
+        assert np.array_equal(threaded.strain_energy(u), serial.strain_energy(u))
+    finally:
+        threaded.close()
+
+
+def test_sensitivity_and_apply_reuse_output_buffers():
+    mesh = DomainMesh3D(nx=3, ny=2, nz=2)
+    ke, edofs, u = _setup(mesh, HexElement(E=1.0, nu=0.3))
+    d_scale = np.linspace(0.5, 2.0, mesh.n_elements)
+
+    kernels = ElementKernels(edofs, ke, n_threads=2, chunk_size=5)
+    out = np.empty(mesh.n_elements)
+    energy = np.empty(mesh.n_elements)
+    try:
+        result = kernels.compliance_sensitivity(u, d_scale, out=out, energy=energy)
+        assert result is out
+        assert np.allclose(out, -d_scale * energy)
+
+        applied = kernels.apply(ke, u, scale=d_scale)
+        assert np.allclose(applied, d_scale[:, None] * (u[edofs] @ ke.T))
+    finally:
+        kernels.close()
+
+
+def test_threaded_assembly_matches_serial():
+    mesh = DomainMesh(nx=6, ny=4)
+    ke, edofs, _ = _setup(mesh, Q4Element(E=1.0, nu=0.3))
+    scale = np.linspace(0.1, 1.0, mesh.n_elements)
+
+    assembler = StiffnessAssembler(mesh, ke)
+    kernels = ElementKernels(edofs, ke, n_threads=3, chunk_size=7)
+    try:
+        K = assembler.assemble(scale, kernels=kernels)
+    finally:
+        kernels.close()
+
+    assert np.allclose(K.toarray(), assembler.assemble(scale).toarray())
@@ -0,0 +1,156 @@
+import numpy as np
+import pytest
+
+from fglopt.lattice.generator import LatticeGenerator
+from fglopt.lattice.stl_export import read_binary_stl
+from fglopt.lattice.unit_cells import (
+    solid_cell_triangles,
+    thickness_for_density,
+    unit_cell_triangles,
+)
+from fglopt.mesh.domain_mesh import DomainMesh, DomainMesh3D
+
+
+def _signed_volume(triangles):
+    tri = triangles.astype(float)
+    return np.einsum("ij,ij->i", tri[:, 0], np.cross(tri[:, 1], tri[:, 2])).sum() / 6.0
+
+
+def test_solid_cell_is_closed_unit_cube():
+    assert np.isclose(_signed_volume(solid_cell_triangles()), 1.0)
+
+
+@pytest.mark.parametrize("cell_type", ["bcc", "octet", "gyroid"])
+def test_thickness_grows_with_density(cell_type):
+    t = [thickness_for_density(cell_type, rho) for rho in (0.1, 0.3, 0.5)]
+    assert t[0] < t[1] < t[2]
+
+
+def test_unit_cell_geometry_is_cached():
+    a = unit_cell_triangles("bcc", 0.25)
+    b = unit_cell_triangles("bcc", 0.25)
+
+    assert a is b
+    assert a.dtype == np.float32
+    assert not a.flags.writeable
+    # Closed prisms have positive enclosed volume.
+    assert _signed_volume(a) > 0.0
+
+
+def test_quantize_maps_to_bounded_levels():
+    generator = LatticeGenerator("bcc", n_levels=4)
+
+    levels = generator.quantize([0.0, 0.1, 0.3, 0.6, 1.0, 1.5])
+
+    assert levels.tolist() == [0, 0, 1, 2, 4, 4]
+
+
+def test_generate_instances_cells_per_level():
+    mesh = DomainMesh(nx=4, ny=2, lx=4.0, ly=2.0)
+    density = np.array([0.0, 0.5, 0.5, 1.0, 0.0, 0.5, 1.0, 0.26])
+    generator = LatticeGenerator("bcc", n_levels=4, solid_threshold=0.9)
+
+    tri = generator.generate(mesh, density)
+
+    n_half = generator.cell_triangles(2).shape[0]
+    n_quarter = generator.cell_triangles(1).shape[0]
+    assert tri.shape == (3 * n_half + n_quarter + 2 * 12, 3, 3)
+    assert tri.dtype == np.float32
+    # 2D meshes are extruded one cell (min(dx, dy) = 1) deep; strut caps
+    # may protrude by at most one strut radius.
+    radius = thickness_for_density("bcc", 0.5)
+    assert 1.0 <= tri[..., 2].max() <= 1.0 + radius
+    assert tri[..., 0].min() >= 1.0 - radius  # element 0 is void
+
+
+def test_chunks_respect_triangle_budget():
+    mesh = DomainMesh3D(nx=3, ny=3, nz=2)
+    density = np.full(mesh.n_elements, 0.5)
+    generator = LatticeGenerator("octet", n_levels=2)
+    per_cell = generator.cell_triangles(1).shape[0]
+
+    chunks = list(generator.iter_triangles(mesh, density, max_triangles=4 * per_cell))
+
+    assert all(c.shape[0] <= 4 * per_cell for c in chunks)
+    assert sum(c.shape[0] for c in chunks) == mesh.n_elements * per_cell
+
+
+def test_export_stl_round_trip(tmp_path):
+    mesh = DomainMesh(nx=2, ny=2)
+    generator = LatticeGenerator("gyroid", n_levels=3)
+    tri = generator.generate(mesh, np.full(mesh.n_elements, 0.3))
+
+    path = tmp_path / "lattice.stl"
+    stats = generator.export_stl(path)
+
+    assert stats.n_triangles == tri.shape[0]
+    assert path.stat().st_size == stats.n_bytes == 84 + 50 * tri.shape[0]
+    assert np.array_equal(read_binary_stl(path), tri)
+
+
+def test_cancelled_export_removes_partial_file(tmp_path):
+    mesh = DomainMesh3D(nx=3, ny=3, nz=2)
+    generator = LatticeGenerator("octet", n_levels=2)
+    per_cell = generator.cell_triangles(1).shape[0]
+    polls = iter([False, True])
+
+    path = tmp_path / "lattice.stl"
+    stats = generator.export_stl(
+        path,
+        mesh,
+        np.full(mesh.n_elements, 0.5),
+        max_triangles=4 * per_cell,
+        should_stop=lambda: next(polls),
+    )
+
+    assert stats is None
+    assert not path.exists()
+
+
+def _boundary_edges(triangles, decimals=5):
+    """Return the number of undirected edges used by exactly one triangle."""
+    keys = np.round(triangles.astype(float), decimals).reshape(-1, 3, 3)
+    edges = np.stack([keys[:, [0, 1]], keys[:, [1, 2]], keys[:, [2, 0]]], axis=1)
+    edges = np.ascontiguousarray(edges.reshape(-1, 2, 3)).view([("", float)] * 3)
+    edges = np.sort(edges.reshape(-1, 2), axis=1)
+    _, counts = np.unique(edges, return_counts=True)
+    return int((counts == 1).sum())
+
+
+@pytest.mark.parametrize("density", [0.1, 0.3, 0.6])
+def test_gyroid_cell_is_closed_and_capped(density):
+    tri = unit_cell_triangles("gyroid", density)
+
+    assert _boundary_edges(tri) == 0
+    assert tri.min() >= -1e-3 and tri.max() <= 1.0 + 1e-3
+    if density >= 0.3:
+        fine = unit_cell_triangles("gyroid", density, resolution=16)
+        assert _boundary_edges(fine) == 0
+        assert _signed_volume(fine) == pytest.approx(density, rel=0.05)
+
+
+def _inside_prism(points, triangles):
+    """Winding-number point-in-solid test for one closed triangle shell."""
+    a, b, c = (triangles[None, :, k, :] - points[:, None, :] for k in range(3))
+    la, lb, lc = (np.linalg.norm(v, axis=-1) for v in (a, b, c))
+    numerator = np.einsum("ptk,ptk->pt", a, np.cross(b, c))
+    denominator = (
+        la * lb * lc
+        + np.einsum("ptk,ptk->pt", a, b) * lc
+        + np.einsum("ptk,ptk->pt", b, c) * la
+        + np.einsum("ptk,ptk->pt", c, a) * lb
+    )
+    solid_angle = 2.0 * np.arctan2(numerator, denominator).sum(axis=1)
+    return np.abs(solid_angle) > 2.0 * np.pi
+
+
+@pytest.mark.parametrize("cell_type", ["bcc", "octet"])
+def test_emitted_strut_cells_match_target_density(cell_type):
+    points = np.random.default_rng(0).random((4000, 3))
+    for density in (0.1, 0.3):
+        tri = unit_cell_triangles(cell_type, density).astype(float)
+        per_strut = 4 * 6  # side quads (2 x 6) and two 6-triangle caps
+        inside = np.zeros(points.shape[0], dtype=bool)
+        for start in range(0, tri.shape[0], per_strut):
+            inside |= _inside_prism(points, tri[start : start + per_strut])
+        assert inside.mean() == pytest.approx(density, abs=0.025)
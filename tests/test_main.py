@@ -46,3 +46,245 @@ def test_help_lists_plot_commands(monkeypatch, capsys):
     out = capsys.readouterr().out
     assert "plot mesh" in out
     assert "plot bc" in out
+
+
+def test_commands_match_whole_words(monkeypatch, capsys):
+    from fglopt.main import launch_console
+
+    commands = iter(["exportfoo x.stl", "statusx 1", "exit"])
+    monkeypatch.setattr("builtins.input", lambda _prompt: next(commands))
+
+    launch_console()
+
+    out = capsys.readouterr().out
+    assert out.count("Unknown command.") == 2
+    assert "Load config first." not in out
+
+
+def test_run_fea_3d_uses_matrix_free_solver(tmp_path, capsys):
+    from fglopt.main import run_fea
+
+    cfg_path = tmp_path / "config.yaml"
+    cfg_path.write_text(
+        """
+input_stl: examples/cant_beam.stl
+dimension: 3
+mesh_resolution: 4
+mesh_height: 2
+mesh_depth: 2
+length_x: 2.0
+volume_fraction: 0.4
+material:
+  E: 1.0
+  nu: 0.3
+boundary_conditions:
+  fixed:
+    - selector: left_face
+      dofs: ["x", "y", "z"]
+  loads:
+    - type: edge
+      selector: right_face
+      direction: y
+      magnitude: -1.0
+""".strip()
+    )
+
+    u = run_fea(ConfigLoader(str(cfg_path)))
+
+    out = capsys.readouterr().out
+    assert "matrix-free solver" in out
+    assert "Compliance:" in out
+    assert "Max von Mises stress:" in out
+    assert u.shape == (5 * 3 * 3 * 3,)
+
+
+def test_export_reports_throughput(tmp_path, capsys):
+    from fglopt.main import export_lattice
+
+    cfg_path = tmp_path / "config.yaml"
+    _write_config(cfg_path)
+    output_path = tmp_path / "lattice.stl"
+
+    stats = export_lattice(ConfigLoader(str(cfg_path)), str(output_path))
+
+    assert output_path.stat().st_size == stats.n_bytes
+    out = capsys.readouterr().out
+    assert "MB/s" in out
+    assert "triangles/s" in out
+
+
+def test_plan_and_budget_rejection(tmp_path, capsys):
+    import pytest
+
+    from fglopt.main import plan_job, run_fea
+
+    cfg_path = tmp_path / "config.yaml"
+    _write_config(cfg_path)
+    cfg_path.write_text(cfg_path.read_text() + "\nmemory_budget: 1MB\n")
+    config = ConfigLoader(str(cfg_path))
+
+    plan_job(config)
+    out = capsys.readouterr().out
+    assert "DOFs: 50" in out
+    assert "No backend fits" in out
+
+    with pytest.raises(ValueError, match="memory budget"):
+        run_fea(config)
+
+
+def test_run_fea_with_detected_symmetry_matches_full_solve(tmp_path, capsys):
+    import numpy as np
+
+    from fglopt.main import run_fea
+
+    cfg_path = tmp_path / "config.yaml"
+    base = """
+input_stl: examples/cant_beam.stl
+dimension: 3
+mesh_resolution: 4
+mesh_height: 2
+mesh_depth: 2
+length_x: 2.0
+volume_fraction: 0.4
+solver: direct
+material:
+  E: 1.0
+  nu: 0.3
+boundary_conditions:
+  fixed:
+    - selector: left_face
+      dofs: ["x", "y", "z"]
+  loads:
+    - type: edge
+      selector: right_face
+      direction: y
+      magnitude: -1.0
+""".strip()
+    cfg_path.write_text(base)
+    u_full = run_fea(ConfigLoader(str(cfg_path)))
+
+    cfg_path.write_text(base + "\nsymmetry: auto\n")
+    u = run_fea(ConfigLoader(str(cfg_path)))
+
+    out = capsys.readouterr().out
+    assert "Symmetry: z" in out
+    assert "LU fill-in" in out
+    assert np.allclose(u, u_full, atol=1e-10 * np.abs(u_full).max())
+
+
+def test_topology_progress_reports_full_domain_compliance(tmp_path, capsys):
+    import numpy as np
+
+    from fglopt.main import run_toplogy_optimization
+
+    cfg_path = tmp_path / "config.yaml"
+    base = """
+input_stl: examples/cant_beam.stl
+mesh_resolution: 8
+mesh_height: 4
+volume_fraction: 0.4
+max_iterations: 2
+material:
+  E: 1.0
+  nu: 0.3
+boundary_conditions:
+  fixed:
+    - selector: left_edge
+      dofs: ["x", "y"]
+    - selector: right_edge
+      dofs: ["x", "y"]
+  loads:
+    - type: edge
+      selector: top_edge
+      direction: y
+      magnitude: -1.0
+""".strip()
+    records = {}
+    for symmetry in ("none", "x"):
+        cfg_path.write_text(base + f"\nsymmetry: {symmetry}\n")
+        records[symmetry] = []
+        run_toplogy_optimization(
+            ConfigLoader(str(cfg_path)), callback=records[symmetry].append
+        )
+
+    full = [r["compliance"] for r in records["none"]]
+    half = [r["compliance"] for r in records["x"]]
+    assert "Cancelled" not in capsys.readouterr().out
+    assert np.allclose(half, full, rtol=1e-6)
+
+
+def test_console_runs_topology_optimization_as_background_job(tmp_path, monkeypatch, capsys):
+    from fglopt.main import launch_console
+
+    cfg_path = tmp_path / "config.yaml"
+    _write_config(cfg_path)
+    cfg_path.write_text(
+        cfg_path.read_text()
+        + """
+max_iterations: 3
+boundary_conditions:
+  fixed:
+    - selector: left_edge
+      dofs: ["x", "y"]
+  loads:
+    - type: edge
+      selector: right_edge
+      direction: y
+      magnitude: -1.0
+"""
+    )
+    stl_path = tmp_path / "lattice.stl"
+    commands = iter(
+        [
+            f"load {cfg_path}",
+            "run topo-opt",
+            "wait 1",
+            "jobs",
+            "status 1",
+            f"export {stl_path}",
+            "wait 2",
+            "exit",
+        ]
+    )
+    monkeypatch.setattr("builtins.input", lambda _prompt: next(commands))
+
+    launch_console()
+
+    out = capsys.readouterr().out
+    assert "Started job 1: run topo-opt" in out
+    assert "Finished after 3 iterations" in out
+    assert "[1] run topo-opt" in out and "done" in out
+    assert "Exported" in out
+    assert stl_path.exists()
+
+
+def test_topology_job_cancelled_before_the_first_iteration(tmp_path):
+    import threading
+
+    from fglopt.main import run_toplogy_optimization
+    from fglopt.utils.jobs import JobManager
+
+    cfg_path = tmp_path / "config.yaml"
+    _write_config(cfg_path)
+    started, cancelled = threading.Event(), threading.Event()
+
+    def work(job):
+        started.set()
+        cancelled.wait(5)
+        return run_toplogy_optimization(
+            ConfigLoader(str(cfg_path)), callback=job.report, should_stop=job.cancel_requested
+        )
+
+    jobs = JobManager()
+    try:
+        job = jobs.submit("run topo-opt", work)
+        started.wait(5)
+        jobs.cancel(job.id)
+        cancelled.set()
+        jobs.wait(job.id, timeout=60)
+    finally:
+        jobs.shutdown()
+
+    assert job.status == "cancelled", job.error
+    assert job.result is None
+    assert "Cancelled before the first iteration" in job.output()
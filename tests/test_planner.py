@@ -0,0 +1,93 @@
+import numpy as np
+import pytest
+
+from fglopt.fea.assembler import StiffnessAssembler
+from fglopt.fea.element import HexElement, Q4Element
+from fglopt.fea.planner import (
+    PlannerCalibration,
+    ResourcePlanner,
+    parse_memory,
+    structured_nnz,
+)
+from fglopt.mesh.domain_mesh import DomainMesh, DomainMesh3D
+
+
+def test_structured_nnz_matches_assembled_pattern():
+    mesh = DomainMesh(nx=5, ny=3)
+    ke = Q4Element(E=1.0, nu=0.3).stiffness_matrix(*mesh.element_size)
+    assert structured_nnz((5, 3), 2) == StiffnessAssembler(mesh, ke).nnz
+
+    mesh = DomainMesh3D(nx=3, ny=2, nz=2)
+    ke = HexElement(E=1.0, nu=0.3).stiffness_matrix(*mesh.element_size)
+    assert structured_nnz((3, 2, 2), 3) == StiffnessAssembler(mesh, ke).nnz
+
+
+def test_parse_memory_units():
+    assert parse_memory(2) == 2 * 2**30
+    assert parse_memory("512MB") == 512 * 2**20
+    assert parse_memory("1.5 GiB") == int(1.5 * 2**30)
+    assert parse_memory(None) is None
+    with pytest.raises(ValueError):
+        parse_memory("lots")
+
+
+def test_plan_sizes_and_recommendation_follow_budget():
+    planner = ResourcePlanner()
+    plan = planner.plan((800, 400))
+
+    assert plan.n_dofs == 2 * 801 * 401
+    direct = plan.estimate("direct")
+    assert direct.fill_nnz > plan.nnz
+    assert plan.estimate("direct", "mixed").peak_bytes < direct.peak_bytes
+    assert plan.recommended.solver == "direct"
+
+    tight = planner.plan((800, 400), budget_bytes=direct.peak_bytes // 2)
+    assert not tight.estimate("direct").fits(tight.budget_bytes)
+    assert tight.recommended.peak_bytes <= tight.budget_bytes
+    with pytest.raises(ValueError, match="exceeds the memory budget"):
+        tight.check("direct")
+
+    assert planner.plan((800, 400), budget_bytes=1).recommended is None
+
+
+def test_3d_plan_prefers_matrix_free_and_skips_domain_decomposition():
+    plan = ResourcePlanner().plan((100, 100, 100), budget_bytes=16 * 2**30)
+
+    assert plan.recommended.solver == "matrix-free"
+    assert all(est.solver != "domain-decomposition" for est in plan.estimates)
+
+
+def test_optimization_plan_covers_simp_buffers():
+    from fglopt.optimization.simp import TopologyOptimizer
+
+    mesh = DomainMesh(nx=40, ny=20)
+    force = np.zeros(mesh.n_dofs)
+    force[-1] = -1.0
+    optimizer = TopologyOptimizer(
+        mesh, Q4Element(E=1.0, nu=0.3), force, np.array([0, 1]),
+        volume_fraction=0.5, n_threads=2, design_block=2, filter_radius=3.0,
+    )
+    try:
+        optimizer.stiffness(np.ones(mesh.n_elements))
+        kernels = optimizer.kernels
+        buffers = [optimizer.assembler._weights, *kernels._gather, *kernels._product]
+        buffers += [optimizer.design.P.data, optimizer.design.P.indices]
+        buffers += [optimizer.filter.H.data, optimizer.filter.H.indices]
+        used = sum(array.nbytes for array in buffers)
+    finally:
+        optimizer.close()
+
+    planner = ResourcePlanner()
+    solve = planner.plan((40, 20)).estimate("direct")
+    simp = planner.plan(
+        (40, 20), optimization=True, design_block=2, filter_radius=3.0, n_threads=2
+    ).estimate("direct")
+    assert simp.peak_bytes - solve.peak_bytes >= used
+
+
+def test_calibration_round_trip(tmp_path):
+    calibration = PlannerCalibration(spmv_ns_per_nnz=2.0)
+    loaded = PlannerCalibration.load(calibration.save(tmp_path / "planner.json"))
+
+    assert loaded == calibration
+    assert np.isclose(loaded.lu_fill[2][1], calibration.lu_fill[2][1])
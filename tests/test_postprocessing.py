@@ -0,0 +1,53 @@
+import numpy as np
+
+from fglopt.fea.assembler import element_dofs
+from fglopt.fea.element import HexElement, Q4Element
+from fglopt.fea.kernels import ElementKernels
+from fglopt.fea.postprocessing import StressRecovery, von_mises
+from fglopt.mesh.domain_mesh import DomainMesh, DomainMesh3D
+
+
+def test_uniform_strain_gives_exact_stress_fields():
+    mesh = DomainMesh(nx=6, ny=4, lx=3.0, ly=2.0)
+    element = Q4Element(E=2.0, nu=0.3)
+    # Affine displacement u = (a x, -nu a y): uniaxial stress sxx = E a.
+    a = 1e-3
+    x, y = mesh.node_coords.T
+    u = np.column_stack((a * x, -element.nu * a * y)).ravel()
+
+    recovery = StressRecovery(mesh, element, n_threads=1, block_size=5)
+    try:
+        fields = recovery.evaluate(u)
+    finally:
+        recovery.close()
+
+    assert np.allclose(fields.von_mises, element.E * a, rtol=1e-6)
+    assert np.allclose(fields.strain_energy_density, 0.5 * element.E * a * a, rtol=1e-6)
+    assert fields.von_mises.dtype == np.float32
+
+
+def test_strain_energy_density_matches_element_energy():
+    mesh = DomainMesh3D(nx=3, ny=2, nz=2)
+    element = HexElement(E=1.0, nu=0.3)
+    ke = element.stiffness_matrix(*mesh.element_size)
+    u = np.random.default_rng(0).standard_normal(mesh.n_dofs)
+    scale = np.linspace(0.1, 1.0, mesh.n_elements)
+
+    recovery = StressRecovery(mesh, element, n_threads=2, block_size=4, dtype=np.float64)
+    try:
+        fields = recovery.evaluate(u, scale)
+    finally:
+        recovery.close()
+
+    kernels = ElementKernels(element_dofs(mesh), ke, n_threads=1)
+    energy = scale * kernels.strain_energy(u)
+    volume = np.prod(mesh.element_size)
+    assert np.allclose(fields.strain_energy_density, 0.5 * energy / volume)
+
+    node_u = np.linalg.norm(u.reshape(-1, 3), axis=1)
+    assert np.allclose(fields.displacement, node_u[mesh.element_nodes].mean(axis=1))
+
+
+def test_von_mises_of_pure_shear():
+    assert np.isclose(von_mises(np.array([0.0, 0.0, 1.0])), np.sqrt(3.0))
+    assert np.isclose(von_mises(np.array([1.0, 0.0, 0.0, 0.0, 0.0, 0.0])), 1.0)
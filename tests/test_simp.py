@@ -0,0 +1,153 @@
+import numpy as np
+import pytest
+
+from fglopt.fea.element import Q4Element
+from fglopt.mesh.domain_mesh import DomainMesh
+from fglopt.optimization.design_grid import DesignGrid
+from fglopt.optimization.filters import DensityFilter
+from fglopt.optimization.simp import TopologyOptimizer
+
+
+def _cantilever(nx=16, ny=8):
+    mesh = DomainMesh(nx=nx, ny=ny, lx=2.0, ly=1.0)
+    left = np.arange(0, mesh.n_nodes, nx + 1)
+    fixed = np.concatenate((2 * left, 2 * left + 1))
+    force = np.zeros(mesh.n_dofs)
+    force[2 * (nx + (ny // 2) * (nx + 1)) + 1] = -1.0
+    return mesh, force, fixed
+
+
+def test_density_filter_preserves_uniform_field():
+    mesh = DomainMesh(nx=5, ny=4)
+    filt = DensityFilter(mesh, radius=2.0)
+
+    assert np.allclose(filt.apply(np.full(mesh.n_elements, 0.3)), 0.3)
+    # Interior element: the 3x3 block lies within r = 2, distance 2 does not.
+    assert filt.H[6].nnz == 9
+
+
+def test_cantilever_compliance_decreases_and_volume_is_met():
+    mesh, force, fixed = _cantilever()
+    optimizer = TopologyOptimizer(
+        mesh, Q4Element(E=1.0, nu=0.3), force, fixed, volume_fraction=0.5,
+        max_iterations=15, n_threads=2,
+    )
+    try:
+        density = optimizer.run()
+    finally:
+        optimizer.close()
+
+    compliance = [record["compliance"] for record in optimizer.history]
+    assert compliance[-1] < 0.7 * compliance[0]
+    assert abs(density.mean() - 0.5) < 1e-2
+    assert density.min() >= 0.0 and density.max() <= 1.0
+
+
+def test_mixed_precision_tracks_double_history():
+    mesh, force, fixed = _cantilever()
+    histories = {}
+    for precision in ("double", "mixed"):
+        optimizer = TopologyOptimizer(
+            mesh, Q4Element(E=1.0, nu=0.3), force, fixed, volume_fraction=0.5,
+            max_iterations=5, n_threads=1, precision=precision,
+        )
+        try:
+            density = optimizer.run()
+        finally:
+            optimizer.close()
+        histories[precision] = [record["compliance"] for record in optimizer.history]
+        if precision == "mixed":
+            assert density.dtype == np.float32
+
+    assert np.allclose(histories["mixed"], histories["double"], rtol=1e-4)
+
+
+def test_should_stop_ends_on_a_completed_iteration():
+    mesh, force, fixed = _cantilever()
+    optimizer = TopologyOptimizer(
+        mesh, Q4Element(E=1.0, nu=0.3), force, fixed, volume_fraction=0.5,
+        max_iterations=10, n_threads=1,
+    )
+    try:
+        density = optimizer.run(should_stop=lambda: len(optimizer.history) >= 2)
+    finally:
+        optimizer.close()
+
+    assert len(optimizer.history) == 2
+    assert np.array_equal(density, optimizer.filter.apply(optimizer.density))
+
+
+def test_oc_update_reuses_design_buffers():
+    mesh, force, fixed = _cantilever()
+    optimizer = TopologyOptimizer(
+        mesh, Q4Element(E=1.0, nu=0.3), force, fixed, volume_fraction=0.5,
+        max_iterations=10, n_threads=1,
+    )
+    try:
+        buffers = {id(optimizer.density), id(optimizer._next)}
+        for _ in range(3):
+            optimizer.step()
+            assert {id(optimizer.density), id(optimizer._next)} == buffers
+    finally:
+        optimizer.close()
+
+    assert np.allclose(optimizer._dv, optimizer.filter.backward(np.ones(mesh.n_elements)))
+
+
+def test_design_grid_projection_and_transpose():
+    mesh = DomainMesh(nx=5, ny=4)
+    grid = DesignGrid(mesh, block=2)
+
+    assert grid.shape == (3, 2)
+    assert grid.design_mesh.n_elements == grid.n_design == 6
+    assert grid.counts.sum() == mesh.n_elements
+    x = np.arange(grid.n_design, dtype=float)
+    s = np.random.default_rng(0).standard_normal(mesh.n_elements)
+    assert np.isclose(grid.project(x) @ s, x @ grid.backward(s))
+    # Element (4, 3) lies in the partial top-right design cell.
+    assert grid.project(x)[3 * 5 + 4] == 5.0
+
+
+def test_coarse_design_grid_optimization():
+    mesh, force, fixed = _cantilever()
+    optimizer = TopologyOptimizer(
+        mesh, Q4Element(E=1.0, nu=0.3), force, fixed, volume_fraction=0.5,
+        max_iterations=15, n_threads=1, filter_radius=3.0, design_block=2,
+    )
+    try:
+        density = optimizer.run()
+    finally:
+        optimizer.close()
+
+    assert optimizer.density.shape == (mesh.n_elements // 4,)
+    blocks = density.reshape(8, 16).reshape(4, 2, 8, 2)
+    assert np.all(blocks == blocks[:, :1, :, :1])
+    compliance = [record["compliance"] for record in optimizer.history]
+    assert compliance[-1] < 0.7 * compliance[0]
+    assert abs(density.mean() - 0.5) < 1e-2
+
+
+def test_coarse_design_filter_mixes_neighbouring_cells():
+    mesh, force, fixed = _cantilever()
+    optimizer = TopologyOptimizer(
+        mesh, Q4Element(E=1.0, nu=0.3), force, fixed, volume_fraction=0.5,
+        n_threads=1, design_block=2,
+    )
+    optimizer.close()
+
+    x = np.zeros(optimizer.design.n_design)
+    x[2 * 8 + 3] = 1.0  # interior design cell (3, 2)
+    filtered = optimizer.filter.apply(x).reshape(4, 8)
+    assert 0.0 < filtered[2, 3] < 1.0
+    assert filtered[2, 2] > 0.0 and filtered[1, 3] > 0.0
+
+
+def test_mirror_axes_require_whole_design_blocks():
+    mesh = DomainMesh(nx=6, ny=4)
+    force = np.zeros(mesh.n_dofs)
+    force[-1] = -1.0
+    with pytest.raises(ValueError, match="whole number of design blocks"):
+        TopologyOptimizer(
+            mesh, Q4Element(E=1.0, nu=0.3), force, np.array([0, 1]), volume_fraction=0.5,
+            n_threads=1, design_block=4, mirror_axes=(0,),
+        )
@@ -0,0 +1,157 @@
+import numpy as np
+import pytest
+
+from fglopt.fea.assembler import MatrixFreeStiffness, StiffnessAssembler
+from fglopt.fea.element import HexElement, Q4Element
+from fglopt.fea.ordering import nested_dissection
+from fglopt.fea.solver import FEASolver, compute_compliance
+from fglopt.mesh.domain_mesh import DomainMesh, DomainMesh3D
+
+
+def _cantilever_2d():
+    mesh = DomainMesh(nx=8, ny=4, lx=2.0, ly=1.0)
+    ke = Q4Element(E=1.0, nu=0.3).stiffness_matrix(*mesh.element_size)
+    K = StiffnessAssembler(mesh, ke).assemble()
+
+    left = np.flatnonzero(np.isclose(mesh.node_coords[:, 0], 0.0))
+    fixed = np.sort(np.concatenate([2 * left, 2 * left + 1]))
+    F = np.zeros(mesh.n_dofs)
+    F[2 * (mesh.n_nodes - 1) + 1] = -1.0
+    return mesh, K, F, fixed
+
+
+def test_direct_solve_cantilever():
+    mesh, K, F, fixed = _cantilever_2d()
+
+    u = FEASolver("direct").solve(K, F, fixed)
+
+    assert np.all(u[fixed] == 0.0)
+    assert compute_compliance(F, u) > 0.0
+    # Tip deflects in the load direction.
+    assert u[2 * (mesh.n_nodes - 1) + 1] < 0.0
+
+
+def test_cg_matches_direct_2d():
+    _, K, F, fixed = _cantilever_2d()
+
+    u_direct = FEASolver("direct").solve(K, F, fixed)
+    solver = FEASolver("cg", tol=1e-12)
+    u_cg = solver.solve(K, F, fixed)
+
+    assert np.allclose(u_cg, u_direct, rtol=1e-6, atol=1e-12)
+    assert solver.last_info["iterations"] > 0
+
+
+def test_matrix_free_cg_matches_direct_3d():
+    mesh = DomainMesh3D(nx=4, ny=2, nz=2, lx=2.0, ly=1.0, lz=1.0)
+    ke = HexElement(E=1.0, nu=0.3).stiffness_matrix(*mesh.element_size)
+
+    left = np.flatnonzero(np.isclose(mesh.node_coords[:, 0], 0.0))
+    fixed = np.sort((3 * left[:, None] + np.arange(3)).ravel())
+    F = np.zeros(mesh.n_dofs)
+    right = np.flatnonzero(np.isclose(mesh.node_coords[:, 0], 2.0))
+    F[3 * right + 1] = -1.0 / len(right)
+
+    u_direct = FEASolver("direct").solve(StiffnessAssembler(mesh, ke).assemble(), F, fixed)
+    u_mf = FEASolver("cg", tol=1e-12).solve(MatrixFreeStiffness(mesh, ke), F, fixed)
+
+    assert np.allclose(u_mf, u_direct, rtol=1e-6, atol=1e-12)
+
+
+def test_direct_requires_assembled_matrix():
+    mesh = DomainMesh3D(nx=1, ny=1, nz=1)
+    ke = HexElement(E=1.0, nu=0.3).stiffness_matrix()
+
+    with pytest.raises(ValueError):
+        FEASolver("direct").solve(MatrixFreeStiffness(mesh, ke), np.zeros(mesh.n_dofs), [])
+
+
+def _graded_cantilever_2d(dtype=np.float64):
+    mesh = DomainMesh(nx=24, ny=12, lx=2.0, ly=1.0)
+    ke = Q4Element(E=1.0, nu=0.3).stiffness_matrix(*mesh.element_size)
+    scale = np.random.default_rng(0).uniform(0.1, 1.0, mesh.n_elements) ** 3
+
+    left = np.flatnonzero(np.isclose(mesh.node_coords[:, 0], 0.0))
+    fixed = np.sort(np.concatenate([2 * left, 2 * left + 1]))
+    F = np.zeros(mesh.n_dofs)
+    F[2 * (mesh.n_nodes - 1) + 1] = -1.0
+    return mesh, ke, scale, F, fixed
+
+
+@pytest.mark.parametrize("method", ["direct", "cg", "matrix-free"])
+def test_mixed_precision_meets_double_compliance(method):
+    mesh, ke, scale, F, fixed = _graded_cantilever_2d()
+    if method == "matrix-free":
+        K = MatrixFreeStiffness(mesh, ke, scale)
+    else:
+        K = StiffnessAssembler(mesh, ke).assemble(scale)
+    method = "cg" if method == "matrix-free" else method
+
+    reference = compute_compliance(F, FEASolver(method).solve(K, F, fixed))
+    solver = FEASolver(method, precision="mixed")
+    u = solver.solve(K, F, fixed)
+
+    assert u.dtype == np.float64
+    assert solver.last_info["precision"] == "mixed"
+    assert compute_compliance(F, u) == pytest.approx(reference, rel=1e-6)
+
+
+def test_mixed_direct_refines_float32_factorization():
+    mesh, ke, scale, F, fixed = _graded_cantilever_2d()
+    K = StiffnessAssembler(mesh, ke).assemble(scale)
+
+    solver = FEASolver("direct", tol=1e-10, precision="mixed")
+    u = solver.solve(K, F, fixed)
+
+    assert solver.last_info["refinements"] >= 1
+    free = np.setdiff1d(np.arange(mesh.n_dofs), fixed)
+    residual = F[free] - (K @ u)[free]
+    assert np.linalg.norm(residual) <= 1e-10 * np.linalg.norm(F)
+
+
+def test_single_precision_solves_in_float32():
+    mesh, ke, scale, F, fixed = _graded_cantilever_2d()
+    K = StiffnessAssembler(mesh, ke, dtype=np.float32).assemble(scale)
+
+    u = FEASolver("cg", precision="single").solve(K, F, fixed)
+
+    assert u.dtype == np.float32
+
+
+def test_unknown_precision_is_rejected():
+    with pytest.raises(ValueError):
+        FEASolver("direct", precision="half")
+
+
+def test_nested_dissection_is_a_dof_permutation():
+    for mesh in (DomainMesh(nx=9, ny=5), DomainMesh3D(nx=4, ny=3, nz=5)):
+        order = nested_dissection(mesh, leaf_size=4)
+        assert np.array_equal(np.sort(order), np.arange(mesh.n_dofs))
+
+
+def test_cached_orderings_match_colamd_and_reduce_fill():
+    mesh = DomainMesh(nx=40, ny=20, lx=2.0, ly=1.0)
+    ke = Q4Element(E=1.0, nu=0.3).stiffness_matrix(*mesh.element_size)
+    K = StiffnessAssembler(mesh, ke).assemble()
+    left = np.flatnonzero(np.isclose(mesh.node_coords[:, 0], 0.0))
+    fixed = np.concatenate([2 * left, 2 * left + 1])
+    F = np.zeros(mesh.n_dofs)
+    F[2 * (mesh.n_nodes - 1) + 1] = -1.0
+
+    reference = FEASolver("direct")
+    u_ref = reference.solve(K, F, fixed)
+    for ordering in ("rcm", nested_dissection(mesh)):
+        solver = FEASolver("direct", ordering=ordering)
+        u = solver.solve(K, F, fixed)
+        assert np.allclose(u, u_ref, rtol=1e-9, atol=1e-12 * np.abs(u_ref).max())
+
+    order = solver._order
+    u = solver.solve(2.0 * K, F, fixed)
+    assert solver._order is order
+    assert np.allclose(u, 0.5 * u_ref)
+    assert solver.last_info["fill_in"] < reference.last_info["fill_in"]
+
+    mixed = FEASolver("direct", precision="mixed", ordering=nested_dissection(mesh))
+    assert np.allclose(mixed.solve(K, F, fixed), u_ref, rtol=1e-6, atol=1e-9)
+    with pytest.raises(ValueError, match="Ordering has"):
+        FEASolver("direct", ordering=np.arange(10)).solve(K, F, fixed)
@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from fglopt.lattice.stl_export import (
+    StreamingSTLWriter,
+    read_binary_stl,
+    weld_vertices,
+    write_binary_stl,
+)
+
+
+def _random_triangles(n, seed=0):
+    return np.random.default_rng(seed).random((n, 3, 3)).astype(np.float32)
+
+
+def test_streaming_writer_patches_count_across_buffer_flushes(tmp_path):
+    chunks = [_random_triangles(n, seed) for seed, n in enumerate((5, 17, 0, 9))]
+    path = tmp_path / "part.stl"
+
+    with StreamingSTLWriter(path, buffer_triangles=8) as writer:
+        for chunk in chunks:
+            writer.write(chunk)
+
+    expected = np.concatenate(chunks)
+    assert writer.stats.n_triangles == 31
+    assert path.stat().st_size == 84 + 50 * 31
+    assert np.array_equal(read_binary_stl(path), expected)
+
+
+def test_failed_export_removes_partial_file(tmp_path):
+    path = tmp_path / "part.stl"
+
+    with pytest.raises(RuntimeError, match="generation failed"):
+        with StreamingSTLWriter(path, buffer_triangles=8) as writer:
+            writer.write(_random_triangles(20))
+            raise RuntimeError("generation failed")
+
+    assert not path.exists()
+    assert writer.stats is None
+
+
+def test_normals_are_unit_and_right_handed(tmp_path):
+    tri = np.array([[[0, 0, 0], [1, 0, 0], [0, 1, 0]]], dtype=np.float32)
+    path = write_binary_stl(tmp_path / "one.stl", tri)
+
+    raw = np.fromfile(path, dtype=np.float32, offset=84, count=3)
+    assert np.allclose(raw, [0.0, 0.0, 1.0])
+
+
+def test_weld_snaps_vertices_and_drops_degenerate_faces():
+    tri = np.array(
+        [
+            [[0, 0, 0], [1, 0, 0], [0, 1, 0]],
+            [[1e-7, 0, 0], [1, 1e-7, 0], [0, 0, 1]],
+            [[0, 0, 0], [1e-7, 0, 0], [0, 0, 1]],  # collapses after welding
+        ],
+        dtype=np.float32,
+    )
+
+    welded = weld_vertices(tri, tolerance=1e-5)
+
+    assert welded.shape == (2, 3, 3)
+    assert np.array_equal(welded[1, 0], welded[0, 0])
+    assert np.array_equal(welded[1, 1], welded[0, 1])
@@ -0,0 +1,106 @@
+import numpy as np
+import pytest
+
+from fglopt.fea.assembler import StiffnessAssembler
+from fglopt.fea.element import Q4Element
+from fglopt.fea.solver import FEASolver, compute_compliance
+from fglopt.fea.symmetry import SymmetryReduction, detect_symmetry, symmetry_from_config
+from fglopt.mesh.domain_mesh import DomainMesh
+from fglopt.optimization.simp import TopologyOptimizer
+
+
+class _Config(dict):
+    pass
+
+
+def _bridge(nx=12, ny=6):
+    """Beam pinned at both bottom corners with a centre load on the top edge."""
+    mesh = DomainMesh(nx=nx, ny=ny, lx=2.0, ly=1.0)
+    fixed = np.array([0, 1, 2 * nx, 2 * nx + 1])
+    force = np.zeros(mesh.n_dofs)
+    force[2 * (ny * (nx + 1) + nx // 2) + 1] = -1.0
+    return mesh, force, fixed
+
+
+def _plate(n=8):
+    """Square plate pinned at the corners and pulled out at the edge midpoints."""
+    mesh = DomainMesh(nx=n, ny=n)
+    corners = np.array([0, n, n * (n + 1), n * (n + 1) + n])
+    fixed = np.concatenate((2 * corners, 2 * corners + 1))
+    force = np.zeros(mesh.n_dofs)
+    mid = n // 2
+    force[2 * (mid * (n + 1))] = -1.0
+    force[2 * (mid * (n + 1) + n)] = 1.0
+    force[2 * mid + 1] = -1.0
+    force[2 * (n * (n + 1) + mid) + 1] = 1.0
+    return mesh, force, fixed
+
+
+def _solve(mesh, force, fixed):
+    ke = Q4Element(E=1.0, nu=0.3).stiffness_matrix(*mesh.element_size)
+    K = StiffnessAssembler(mesh, ke).assemble()
+    return FEASolver("direct").solve(K, force, fixed)
+
+
+@pytest.mark.parametrize("case, axes", [(_bridge, (0,)), (_plate, (0, 1))])
+def test_reduced_solve_matches_full_solve(case, axes):
+    mesh, force, fixed = case()
+    assert detect_symmetry(mesh, force, fixed) == axes
+
+    symmetry = SymmetryReduction(mesh, axes)
+    reduced = symmetry.reduced_mesh
+    assert reduced.n_elements == mesh.n_elements * symmetry.fraction
+    assert np.allclose(reduced.node_coords, mesh.node_coords[symmetry.kept_nodes])
+
+    u_red = _solve(reduced, symmetry.reduce_force(force), symmetry.reduce_constraints(fixed))
+    u = symmetry.expand_displacement(u_red)
+    u_full = _solve(mesh, force, fixed)
+
+    assert np.allclose(u, u_full, rtol=1e-10, atol=1e-12 * np.abs(u_full).max())
+    assert np.isclose(
+        compute_compliance(force, u),
+        compute_compliance(symmetry.reduce_force(force), u_red) / symmetry.fraction,
+    )
+
+
+def test_declared_symmetry_is_validated():
+    mesh, force, fixed = _bridge()
+    force[2 * (mesh.ny * (mesh.nx + 1)) + 1] = -0.5  # extra load on the top-left corner
+
+    assert detect_symmetry(mesh, force, fixed) == ()
+    assert symmetry_from_config(_Config(symmetry="auto"), mesh, force, fixed) is None
+    with pytest.raises(ValueError, match="does not hold"):
+        symmetry_from_config(_Config(symmetry="x"), mesh, force, fixed)
+    with pytest.raises(ValueError, match="even element count"):
+        SymmetryReduction(DomainMesh(nx=5, ny=4), "x")
+
+
+def test_reduced_optimization_matches_full_density():
+    mesh, force, fixed = _bridge(nx=16, ny=8)
+    symmetry = SymmetryReduction(mesh, "x")
+    element = Q4Element(E=1.0, nu=0.3)
+
+    runs = {}
+    for name, args, axes in (
+        ("full", (mesh, element, force, fixed), ()),
+        (
+            "half",
+            (
+                symmetry.reduced_mesh,
+                element,
+                symmetry.reduce_force(force),
+                symmetry.reduce_constraints(fixed),
+            ),
+            symmetry.axes,
+        ),
+    ):
+        optimizer = TopologyOptimizer(
+            *args, volume_fraction=0.4, max_iterations=8, n_threads=1, mirror_axes=axes
+        )
+        try:
+            runs[name] = (optimizer.run(), optimizer.compliance)
+        finally:
+            optimizer.close()
+
+    assert np.allclose(symmetry.expand_density(runs["half"][0]), runs["full"][0], atol=1e-6)
+    assert np.isclose(runs["half"][1] / symmetry.fraction, runs["full"][1], rtol=1e-6)